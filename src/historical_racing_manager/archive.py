@@ -0,0 +1,230 @@
+import json
+import os
+import pathlib
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+import pandas as pd
+
+# Archived tables and the column holding their season
+ARCHIVE_TABLES = {"results": "season", "standings": "year"}
+ARCHIVE_META = "meta.json"
+
+
+def _remove_tree(path: str, pid: int) -> None:
+    # Forked workers inherit the working copies of their parent; only the process that made one removes it
+    if os.getpid() == pid:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+class _WorkingCopy:
+    """Temporary directory removed by remove(), when it is garbage collected or at exit."""
+
+    def __init__(self, source: pathlib.Path | None = None):
+        self.path = pathlib.Path(tempfile.mkdtemp(prefix="hrm-archive-"))
+        self.pid = os.getpid()
+        self.remove = weakref.finalize(self, _remove_tree, str(self.path), self.pid)
+        if source is not None:
+            shutil.copytree(source, self.path, dirs_exist_ok=True)
+
+
+# Frozen copies of this process by path, while some archive still refers to them
+_FROZEN: "weakref.WeakValueDictionary[str, _WorkingCopy]" = weakref.WeakValueDictionary()
+
+
+class SeasonArchive:
+    """Old seasons of results and standings, kept on disk instead of in the live frames.
+
+    Rows are grouped in one partition per table and decade; a partition is a
+    directory with one .npy file per column, opened memory-mapped, so looking up
+    one season only reads the series/season columns and the matching rows.
+    Seasons are archived in order: everything before ``before[table]`` is here.
+
+    snapshot() gives read-only views that share one frozen copy of the
+    partitions until the next write; a view that is written to first moves to
+    a working copy of its own. The frozen copy is removed with its last view.
+    """
+
+    def __init__(self, directory: pathlib.Path | None = None):
+        # Temporary working copy of the partitions (removed on close); None if the caller owns directory
+        self._copy: _WorkingCopy | None = None
+        # True while _copy is a frozen copy shared with other views
+        self._shared = False
+        # Frozen copy handed out by snapshot(), dropped by the next write
+        self._frozen: _WorkingCopy | None = None
+        if directory is None:
+            self._copy = _WorkingCopy()
+            directory = self._copy.path
+        # save_to() copies the partitions into a game folder
+        self.directory = pathlib.Path(directory)
+        self.before: dict[str, int] = {}
+        self.rows: dict[str, int] = {}
+        self._maps: dict[tuple[str, int], dict[str, np.ndarray]] = {}
+        meta = self.directory / ARCHIVE_META
+        if meta.exists():
+            data = json.loads(meta.read_text())
+            self.before, self.rows = data["before"], data["rows"]
+
+    @classmethod
+    def open_copy(cls, folder: pathlib.Path) -> "SeasonArchive":
+        """Open a working copy of a saved archive, so unsaved archiving never touches the save."""
+        copy = _WorkingCopy(folder)
+        archive = cls(copy.path)
+        archive._copy = copy
+        return archive
+
+    @classmethod
+    def _open_shared(cls, path: str) -> "SeasonArchive":
+        """View of the frozen copy at path; a working copy of it in a process that does not own it."""
+        frozen = _FROZEN.get(path)
+        if frozen is None or frozen.pid != os.getpid():
+            return cls.open_copy(pathlib.Path(path))
+        archive = cls(frozen.path)
+        archive._copy, archive._shared = frozen, True
+        return archive
+
+    def snapshot(self) -> "SeasonArchive":
+        """Read-only view of the archive as it is now; unchanged archives share one frozen copy."""
+        if self._shared:
+            assert self._copy is not None
+            frozen = self._copy
+        else:
+            if self._frozen is None:
+                self._frozen = _WorkingCopy(self.directory)
+                _FROZEN[str(self._frozen.path)] = self._frozen
+            frozen = self._frozen
+        return SeasonArchive._open_shared(str(frozen.path))
+
+    def close(self) -> None:
+        """Remove the working copy; a directory the caller passed in is left alone.
+
+        A view only lets go of its frozen copy, which goes once no view is left.
+        """
+        self._maps = {}
+        self._frozen = None
+        if self._copy is not None and not self._shared:
+            self._copy.remove()
+        self._copy, self._shared = None, False
+
+    def __reduce__(self):
+        # Copies unpickled in this process share a frozen copy; other processes open a working copy of it
+        return SeasonArchive._open_shared, (str(self.snapshot().directory),)
+
+    def save_to(self, folder: pathlib.Path) -> None:
+        """Replace the archive stored in folder with this one."""
+        self._maps = {}
+        shutil.rmtree(folder, ignore_errors=True)
+        shutil.copytree(self.directory, folder)
+
+    def has_season(self, table: str, season: int) -> bool:
+        return int(season) < self.before.get(table, -1)
+
+    # --- Partitions ---
+    def _path(self, table: str, decade: int) -> pathlib.Path:
+        return self.directory / table / f"{decade}s"
+
+    def decades(self, table: str) -> list[int]:
+        path = self.directory / table
+        if not path.exists():
+            return []
+        return sorted(int(p.name[:-1]) for p in path.iterdir() if p.is_dir() and p.name.endswith("s"))
+
+    def _columns(self, table: str, decade: int) -> dict[str, np.ndarray]:
+        """Memory-mapped columns of a partition (opened on first use)."""
+        key = (table, decade)
+        if key not in self._maps:
+            path = self._path(table, decade)
+            order = json.loads((path / "columns.json").read_text())
+            self._maps[key] = {col: np.load(path / f"{i}.npy", mmap_mode="r") for i, col in enumerate(order)}
+        return self._maps[key]
+
+    def partition(self, table: str, decade: int) -> pd.DataFrame:
+        return pd.DataFrame({col: np.asarray(values) for col, values in self._columns(table, decade).items()})
+
+    def frames(self, table: str):
+        """Yield the partitions of a table, oldest first."""
+        for decade in self.decades(table):
+            yield self.partition(table, decade)
+
+    def season(self, table: str, series_id: int, season: int) -> pd.DataFrame:
+        """Rows of one archived series-season."""
+        decade = int(season) // 10 * 10
+        if not self._path(table, decade).exists():
+            return pd.DataFrame()
+        cols = self._columns(table, decade)
+        season_col = ARCHIVE_TABLES[table]
+        rows = np.flatnonzero((cols["series_id"] == series_id) & (cols[season_col] == season))
+        return pd.DataFrame({col: np.asarray(values[rows]) for col, values in cols.items()})
+
+    # --- Writes ---
+    def _before_write(self) -> None:
+        """Drop the frozen copy of the old state; a shared view moves to a working copy of its own."""
+        self._frozen = None
+        if self._shared:
+            copy = _WorkingCopy(self.directory)
+            self._maps = {}
+            self._copy, self._shared = copy, False
+            self.directory = copy.path
+
+    def append(self, table: str, frame: pd.DataFrame, before: int) -> None:
+        """Add rows of seasons earlier than before to their decade partitions."""
+        self._before_write()
+        season_col = ARCHIVE_TABLES[table]
+        decades = frame[season_col].astype("int64") // 10 * 10
+        for decade, rows in frame.groupby(decades.to_numpy(), sort=True):
+            decade = int(decade)
+            if self._path(table, decade).exists():
+                rows = pd.concat([self.partition(table, decade), rows], ignore_index=True)
+            self._write(table, decade, rows)
+        self.before[table] = max(before, self.before.get(table, before))
+        self.rows[table] = self.rows.get(table, 0) + len(frame)
+        self._write_meta()
+
+    def drop_before(self, table: str, before_year: int) -> pd.DataFrame:
+        """Remove the rows of seasons before before_year; returns their series_id and season columns."""
+        self._before_write()
+        season_col = ARCHIVE_TABLES[table]
+        dropped = []
+        for decade in self.decades(table):
+            if decade >= before_year:
+                break
+            cols = self._columns(table, decade)
+            old = np.asarray(cols[season_col] < before_year)
+            if not old.any():
+                continue
+            dropped.append(pd.DataFrame({"series_id": np.asarray(cols["series_id"][old]),
+                                         season_col: np.asarray(cols[season_col][old])}))
+            if old.all():
+                self._maps.pop((table, decade), None)
+                shutil.rmtree(self._path(table, decade))
+            else:
+                self._write(table, decade, self.partition(table, decade)[~old].reset_index(drop=True))
+        if not dropped:
+            return pd.DataFrame(columns=["series_id", season_col])
+        dropped_rows = pd.concat(dropped, ignore_index=True)
+        self.rows[table] -= len(dropped_rows)
+        self._write_meta()
+        return dropped_rows
+
+    def _write_meta(self) -> None:
+        (self.directory / ARCHIVE_META).write_text(json.dumps({"before": self.before, "rows": self.rows}))
+
+    def _write(self, table: str, decade: int, rows: pd.DataFrame) -> None:
+        self._maps.pop((table, decade), None)
+        path = self._path(table, decade)
+        tmp = path.with_name(path.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        for i, col in enumerate(rows.columns):
+            values = rows[col]
+            if values.dtype == object:
+                # Fixed-width text, so the column can be memory-mapped
+                values = values.fillna("").to_numpy(dtype=str)
+            else:
+                values = values.to_numpy()
+            np.save(tmp / f"{i}.npy", values)
+        (tmp / "columns.json").write_text(json.dumps([str(c) for c in rows.columns]))
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp, path)
@@ -0,0 +1,113 @@
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+class PartCatalog:
+    """Integer-keyed index over the car_parts table.
+
+    Maps (series_id, year, part_type) to the row positions of matching parts and
+    part_id to a single row position, so part lookups never scan car_parts.
+    The catalog only supports append-only growth of the indexed frame.
+    """
+
+    def __init__(self, car_parts: pd.DataFrame | None = None):
+        self._frame = pd.DataFrame()
+        self._by_key: dict[tuple[int, int, str], list[int]] = {}
+        self._by_series_year: dict[tuple[int, int], list[int]] = {}
+        self._by_id: dict[int, int] = {}
+        self._manufacturer: list[int] = []
+        if car_parts is not None:
+            self.rebuild(car_parts)
+
+    # --- Building ---
+    def rebuild(self, car_parts: pd.DataFrame) -> None:
+        """Drop the current index and index every row of car_parts."""
+        self._frame = car_parts
+        self._by_key = {}
+        self._by_series_year = {}
+        self._by_id = {}
+        self._manufacturer = []
+        self._index_rows(car_parts, 0)
+
+    def extend(self, car_parts: pd.DataFrame) -> None:
+        """Index rows appended to the frame since the last build.
+
+        car_parts must be the previously indexed frame with new rows concatenated
+        at the end (ignore_index=True), which is how ManufacturerModel grows it.
+        """
+        start = len(self._manufacturer)
+        self._frame = car_parts
+        self._index_rows(car_parts, start)
+
+    def is_built_for(self, car_parts: pd.DataFrame) -> bool:
+        """Return True if the catalog indexes exactly this frame in its current length."""
+        return self._frame is car_parts and len(self._manufacturer) == len(car_parts)
+
+    def _index_rows(self, car_parts: pd.DataFrame, start: int) -> None:
+        """Add rows from position start onwards to the lookup dictionaries."""
+        if car_parts.empty or start >= len(car_parts):
+            return
+        required = ("series_id", "year", "part_type", "manufacture_id")
+        if any(col not in car_parts.columns for col in required):
+            return
+
+        tail = car_parts.iloc[start:]
+        series_ids = self._to_int_array(tail["series_id"])
+        years = self._to_int_array(tail["year"])
+        manufacturers = self._to_int_array(tail["manufacture_id"])
+        part_types = tail["part_type"].astype(str).tolist()
+        part_ids = self._to_int_array(tail["part_id"]) if "part_id" in tail.columns else None
+
+        for offset, (sid, year, part_type, mid) in enumerate(zip(series_ids, years, part_types, manufacturers)):
+            pos = start + offset
+            self._by_key.setdefault((int(sid), int(year), part_type), []).append(pos)
+            self._by_series_year.setdefault((int(sid), int(year)), []).append(pos)
+            self._manufacturer.append(int(mid))
+            if part_ids is not None and part_ids[offset] >= 0:
+                self._by_id[int(part_ids[offset])] = pos
+
+    @staticmethod
+    def _to_int_array(column: pd.Series) -> np.ndarray:
+        """Convert an ID column to int64, mapping missing values to -1."""
+        return pd.to_numeric(column, errors="coerce").fillna(-1).astype("int64").to_numpy()
+
+    # --- Lookups ---
+    def positions(self, series_id: int, year: int, part_type: str | None = None) -> list[int]:
+        """Return row positions of parts for the series and year, optionally of one part type."""
+        if part_type is None:
+            return self._by_series_year.get((int(series_id), int(year)), [])
+        return self._by_key.get((int(series_id), int(year), str(part_type)), [])
+
+    def find(self, series_id: int, year: int, part_type: str, manufacture_id: int) -> list[int]:
+        """Return row positions of the given manufacturer's parts of one type for a series and year."""
+        mid = int(manufacture_id)
+        return [pos for pos in self.positions(series_id, year, part_type) if self._manufacturer[pos] == mid]
+
+    def parts(self, series_id: int, year: int, part_type: str | None = None) -> pd.DataFrame:
+        """Return a copy of the parts for the series and year (optionally one part type)."""
+        return self.rows(self.positions(series_id, year, part_type))
+
+    def rows(self, positions: Iterable[int]) -> pd.DataFrame:
+        """Return a copy of the indexed frame restricted to the given row positions."""
+        positions = list(positions)
+        if self._frame.empty:
+            return pd.DataFrame(columns=self._frame.columns)
+        return self._frame.iloc[positions].copy()
+
+    def part_position(self, part_id: int) -> int | None:
+        """Return the row position of a part_id, or None if it is not indexed."""
+        return self._by_id.get(int(part_id))
+
+    def part_value(self, part_id: int, column: str, default=None):
+        """Return a single column value for a part_id, or default if the part is unknown."""
+        pos = self.part_position(part_id)
+        if pos is None or column not in self._frame.columns:
+            return default
+        return self._frame[column].iat[pos]
+
+    def manufacturer_of(self, part_id: int) -> int:
+        """Return the manufacture_id of a part, or -1 if it is unknown."""
+        pos = self.part_position(part_id)
+        return self._manufacturer[pos] if pos is not None else -1
@@ -46,7 +46,7 @@ DEFAULT_THEME = "System"
 DEFAULT_COLOR_THEME = "blue"
 
 # Tabs
-TAB_NAMES = ["Game", "Drivers", "Teams", "Manufacturers", "Series", "Seasons", "My Team"]
+TAB_NAMES = ["Game", "Drivers", "Teams", "Manufacturers", "Series", "Seasons", "Projection", "My Team"]
 
 # Fonts
 FONT_HEADER = ("Arial", 18, "bold")
@@ -63,6 +63,18 @@ SIMULATION_STEPS = {
     "Next Week": 7
 }
 SIMULATION_NEXT_RACE = "Next Race"
+SIMULATION_SEASONS = "Simulate Seasons"
+SIMULATION_CANCEL = "Cancel"
+# How often the GUI collects progress from the simulation thread (ms)
+SIMULATION_POLL_MS = 100
+
+# Number of computed views (tables for tabs) the Controller keeps
+VIEW_CACHE_SIZE = 64
+
+# Background prefetch of views the user is likely to open next
+PREFETCH_IDLE_MS = 500  # idle time after the last shown view before prefetching
+PREFETCH_NEIGHBOURS = 2  # seasons/subjects on each side of the selection
+PREFETCH_TOP_SUBJECTS = 5  # first entries of the subject dropdown
 
 # UI Labels for DataFrames
 COLUMN_LABELS = {
@@ -82,7 +94,14 @@ COLUMN_LABELS = {
     "race": "Race Name",
     "department": "Department",
     "employees": "Employees",
-    "team": "Team"
+    "team": "Team",
+    "typ": "Type",
+    "title": "Title Chance",
+    "podium": "Podium Chance",
+    "mean_points": "Avg Points",
+    "p10_points": "Points (10%)",
+    "p90_points": "Points (90%)",
+    "mean_position": "Avg Position",
 }
 
 # --- Required files for ManufacturerModel ---
@@ -113,7 +132,7 @@ CONTRACTS_REQUIRED_FILES = [
     FILE_MT_CONTRACT,
 ]
 
-# --- Merge keys used when generating new parts ---
+# --- Keys matching a newly developed part to last year's part ---
 MERGE_KEYS = ["rules_id", "manufacture_id", "part_type", "series_id"]
 
 # --- Default cost of generated parts ---
@@ -136,6 +155,10 @@ FILE_POINT_SYSTEM = "point_system.csv"
 FILE_RESULTS = "results.csv"
 FILE_CIRCUITS = "circuits.csv"
 FILE_CIRCUIT_LAYOUTS = "circuit_layouts.csv"
+# Optional: rebuilt from stands.csv when missing
+FILE_FINAL_STANDINGS = "final_standings.csv"
+# Optional: per-subject season summaries of results removed by the retention policy
+FILE_RESULT_SUMMARIES = "result_summaries.csv"
 
 RACE_REQUIRED_FILES = [
     FILE_STANDS,
@@ -154,6 +177,82 @@ CONTROLLER_REQUIRED_FILES = [
     FILE_CONTROLLER_GENERATED_RACES,
 ]
 
+# --- Random streams (see rng.RandomStreams) ---
+# Optional in a save: games saved without it continue with fresh streams
+FILE_RNG_STATE = "rng_state.json"
+# Model attribute -> stream it draws from
+RNG_STREAMS = {
+    "race_model": "race",
+    "drivers_model": "drivers",
+    "manufacturer_model": "parts",
+    "contracts_model": "contracts",
+}
+
+# --- Replay-log saves (see replay.ReplayLog) ---
+# "full" writes every table; "replay" writes only the save the game was loaded from, its
+# random streams and the player actions since, and rebuilds the game from them on load
+SAVE_MODE = "full"
+FILE_REPLAY_LOG = "replay_log.json"
+# Folder of a replay save holding a copy of its base save (packaged data is referenced by name)
+REPLAY_BASE_DIR = "base"
+
+# --- Optional SQLite history (see storage.HistoryStore) ---
+FILE_HISTORY_DB = "history.sqlite"
+# "csv" rewrites every table on save; "sqlite" keeps results, standings and season finals in
+# FILE_HISTORY_DB (races, contracts and finances stay in CSV files, and every frame stays in memory).
+# Games saved with a history file keep using it after loading.
+STORAGE_BACKEND = "csv"
+
+# --- Season archive (see archive.SeasonArchive) ---
+ARCHIVE_DIR = "archive"
+# Results and standings of seasons older than this many seasons leave the live frames (0 = never)
+ARCHIVE_HORIZON_SEASONS = 10
+
+# --- Championship projection (see projection.project_championship) ---
+PROJECTION_SIMS = 10_000
+
+# --- Experiments (see experiments.run_experiment) ---
+EXPERIMENT_RUNS = 8
+EXPERIMENT_SEASONS = 5
+
+# --- Shared memory snapshots (see sharedmem.SharedSnapshot) ---
+# Controller attributes a snapshot of the game (experiment runs, checkpoints) captures
+SNAPSHOT_STATE = ["drivers_model", "teams_model", "series_model", "manufacturer_model", "contracts_model",
+                  "race_model", "random_streams", "replay_log", "begin_year", "end_year", "begin_date", "current_date",
+                  "new_game", "generated_races"]
+# Arrays smaller than this are pickled with the rest of the state instead of shared
+SNAPSHOT_MIN_ARRAY_BYTES = 1024
+SNAPSHOT_ALIGNMENT = 64
+
+# --- Race feed (see feed.RaceFeed) ---
+# Races a feed holds before the simulation waits for its consumer (or drops the oldest)
+FEED_QUEUE_SIZE = 256
+# Subjects per standings type reported after every championship race
+FEED_STANDINGS_TOP = 3
+
+# --- Local JSON API (see server.GameServer) ---
+API_HOST = "127.0.0.1"
+API_PORT = 8765
+# Threads answering requests; simulation commands run one at a time on a thread of their own
+API_WORKERS = 8
+# Controller attributes besides SNAPSHOT_STATE the views of a read snapshot depend on
+API_SESSION_STATE = ["active_team", "active_team_id", "teams"]
+# Finished races /api/races keeps for clients to catch up on
+API_RACE_HISTORY = 1000
+
+# --- History retention (see retention.apply_retention) ---
+# Seasons of history kept per table, applied at every season start (None = keep everything),
+# to archived seasons as well. Old results collapse to per-subject season summaries; final
+# standings are always kept.
+RETENTION_SEASONS = {
+    "results": None,
+    "standings": None,
+    "races": None,
+    "team_finances": None,
+    "contracts": None,
+    "car_parts": None,
+}
+
 # --- Simulation scheduling constants ---
 DAYS_PER_SEASON = 364
 RACE_WEEKDAY = "Sun"
@@ -177,6 +276,15 @@ SPEED_MULTIPLIER = 1000
 CRASH_CODE = 999
 DEATH_CODE = 998
 
+# --- Results and standings layout ---
+RESULT_COLUMNS = [
+    "race_id", "driver_id", "team_id", "car_id", "position", "season",
+    "series_id", "round", "engine_id", "chassi_id", "pneu_id",
+]
+STANDINGS_TYPES = ("driver", "team", "engine", "chassi", "pneu")
+FINAL_STANDINGS_COLUMNS = ["series_id", "year", "typ", "subject_id", "points", "position", "round", "race_id"]
+RESULT_SUMMARY_COLUMNS = ["series_id", "season", "typ", "subject_id", "races", "wins", "podiums", "best_result"]
+
 # --- Series model files ----
 SERIES_FILE = "series.csv"
 POINT_RULES_FILE = "point_rules.csv"
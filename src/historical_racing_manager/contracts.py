@@ -1,15 +1,17 @@
 import pathlib
-import random
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
+from historical_racing_manager.catalog import PartCatalog
 from historical_racing_manager.consts import (
     FILE_DT_CONTRACT, FILE_ST_CONTRACT, FILE_CS_CONTRACT,
     FILE_MS_CONTRACT, FILE_MT_CONTRACT, CONTRACT_MIN_LENGTH, CONTRACT_MAX_LENGTH, AI_CONTRACT_LENGTHS,
     AI_CONTRACT_WEIGHTS, DEFAULT_SALARY_BASE, SALARY_REPUTATION_MULTIPLIER,
     MIN_SALARY_BASE, CONTRACT_DECISION_DAYS, PART_TYPES
 )
+from historical_racing_manager.versioning import mutates
 
 
 class ContractsModel:
@@ -22,19 +24,25 @@ class ContractsModel:
 
     def __init__(self) -> None:
 
+        self.version = 0
         self.dt_contract: pd.DataFrame = pd.DataFrame()
         self.st_contract: pd.DataFrame = pd.DataFrame()
         self.cs_contract: pd.DataFrame = pd.DataFrame()
         self.ms_contract: pd.DataFrame = pd.DataFrame()
         self.mt_contract: pd.DataFrame = pd.DataFrame()
+        # Incremented whenever mt_contract changes, so cached cars can be invalidated
+        self.part_contracts_version: int = 0
         self.reserved_slots: dict[int, int] = {}  # team_id → available seats
         self.driver_slots_current: pd.DataFrame = pd.DataFrame()
         self.driver_slots_next: pd.DataFrame = pd.DataFrame()
         self.rules: pd.DataFrame = pd.DataFrame()
         # Mapping: series_id -> reputation (filled during sign_driver_contracts)
         self.series_reputation: dict[int, float] = {}
+        # Random stream; the controller binds the game's (see rng.RandomStreams)
+        self.rng = np.random.default_rng()
 
     # === Persistence ===
+    @mutates
     def load(self, folder: pathlib.Path) -> bool:
         """Loads all contract-related CSV files from the given folder.
 
@@ -50,6 +58,7 @@ class ContractsModel:
             self.cs_contract = pd.read_csv(folder / FILE_CS_CONTRACT)
             self.ms_contract = pd.read_csv(folder / FILE_MS_CONTRACT)
             self.mt_contract = pd.read_csv(folder / FILE_MT_CONTRACT)
+            self.part_contracts_version += 1
             # TODO: why not in some enum/constants?
             self._ensure_columns(
                 self.dt_contract,
@@ -76,6 +85,21 @@ class ContractsModel:
         self.ms_contract.to_csv(folder / FILE_MS_CONTRACT, index=False)
         self.mt_contract.to_csv(folder / FILE_MT_CONTRACT, index=False)
 
+    @mutates
+    def prune_contracts(self, before_year: int) -> int:
+        """Drop contracts of every kind that ended before before_year; returns the number of rows dropped."""
+        dropped = 0
+        for attr in ("dt_contract", "st_contract", "cs_contract", "ms_contract", "mt_contract"):
+            df = getattr(self, attr)
+            if df.empty or "end_year" not in df.columns:
+                continue
+            old = pd.to_numeric(df["end_year"], errors="coerce") < before_year
+            if old.any():
+                # Driver contracts are added at label len(dt_contract), so keep a fresh index
+                setattr(self, attr, df[~old].reset_index(drop=True))
+                dropped += int(old.sum())
+        return dropped
+
     def _ensure_columns(self, df: pd.DataFrame, required: dict[str, object]) -> None:
         """Ensures the DataFrame ``df`` contains required columns.
 
@@ -86,6 +110,7 @@ class ContractsModel:
                 df[col] = default
 
     # === Driver Slots ===
+    @mutates
     def init_driver_slots_for_year(self, year: int, rules: pd.DataFrame) -> pd.DataFrame:
         """Creates a slot table for all teams in ``st_contract`` for the specified year.
 
@@ -119,6 +144,7 @@ class ContractsModel:
 
         return pd.DataFrame(records)
 
+    @mutates
     def rollover_driver_slots(self) -> None:
         """Moves ``driver_slots_next`` to ``driver_slots_current`` and generates a new ``driver_slots_next``.
 
@@ -169,7 +195,7 @@ class ContractsModel:
 
             for yr in years:
                 # Filter standings for that year
-                year_standings = race_model.standings[race_model.standings["year"] == yr]
+                year_standings = race_model.get_standings(yr)
 
                 # Reduce to last known round (or last entry)
                 last_round = year_standings.sort_values("round").groupby("subject_id").last().reset_index()
@@ -260,11 +286,9 @@ class ContractsModel:
         merged = contracts.copy()
 
         # Add data from standings (results by part_type and series_id)
-        if race_model is not None and hasattr(race_model, "standings"):
+        if race_model is not None:
             for yr in years:
-                year_standings = race_model.standings[
-                    race_model.standings["year"] == yr
-                    ].copy()
+                year_standings = race_model.get_standings(yr)
 
                 year_data = []
 
@@ -322,6 +346,7 @@ class ContractsModel:
         final = merged[final_cols].copy()
         return final
 
+    @mutates
     def update_driver_slot(self, team_id: int, year: int) -> None:
         """
         Increase signed_slots and update free_slots for the corresponding year.
@@ -361,11 +386,13 @@ class ContractsModel:
                     self.driver_slots_next = pd.concat([self.driver_slots_next, pd.DataFrame([rec])], ignore_index=True)
 
     # === Driver Contracts ===
+    @mutates
     def disable_driver_contracts(self, driver_ids: list[int]) -> None:
         """Disable contracts for the given driver IDs."""
         self._ensure_columns(self.dt_contract, {"active": True})
         self.dt_contract.loc[self.dt_contract["driver_id"].isin(driver_ids), "active"] = False
 
+    @mutates
     def disable_driver_contract(self, driver_id: int, current: bool, current_year: int) -> None:
         """
         Disable a driver's contract depending on whether it is current or future.
@@ -405,7 +432,7 @@ class ContractsModel:
         day_of_year = date.timetuple().tm_yday
         total_days = 366 if self._is_leap(date.year) else 365
         probability = day_of_year / total_days
-        return random.random() < probability
+        return self.rng.random() < probability
 
     def _generate_index(self, n: int):
         """
@@ -414,10 +441,10 @@ class ContractsModel:
         """
         if n < 10:
             weights = [2 ** (n - i - 1) for i in range(n)]
-            return random.choices(range(n), weights=weights, k=1)[0]
+            return int(self.rng.choice(n, p=np.array(weights) / sum(weights)))
         while True:
             for i in range(n):
-                if random.random() < 0.5:
+                if self.rng.random() < 0.5:
                     return i
 
     def _drop_until_free_slot(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -591,6 +618,7 @@ class ContractsModel:
         all_team_ids = teams_df["team_id"].unique()
         return [int(tid) for tid in all_team_ids if int(tid) not in contracted_team_ids]
 
+    @mutates
     def sign_driver_contracts(
             self,
             active_series: pd.DataFrame,
@@ -797,7 +825,7 @@ class ContractsModel:
             weights = [w / total for w in weights]
 
             # Choose contract length based on distribution
-            length = random.choices(lengths, weights, k=1)[0]
+            length = lengths[self.rng.choice(len(lengths), p=weights)]
 
         series_reputation = self._get_reputation_by_series_id(series, series_id)
         self._create_driver_contract(driver_id, team_id, series_reputation or 999, salary, year + future_years,
@@ -841,8 +869,9 @@ class ContractsModel:
             return contracts
 
         parts_of_type["manufacture_id"] = parts_of_type["manufacture_id"].astype(int)
-        manufacturers["manufacture_id"] = manufacturers["manufacture_id"].astype(int)
-        parts_of_type = parts_of_type.merge(manufacturers, on="manufacture_id", how="left")
+        parts_of_type = parts_of_type.merge(
+            manufacturers.astype({"manufacture_id": int}), on="manufacture_id", how="left"
+        )
         parts_of_type["cost"] = parts_of_type["cost"].astype(int)
 
         for team_id in teams_in_series:
@@ -852,10 +881,10 @@ class ContractsModel:
             if not current_contract.empty:
                 continue
 
-            sampled = parts_of_type.sample(1).iloc[0]
+            sampled = parts_of_type.sample(1, random_state=self.rng).iloc[0]
             manufacture_id = int(sampled["manufacture_id"])
             cost = int(sampled["cost"])
-            contract_len = random.randint(CONTRACT_MIN_LENGTH, CONTRACT_MAX_LENGTH)
+            contract_len = int(self.rng.integers(CONTRACT_MIN_LENGTH, CONTRACT_MAX_LENGTH + 1))
 
             contracts.append(
                 {
@@ -872,9 +901,11 @@ class ContractsModel:
 
         return contracts
 
-    def get_available_series_parts(self, team_id: int, year: int, car_parts: pd.DataFrame) -> pd.DataFrame:
+    def get_available_series_parts(self, team_id: int, year: int, car_parts: pd.DataFrame,
+                                   catalog: PartCatalog | None = None) -> pd.DataFrame:
         """
         Return car parts available for a team in its series for the given year.
+        Lookups go through ``catalog``; without one, a catalog is built over ``car_parts``.
         """
         if not hasattr(self, "st_contract"):
             print("[ContractsModel] st_contract is not initialized.")
@@ -886,18 +917,16 @@ class ContractsModel:
             return pd.DataFrame()
 
         series_id = int(match.iloc[0]["series_id"])
-        # Filter by series and year
-        available_parts = car_parts[
-            (car_parts["series_id"] == series_id) &
-            (car_parts["year"] == year)
-            ].copy()
-
-        return available_parts
+        if catalog is None:
+            catalog = PartCatalog(car_parts)
+        return catalog.parts(series_id, year)
 
+    @mutates
     def sign_car_part_contracts(self, active_series: pd.DataFrame, current_date: datetime, car_parts: pd.DataFrame,
-                                teams_model, manufacturers: pd.DataFrame) -> None:
+                                teams_model, manufacturers: pd.DataFrame, catalog: PartCatalog | None = None) -> None:
         """
         Sign car part contracts for AI teams and process pending offers for human teams.
+        Part lookups go through ``catalog``; without one, a catalog is built over ``car_parts``.
         """
         self._ensure_columns(
             self.mt_contract,
@@ -912,9 +941,8 @@ class ContractsModel:
             },
         )
 
-        car_parts["series_id"] = car_parts["series_id"].astype(int)
-        car_parts["year"] = car_parts["year"].astype(int)
-        manufacturers["manufacture_id"] = manufacturers["manufacture_id"].astype(int)
+        if catalog is None:
+            catalog = PartCatalog(car_parts)
 
         teams = teams_model.teams.sort_values(by="reputation")
         human_teams = teams[
@@ -926,9 +954,7 @@ class ContractsModel:
 
         new_contracts: list[dict[str, object]] = []
         for si in active_series["series_id"]:
-            series_parts = car_parts[
-                (car_parts["series_id"] == si) & (car_parts["year"] == current_date.year)
-                ]
+            series_parts = catalog.parts(si, current_date.year)
             all_teams_in_series = self.st_contract[self.st_contract["series_id"] == si]["team_id"].astype(int)
 
             # Remove human teams
@@ -948,40 +974,42 @@ class ContractsModel:
                 new_contracts.extend(contracts)
 
         if new_contracts:
-            self.mt_contract = pd.concat([self.mt_contract, pd.DataFrame(new_contracts)], ignore_index=True)
+            self._append_part_contracts(pd.DataFrame(new_contracts))
 
         # === Process human offers ===
         if hasattr(self, "pending_part_offers"):
             for offer in self.pending_part_offers:
-                self.mt_contract = pd.concat([
-                    self.mt_contract,
-                    pd.DataFrame([{
+                self._append_part_contracts(pd.DataFrame([{
                         "series_id": self._get_series_for_team(offer["team_id"]),
                         "team_id": offer["team_id"],
-                        "manufacture_id": self._get_manufacturer_for_part(offer["part_id"], car_parts),
-                        "part_type": self._get_part_type(offer["part_id"], car_parts),
+                        "manufacture_id": self._get_manufacturer_for_part(offer["part_id"], catalog),
+                        "part_type": self._get_part_type(offer["part_id"], catalog),
                         "start_year": offer["year"],
                         "end_year": offer["year"] + offer["length"],
                         "cost": offer["price"],
-                    }])
-                ], ignore_index=True)
+                    }]))
 
                 teams_model.teams.loc[teams_model.teams["team_id"] == offer["team_id"], "money"] -= offer["price"]
 
             self.pending_part_offers.clear()
 
+    def _append_part_contracts(self, contracts: pd.DataFrame) -> None:
+        """Append rows to mt_contract and mark part contracts as changed."""
+        self.mt_contract = pd.concat([self.mt_contract, contracts], ignore_index=True)
+        self.part_contracts_version += 1
+
     def _get_series_for_team(self, team_id: int) -> int:
         match = self.st_contract[self.st_contract["team_id"] == team_id]
         return int(match["series_id"].iloc[0]) if not match.empty else -1
 
-    def _get_manufacturer_for_part(self, part_id: int, car_parts: pd.DataFrame) -> int:
-        match = car_parts[car_parts["part_id"] == part_id]
-        return int(match["manufacture_id"].iloc[0]) if not match.empty else -1
+    def _get_manufacturer_for_part(self, part_id: int, catalog: PartCatalog) -> int:
+        return catalog.manufacturer_of(part_id)
 
-    def _get_part_type(self, part_id: int, car_parts: pd.DataFrame) -> str:
-        match = car_parts[car_parts["part_id"] == part_id]
-        return str(match["part_type"].iloc[0]) if not match.empty else ""
+    def _get_part_type(self, part_id: int, catalog: PartCatalog) -> str:
+        part_type = catalog.part_value(part_id, "part_type")
+        return str(part_type) if part_type is not None else ""
 
+    @mutates
     def offer_car_part_contract(self, manufacturer_id: int, team_id: int, length: int, price: int, year: int,
                                 part_type: str) -> bool:
         """
@@ -1028,7 +1056,7 @@ class ContractsModel:
             "cost": price,
         }
 
-        self.mt_contract = pd.concat([self.mt_contract, pd.DataFrame([new_contract])], ignore_index=True)
+        self._append_part_contracts(pd.DataFrame([new_contract]))
         return True
 
     def get_available_drivers_for_offer(
@@ -1043,6 +1071,7 @@ class ContractsModel:
         series_id = int(team_row.iloc[0]["series_id"])
         return self._get_available_drivers(active_drivers, series, year, series_id, team_id, rules)
 
+    @mutates
     def offer_driver_contract(
             self, driver_id: int, team_id: int, salary: int, length: int, year: int
     ) -> None:
@@ -1066,6 +1095,7 @@ class ContractsModel:
         }
         self.pending_offers.append(offer)
 
+    @mutates
     def process_driver_offers(self, current_date: datetime, active_drivers: pd.DataFrame) -> list[dict]:
         """
         Processes pending offers – drivers decide whether to accept the contract.
@@ -1129,11 +1159,13 @@ class ContractsModel:
         self.pending_offers = remaining_offers
         return signed_contracts
 
+    @mutates
     def reset_reserved_slot(self) -> None:
         """Resets the reserved slot counts to 0 while preserving existing team_ids."""
         for team_id in self.reserved_slots:
             self.reserved_slots[team_id] = 0
 
+    @mutates
     def cancel_driver_offer(self, driver_id: int, team_id: int) -> None:
         """Cancels a pending contract offer for a driver from a specific team, if it exists."""
         if not hasattr(self, "pending_offers"):
@@ -1166,6 +1198,7 @@ class ContractsModel:
 
         return contracts
 
+    @mutates
     def terminate_driver_contract(self, driver_id: int, team_id: int, current_year: int) -> int:
         """
         Terminates a driver's contract and returns the termination cost.
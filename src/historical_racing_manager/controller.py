@@ -1,5 +1,10 @@
+import os
 import pathlib
+import threading
 import time
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -9,27 +14,124 @@ from dateutil.relativedelta import relativedelta
 from historical_racing_manager.consts import (
     FILE_CONTROLLER_DATA, FILE_CONTROLLER_GENERATED_RACES, CONTROLLER_REQUIRED_FILES,
     DEFAULT_BEGIN_YEAR, DEFAULT_END_YEAR, DEFAULT_DRIVERS_PER_YEAR, DEFAULT_SIM_YEARS_STEP,
-    SEASON_START_DAY, SEASON_START_MONTH, FIRST_REAL_SEASON_YEAR, FIRST_RACE_PLANNING_YEAR
+    SEASON_START_DAY, SEASON_START_MONTH, FIRST_REAL_SEASON_YEAR, FIRST_RACE_PLANNING_YEAR,
+    VIEW_CACHE_SIZE, FILE_HISTORY_DB, STORAGE_BACKEND, ARCHIVE_HORIZON_SEASONS, RETENTION_SEASONS,
+    PROJECTION_SIMS, SNAPSHOT_STATE, SAVE_MODE, FILE_REPLAY_LOG, FEED_QUEUE_SIZE, API_SESSION_STATE,
 )
 # TODO: you could do: import historical_racing_manager.consts as consts and then use consts.DEFAULT_BEGIN_YEAR etc.
+from historical_racing_manager.archive import SeasonArchive
 from historical_racing_manager.contracts import ContractsModel
 from historical_racing_manager.drivers import DriversModel
+from historical_racing_manager.feed import RaceFeed, RaceFinished, race_finished
 from historical_racing_manager.graphics import Graphics
 from historical_racing_manager.load import LoadManager
 from historical_racing_manager.manufacturer import ManufacturerModel
+from historical_racing_manager.participants import SortedNames
 from historical_racing_manager.race import RaceModel
+from historical_racing_manager.replay import ReplayLog, recorded
+from historical_racing_manager.retention import apply_retention, describe_report
+from historical_racing_manager.rng import RandomStreams
 from historical_racing_manager.series import SeriesModel
+from historical_racing_manager.sharedmem import SharedSnapshot, attach
+from historical_racing_manager.storage import HistoryStore
 from historical_racing_manager.teams import TeamsModel
+from historical_racing_manager.versioning import ViewCache
 
 PACKAGE_DIR = pathlib.Path(__file__).parent
 # TODO: Alternatively could use: USER_DIR = pathlib.Path.home() / ".hrm" instead of working dir
 USER_DIR = pathlib.Path.cwd()
 
 
+def _free_checkpoints(checkpoints: dict[str, tuple[SharedSnapshot, SeasonArchive | None, datetime]],
+                      owner_pid: int | None = None) -> None:
+    """Free the shared memory blocks and archive copies of checkpoints and forget them."""
+    # Forked workers inherit their parent's checkpoints; only the process that made them frees them
+    if owner_pid is not None and os.getpid() != owner_pid:
+        return
+    for snapshot, frozen, _ in checkpoints.values():
+        snapshot.close()
+        if frozen is not None:
+            frozen.close()
+    checkpoints.clear()
+
+
+class ReadSnapshot:
+    """The game as it was at one moment, exported once and read by any number of threads.
+
+    Views fill caches inside the models, so reader threads never share a
+    Controller: each imports its own copy-on-write copy of the exported block on
+    its first read (arrays stay in the block) and keeps its own view cache, so
+    memory for cached views grows with the number of reader threads. Once
+    retired, the snapshot is closed, copies and block included, when its last
+    reader leaves.
+    """
+
+    def __init__(self, controller: "Controller", key: tuple):
+        self.key = key
+        self.closed = False
+        self._session = {attr: getattr(controller, attr) for attr in API_SESSION_STATE if hasattr(controller, attr)}
+        self._shared = controller.export_state()
+        self._copies: list[Controller] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._readers = 0
+        self._retired = False
+        # The first copy keeps the archive's frozen copy alive for the copies attached later
+        self.primary = self._attach()
+        self._local.copy = self.primary
+
+    def _attach(self) -> "Controller":
+        copy = Controller(headless=True).import_state(self._shared.manifest)
+        for attr, value in self._session.items():
+            setattr(copy, attr, value)
+        self._copies.append(copy)
+        return copy
+
+    def enter(self) -> bool:
+        """Register a reader; False if the snapshot is already closed."""
+        with self._lock:
+            if self.closed:
+                return False
+            self._readers += 1
+            return True
+
+    def controller(self) -> "Controller":
+        """The calling thread's copy of the game; call it between enter() and leave()."""
+        copy = getattr(self._local, "copy", None)
+        if copy is None:
+            with self._lock:
+                copy = self._attach()
+            self._local.copy = copy
+        return copy
+
+    def leave(self) -> None:
+        with self._lock:
+            self._readers -= 1
+            if not self._retired or self._readers:
+                return
+            self.closed = True
+        self._free()
+
+    def retire(self) -> None:
+        """Close the snapshot once the readers still using it have left (now, if there are none)."""
+        with self._lock:
+            self._retired = True
+            if self._readers or self.closed:
+                return
+            self.closed = True
+        self._free()
+
+    def _free(self) -> None:
+        for copy in self._copies:
+            copy.close()
+        self._copies = []
+        self._shared.close()
+
+
 class Controller:
     teams = 0
 
-    def __init__(self):
+    def __init__(self, headless: bool = False):
         self.begin_year = DEFAULT_BEGIN_YEAR
         self.end_year = DEFAULT_END_YEAR
         self.drivers_per_year = DEFAULT_DRIVERS_PER_YEAR
@@ -42,9 +144,31 @@ class Controller:
         self.generated_races = pd.DataFrame()
         self._initialize_models()
         self.teams = 0
-        self.view = Graphics(self)
+        # Snapshot readers on other threads compute their views on (see publish_snapshot)
+        self.published: ReadSnapshot | None = None
+        # Headless controllers (experiment runs) simulate without a window
+        self.view = None if headless else Graphics(self)
 
     def _initialize_models(self):
+        self._create_models()
+        # Dropdown lists of raced subjects, grown from RaceModel.participants
+        self.raced_names: dict[str, Any] = {}
+        # Computed tab views, reused while the versions of the models they read are unchanged
+        self.view_cache = ViewCache(VIEW_CACHE_SIZE)
+        # Held while a day is simulated, so readers see the world between two days
+        self.sim_lock = threading.RLock()
+        # SQLite history of the loaded/saved game, if it uses one
+        self.store: HistoryStore | None = None
+        # Named in-memory checkpoints: name -> (snapshot, frozen copy of the season archive, game date)
+        self.checkpoints: dict[str, tuple[SharedSnapshot, SeasonArchive | None, datetime]] = {}
+        # Checkpoints never dropped are freed with the controller or at exit, not left to the resource tracker
+        weakref.finalize(self, _free_checkpoints, self.checkpoints, os.getpid())
+        # Base, random streams and player actions of the loaded game, for replay saves
+        self.replay_log: ReplayLog | None = None
+        # Called with a RaceFinished event after every simulated race (see watch_races)
+        self.race_listeners: list[Callable[[RaceFinished], None]] = []
+
+    def _create_models(self):
         self.load_model = LoadManager()
         self.drivers_model = DriversModel()
         self.teams_model = TeamsModel()
@@ -52,9 +176,19 @@ class Controller:
         self.manufacturer_model = ManufacturerModel()
         self.contracts_model = ContractsModel()
         self.race_model = RaceModel()
+        # One seeded random stream per subsystem, saved with the game
+        self.random_streams = RandomStreams()
+        self.random_streams.bind(self)
+
+    def _cached_view(self, name: str, args: tuple, models: tuple, compute, *extra):
+        """Return a memoised view, recomputed when a model it reads (or an extra input) changed."""
+        with self.sim_lock:
+            token = tuple(getattr(model, "version", 0) for model in models) + extra
+            return self.view_cache.get((name,) + args, token, compute)
 
     def run(self):
-        self.view.run()
+        if self.view is not None:
+            self.view.run()
 
     def _set_default_active_team(self):
         """
@@ -212,8 +346,8 @@ class Controller:
             "name": team_name,
             "budget": money,
             "series": series_name,
-            "drivers": self.get_owners_team_driver_data(),
-            "parts": self.get_owners_team_parts_data(),
+            "drivers": drivers,
+            "parts": parts,
             "staff": self.get_team_staff(team_id),
             "races": self.get_upcoming_races(team_id),
             "finances": self.get_team_finances(team_id),
@@ -224,6 +358,7 @@ class Controller:
     def get_team_owners(self) -> pd.DataFrame:
         return self.teams_model.get_team_owners_table()
 
+    @recorded
     def update_team_owners(self, updates: dict[int, int]):
         """
         updates = {team_id: owner_id}
@@ -250,6 +385,13 @@ class Controller:
         return values
 
     def get_myteam_tab_data(self) -> dict:
+        """Returns the My Team data, recomputed only after a model changed or the day or team changed."""
+        models = (self.teams_model, self.contracts_model, self.series_model, self.drivers_model,
+                  self.manufacturer_model, self.race_model)
+        return self._cached_view("myteam", (), models, self._build_myteam_tab_data,
+                                 self.current_date, self.get_active_team_id(), self.teams)
+
+    def _build_myteam_tab_data(self) -> dict:
         """
         Returns all data needed for the My Team table:
         - team name
@@ -329,6 +471,10 @@ class Controller:
             return pd.DataFrame(columns=["Department", "Employees"])
 
     def get_team_finances(self, team_id: int) -> pd.DataFrame:
+        return self._cached_view("finances", (team_id,), (self.teams_model,),
+                                 lambda: self._build_team_finances(team_id), self.teams)
+
+    def _build_team_finances(self, team_id: int) -> pd.DataFrame:
         """
         Returns financial history for the given team.
         Includes columns: Season, Employees, Income.
@@ -348,6 +494,10 @@ class Controller:
             return pd.DataFrame(columns=["Season", "Employees", "Income"])
 
     def get_upcoming_races(self, team_id: int) -> pd.DataFrame:
+        return self._cached_view("upcoming", (team_id,), (self.contracts_model, self.race_model, self.series_model),
+                                 lambda: self._build_upcoming_races(team_id), self.current_date)
+
+    def _build_upcoming_races(self, team_id: int) -> pd.DataFrame:
         """
         Returns upcoming races for the series in which the team has a contract.
         """
@@ -374,7 +524,7 @@ class Controller:
         """
 
         try:
-            if hasattr(self, "view") and hasattr(self.view, "refresh_myteam_tab"):
+            if self.view is not None:
                 self.view.refresh_myteam_tab()
             else:
                 print("[Controller] View is not initialized, refresh skipped.")
@@ -404,30 +554,91 @@ class Controller:
 
     def get_manufacturer_name_mapping(self) -> dict[str, list[str]]:
         """
-        Returns mapping of manufacturer IDs to list of their names/labels,
-        based on raced manufacturers.
+        Returns mapping of manufacturer names to the sorted part types they raced with.
+        Only part pairs recorded since the previous call are resolved.
         """
-        raced = self.race_model.get_raced_manufacturers()
-        return self.manufacturer_model.map_manufacturer_ids_to_names(raced)
+        log = self.race_model.get_participants()
+        manufacturers = self.manufacturer_model.manufacturers
+        token = (log.epoch, id(manufacturers), len(manufacturers))
+        # (token, [part pairs resolved so far], manufacturer name -> part types)
+        cached: tuple[tuple, list[int], dict[str, list[str]]] | None = self.raced_names.get("manufacturers")
+        if cached is None or cached[0] != token:
+            cached = (token, [0], {})
+            self.raced_names["manufacturers"] = cached
+        _, seen, mapping = cached
+
+        new_parts = log.parts(seen[0])
+        seen[0] += len(new_parts)
+        registry = self.manufacturer_model.get_registry()
+        for mid, part in new_parts:
+            parts = mapping.setdefault(registry.value(mid, "name", ""), [])
+            if part not in parts:
+                parts.append(part)
+                parts.sort()
+        return {name: list(parts) for name, parts in mapping.items()}
 
     def get_names(self, subject_type: str):
-        if subject_type == "Seasons":
-            raced = self.race_model.get_raced_series()
-            return sorted(self.series_model.get_series_by_id(raced))
+        if subject_type in ("Seasons", "Series"):
+            registry = self.series_model.get_registry()
+            return self._raced_names("series_id", self.series_model.series, lambda ids: [
+                ((name,), sid, name) for sid in ids for name in [registry.value(sid, "name", "")]
+            ])
 
         if subject_type == "Drivers":
-            raced = self.race_model.get_raced_drivers()
-            return self.drivers_model.get_raced_drivers(raced)
+            return self._raced_driver_names()
 
         if subject_type == "Teams":
-            raced = self.race_model.get_raced_teams()
-            return sorted(self.teams_model.get_team_names(raced))
-
-        if subject_type == "Series":
-            raced = self.race_model.get_raced_series()
-            return sorted(self.series_model.get_series_by_id(raced))
+            registry = self.teams_model.get_registry()
+            return self._raced_names("team_id", self.teams_model.teams, lambda ids: [
+                ((name,), tid, name) for tid in ids for name in [registry.value(tid, "team_name", "")]
+            ])
         return None
 
+    def _raced_names(self, col: str, table: pd.DataFrame, entries_for) -> list[str]:
+        """Return the sorted names of raced IDs in col, resolving only IDs new since the last call."""
+        log = self.race_model.get_participants()
+        token = (log.epoch, id(table), len(table))
+        names = self.raced_names.get(col)
+        if names is None or names.token != token:
+            names = self.raced_names[col] = SortedNames(token)
+        names.add(entries_for(log.ids(col, len(names))))
+        return names.labels()
+
+    def _raced_driver_names(self) -> list[str]:
+        """
+        Return raced driver names, active drivers first, each group sorted by surname and forename.
+        Drivers that left or rejoined the active list since the last call switch groups.
+        """
+        log = self.race_model.get_participants()
+        drivers = self.drivers_model.drivers
+        token = (log.epoch, id(drivers), len(drivers))
+        cached = self.raced_names.get("driver_id")
+        if cached is None or cached[0].token != token:
+            cached = (SortedNames(token), SortedNames(token))
+            self.raced_names["driver_id"] = cached
+        active_names, other_names = cached
+
+        active_df = self.drivers_model.active_drivers
+        if active_df is None or active_df.empty or "driver_id" not in active_df.columns:
+            active_df = drivers
+        active = set(active_df["driver_id"].astype(int).tolist()) if "driver_id" in active_df.columns else set()
+
+        other_names.add(active_names.pop([did for did in active_names.ids() if did not in active]))
+        active_names.add(other_names.pop([did for did in active if did in other_names]))
+
+        registry = self.drivers_model.get_registry()
+        new_entries = []
+        for did in log.ids("driver_id", len(active_names) + len(other_names)):
+            row = registry.record(did)
+            if row is None:
+                new_entries.append((("", ""), did, ""))
+            else:
+                forename, surname = str(row["forename"]), str(row["surname"])
+                new_entries.append(((surname, forename), did, f"{forename} {surname}"))
+        active_names.add(e for e in new_entries if e[1] in active)
+        other_names.add(e for e in new_entries if e[1] not in active)
+        return active_names.labels() + other_names.labels()
+
     def update_seasons(self, series_name: str):
         sid = self.series_model.get_series_id(series_name)
         if sid is None:
@@ -449,16 +660,35 @@ class Controller:
         Simulate day-by-day until the next race date.
         Uses RaceModel.get_next_race_date() to determine the target.
         """
-
-        next_race_date = self.race_model.get_next_race_date(self.current_date)
-        if next_race_date is None or next_race_date.year > self.current_date.year:
-            target_stop = pd.Timestamp(year=self.current_date.year + 1, month=1, day=1)
-        else:
-            target_stop = next_race_date
+        target_stop = self.advance_target("next_race")
         while self.current_date < target_stop:
             self.current_date = self.sim_day(self.current_date, 1)
         return
 
+    def advance_target(self, mode: str, amount: int = 1) -> datetime:
+        """
+        Return the date a simulation command stops at.
+        mode: "days" (amount days ahead), "next_race" (the next race day, or the
+        next season start if no race is left this year) or "seasons" (the start of
+        the season amount years ahead).
+        """
+        if mode == "days":
+            return self.current_date + timedelta(days=amount)
+        if mode == "seasons":
+            return datetime(self.current_date.year + amount, SEASON_START_MONTH, SEASON_START_DAY)
+        if mode == "next_race":
+            next_race_date = self.race_model.get_next_race_date(self.current_date)
+            if next_race_date is None or next_race_date.year > self.current_date.year:
+                return pd.Timestamp(year=self.current_date.year + 1, month=1, day=1)
+            return next_race_date
+        raise ValueError(f"Unknown simulation mode: {mode}")
+
+    def advance_day(self) -> datetime:
+        """Simulate one day under sim_lock and return the new current date."""
+        with self.sim_lock:
+            self.current_date = self.sim_day(self.current_date, 1)
+            return self.current_date
+
     def sim_day(self, date: datetime, days: int) -> datetime:
         for _ in range(days):
             date += timedelta(days=1)
@@ -486,11 +716,22 @@ class Controller:
             start_date = self.sim_day(start_date, 1)
         return start_date
 
-    def save_game(self, name: str):
+    def save_game(self, name: str, mode: str = SAVE_MODE):
+        """Save the game as name; mode "replay" writes only the replay log (see SAVE_MODE)."""
         folder = USER_DIR / name
         if not folder.exists():
             folder.mkdir(parents=True, exist_ok=True)
 
+        if mode == "replay":
+            if self.replay_log is not None:
+                self.replay_log.save(folder, self.current_date)
+                return
+            print("[Controller] Game was not loaded from a save, so it has no replay log; saving in full.")
+        (folder / FILE_REPLAY_LOG).unlink(missing_ok=True)
+        if self.replay_log is not None and self.replay_log.base.resolve() == folder.resolve():
+            # The base the log replays from is overwritten
+            self.replay_log = None
+
         meta = pd.DataFrame({
             "date": [self.current_date.strftime("%Y-%m-%d")],
             "begin": [self.begin_date.strftime("%Y-%m-%d")],
@@ -498,6 +739,15 @@ class Controller:
         })
         meta.to_csv(folder / FILE_CONTROLLER_DATA, index=False)
         self.generated_races.to_csv(folder / FILE_CONTROLLER_GENERATED_RACES, index=False)
+        self.random_streams.save(folder)
+
+        path = folder / FILE_HISTORY_DB
+        if (STORAGE_BACKEND == "sqlite" or self.store is not None) and (self.store is None or self.store.path != path):
+            # Another game's history may be in the file: write this one from scratch
+            self._open_store(path)
+            assert self.store is not None
+            self.store.clear()
+
         self.load_model.save(
             folder,
             self.teams_model,
@@ -506,17 +756,146 @@ class Controller:
             self.manufacturer_model,
             self.contracts_model,
             self.race_model,
+            store=self.store,
         )
 
+    def _open_store(self, path: pathlib.Path | None) -> None:
+        """Switch to the SQLite history at path (None: no store); unsaved writes to the old one are dropped."""
+        if self.store is not None:
+            self.store.close()
+        self.store = HistoryStore(path) if path is not None else None
+        self.race_model.store = self.store
+
+    # ===== Snapshots and checkpoints =====
+    def export_state(self) -> SharedSnapshot:
+        """Export the SNAPSHOT_STATE of the game to shared memory; the SQLite store stays with the game."""
+        with self.sim_lock:
+            race_model = self.race_model
+            store, race_model.store = race_model.store, None
+            try:
+                return SharedSnapshot.export({attr: getattr(self, attr) for attr in SNAPSHOT_STATE})
+            finally:
+                race_model.store = store
+
+    def import_state(self, manifest: dict) -> "Controller":
+        """Replace the game with a copy-on-write copy of an exported state."""
+        with self.sim_lock:
+            archive = self.race_model.archive
+            for attr, value in attach(manifest).items():
+                setattr(self, attr, value)
+            if archive is not None and archive is not self.race_model.archive:
+                archive.close()
+            # The store keeps its rows; it is brought in line with the models on the next save
+            self.race_model.store = self.store
+            # Versions restart from the snapshot's, so views of another branch could match them
+            self.view_cache.clear()
+            self.retire_snapshot()
+            self.raced_names = {}
+        return self
+
+    def publish_snapshot(self) -> ReadSnapshot:
+        """Export the game for readers on other threads, unless the published snapshot is still current."""
+        with self.sim_lock:
+            key = self.snapshot_key()
+            published = self.published
+            if published is not None and published.key == key:
+                return published
+            self.published = ReadSnapshot(self, key)
+            if published is not None:
+                published.retire()
+            return self.published
+
+    def retire_snapshot(self) -> None:
+        """Stop publishing; the snapshot is closed once its readers have left."""
+        published, self.published = self.published, None
+        if published is not None:
+            published.retire()
+
+    @contextmanager
+    def reading_snapshot(self) -> Iterator["Controller"]:
+        """The calling thread's copy of the published snapshot; never waits for sim_lock."""
+        while True:
+            published = self.published
+            if published is None:
+                raise RuntimeError("No snapshot of the game was published")
+            # A closed snapshot has already been replaced
+            if published.enter():
+                break
+        try:
+            yield published.controller()
+        finally:
+            published.leave()
+
+    def snapshot_key(self) -> tuple:
+        """Model versions, date and session state: views of a snapshot with an equal key are still valid."""
+        versions = tuple(getattr(getattr(self, attr), "version", 0) for attr in SNAPSHOT_STATE)
+        return versions + (self.current_date,) + tuple(getattr(self, attr, None) for attr in API_SESSION_STATE)
+
+    def checkpoint(self, name: str) -> None:
+        """Capture the game as the named checkpoint, replacing an older one of that name."""
+        with self.sim_lock:
+            archive = self.race_model.archive
+            # The exported archive is a view of its frozen copy, which this one keeps until the checkpoint is dropped
+            frozen = archive.snapshot() if archive is not None else None
+            snapshot = self.export_state()
+            self.drop_checkpoint(name)
+            self.checkpoints[name] = (snapshot, frozen, self.current_date)
+
+    def restore_checkpoint(self, name: str) -> bool:
+        """Return the game to the named checkpoint, which stays available for further branches."""
+        if name not in self.checkpoints:
+            print(f"[Controller] Unknown checkpoint: {name}")
+            return False
+        self.import_state(self.checkpoints[name][0].manifest)
+        if self.view is not None:
+            self.refresh_myteam()
+        return True
+
+    def drop_checkpoint(self, name: str) -> None:
+        """Free the memory (and archive copy) held by a checkpoint."""
+        entry = self.checkpoints.pop(name, None)
+        if entry is not None:
+            _free_checkpoints({name: entry})
+
+    def close(self) -> None:
+        """Free the checkpoints, the archive working copy and the store; unsaved history is dropped."""
+        with self.sim_lock:
+            _free_checkpoints(self.checkpoints)
+            self.retire_snapshot()
+            if self.race_model.archive is not None:
+                self.race_model.archive.close()
+                self.race_model.archive = None
+            self._open_store(None)
+
+    def get_checkpoints(self) -> list[dict]:
+        """Name, game date and size of every checkpoint, oldest first."""
+        return [
+            {"name": name, "date": date, "nbytes": snapshot.nbytes}
+            for name, (snapshot, _, date) in self.checkpoints.items()
+        ]
+
     def load_default_game(self):
         return self.load_game("default_data", base_folder=USER_DIR)
 
     def load_game(self, name: str, base_folder: pathlib.Path = USER_DIR) -> bool:
         folder = base_folder / name
+        # A replay save is rebuilt from its base save by repeating the logged actions
+        loaded = ReplayLog.load(folder, PACKAGE_DIR)
+        replay = loaded[0] if loaded is not None else None
+        if replay is not None:
+            folder = replay.base
         missing = [f for f in CONTROLLER_REQUIRED_FILES if not (folder / f).exists()]
         if missing:
             print("Missing controller files:", missing)
             return False
+        # Start from empty models, so nothing of the previous game carries over into this one
+        if self.race_model.archive is not None:
+            self.race_model.archive.close()
+        self._create_models()
+        self.view_cache.clear()
+        self.retire_snapshot()
+        self.raced_names = {}
+
         # Load using constants
         meta = pd.read_csv(folder / FILE_CONTROLLER_DATA)
         self.generated_races = pd.read_csv(folder / FILE_CONTROLLER_GENERATED_RACES)
@@ -525,6 +904,10 @@ class Controller:
         self.begin_year = self.begin_date.year
         self.new_game = bool(meta.loc[0, "new_game"])
 
+        # Reopen even the same file, so history written since its last save is rolled back
+        path = folder / FILE_HISTORY_DB
+        self._open_store(path if path.exists() else None)
+
         self.load_model.load_all(
             folder,
             self.series_model,
@@ -534,6 +917,11 @@ class Controller:
             self.contracts_model,
             self.race_model,
         )
+        self.random_streams.load(folder)
+        if replay is not None:
+            self.random_streams.set_state(replay.rng_state)
+        package = folder.name if folder.resolve() == (PACKAGE_DIR / folder.name).resolve() else None
+        self.replay_log = ReplayLog(folder, self.random_streams.get_state(), package)
 
         self.drivers_model.choose_active_drivers(self.current_date)
 
@@ -549,10 +937,14 @@ class Controller:
             self.current_date = self.sim_day(self.current_date, 1)
 
         self.new_game = False
+        if loaded is not None:
+            replay, replay_until = loaded
+            replay.replay(self, replay_until)
         self._set_default_active_team()
         self.refresh_myteam()
         return True
 
+    @recorded
     def kick_driver(self, team_id: int, driver_id: int):
         self.contracts_model.terminate_driver_contract(team_id, driver_id, self.current_date.year)
 
@@ -582,7 +974,28 @@ class Controller:
         for _, row in contracts.iterrows():
             self.teams_model.deduct_money(row["team_id"], row["cost"])
 
+    def _apply_retention(self, year: int) -> dict[str, tuple[int, int]]:
+        """Prune history outside RETENTION_SEASONS; returns the apply_retention report."""
+        models = {
+            "race_model": self.race_model,
+            "teams_model": self.teams_model,
+            "contracts_model": self.contracts_model,
+            "manufacturer_model": self.manufacturer_model,
+        }
+        return apply_retention(models, year, RETENTION_SEASONS)
+
     def _handle_season_start(self, date: datetime):
+        # Seasons that ended without reaching their last championship round are final now
+        self.race_model.finalize_open_seasons(date.year)
+        # Retention covers archived seasons too; pruning first saves archiving rows about to go
+        if any(RETENTION_SEASONS.values()):
+            report = self._apply_retention(date.year)
+            # Headless runs (experiments, the API server) simulate many seasons; only the game reports
+            if report and self.view is not None:
+                print(describe_report(date.year, report))
+        if ARCHIVE_HORIZON_SEASONS:
+            self.race_model.archive_seasons(date.year - ARCHIVE_HORIZON_SEASONS)
+
         # If we should plan races this year
         if date.year >= FIRST_RACE_PLANNING_YEAR:
             # plan for the next calendar year (your original behavior)
@@ -641,9 +1054,16 @@ class Controller:
             car_parts=self.manufacturer_model.car_parts,
             teams_model=self.teams_model,
             manufacturers=self.manufacturer_model.manufacturers,
-
+            catalog=self.manufacturer_model.get_part_catalog(),
+        )
+        self.race_model.build_season_cars(
+            self.contracts_model,
+            self.manufacturer_model,
+            self.series_model.get_active_series(date.year)["series_id"],
+            date.year,
         )
 
+    @recorded
     def apply_investments(self, year: int, investments: Any):
         """
         Public method the GUI can call to apply investments.
@@ -706,6 +1126,7 @@ class Controller:
             print(f"[Controller] Error loading available drivers: {e}")
             return pd.DataFrame()
 
+    @recorded
     def offer_driver_contract(self, driver_id: int, salary: int, length: int, next_year: bool = False):
         """
         Offers a contract to a driver for the current or next year.
@@ -740,6 +1161,7 @@ class Controller:
         except Exception as e:
             print(f"[Controller] Error processing offers: {e}")
 
+    @recorded
     def adjust_marketing_staff(self, new_employees: int, cost: int) -> str:
         """
         Sets a new number of marketing employees and deducts the cost.
@@ -763,7 +1185,7 @@ class Controller:
 
         died = []
         for i in range(len(races_today)):
-            died += self.race_model.prepare_race(
+            died += self.race_model.run_race(
                 self.drivers_model,
                 self.teams_model,
                 self.series_model,
@@ -773,6 +1195,8 @@ class Controller:
                 i,
                 date,
             )
+            if self.race_listeners:
+                self._publish_race(races_today.iloc[i])
 
         if died:
             self.drivers_model.mark_drivers_dead(died, self.current_date.year)
@@ -791,8 +1215,52 @@ class Controller:
                     team_inputs={},  # AI fallback only
                 )
 
+    # ===== Race feed =====
+    def watch_races(self, maxsize: int = FEED_QUEUE_SIZE, block: bool = True) -> RaceFeed:
+        """Return a RaceFeed that receives every race simulated from now on (see RaceFeed for block)."""
+        feed = RaceFeed(maxsize, block)
+        self.race_listeners.append(feed)
+        return feed
+
+    def stop_watching(self, feed: RaceFeed) -> None:
+        if feed in self.race_listeners:
+            self.race_listeners.remove(feed)
+        feed.close()
+
+    def _publish_race(self, race_row: pd.Series) -> None:
+        rows = self.race_model.last_results
+        if rows.empty or int(rows["race_id"].iloc[0]) != int(race_row["race_id"]):
+            return  # Nobody raced
+        event = race_finished(self.race_model, race_row["race_date"])
+        for listener in list(self.race_listeners):
+            listener(event)
+
+    def iter_races(self, mode: str, amount: int = 1) -> Iterator[RaceFinished]:
+        """
+        Simulate like a simulation command (see advance_target), yielding every race as it finishes.
+
+        The game only advances while the consumer asks for more races, so it is
+        never ahead of the consumer by more than one day.
+        """
+        stop = self.advance_target(mode, amount)
+        finished: list[RaceFinished] = []
+        listener = finished.append
+        self.race_listeners.append(listener)
+        try:
+            while self.current_date < stop:
+                self.advance_day()
+                yield from finished
+                finished.clear()
+        finally:
+            self.race_listeners.remove(listener)
+
     # Outputs / formatting results for GUI
     def get_results(self, series_name: str, season_str: str) -> pd.DataFrame:
+        models = (self.race_model, self.series_model, self.manufacturer_model, self.drivers_model, self.teams_model)
+        return self._cached_view("results", (series_name, season_str), models,
+                                 lambda: self._build_results(series_name, season_str))
+
+    def _build_results(self, series_name: str, season_str: str) -> pd.DataFrame:
         sid = self.series_model.get_series_id(series_name)
 
         if sid is None or not season_str or not season_str.strip().isdigit():
@@ -803,7 +1271,72 @@ class Controller:
 
         return self._format_results(df, season)
 
+    def get_championship_projection(self, series_name: str, sims: int = PROJECTION_SIMS) -> pd.DataFrame:
+        """Title, podium and points chances of the running season of a series, for every standings type."""
+        models = (self.race_model, self.series_model, self.manufacturer_model, self.drivers_model,
+                  self.teams_model, self.contracts_model)
+        return self._cached_view("projection", (series_name, sims), models,
+                                 lambda: self._build_projection(series_name, sims), self.current_date)
+
+    def _build_projection(self, series_name: str, sims: int) -> pd.DataFrame:
+        sid = self.series_model.get_series_id(series_name)
+        if sid is None:
+            return pd.DataFrame()
+        projection = self.race_model.project_championship(
+            self.drivers_model, self.series_model, self.manufacturer_model, self.contracts_model,
+            sid, self.current_date.year, sims,
+        )
+
+        parts = []
+        for typ, df in projection.items():
+            if df.empty:
+                continue
+            names = self._subject_names(typ, df["subject_id"])
+            parts.append(df.drop(columns="subject_id").assign(typ=typ, subject=names))
+        if not parts:
+            return pd.DataFrame()
+        df = pd.concat(parts, ignore_index=True)
+        df = df[["typ", "subject"] + [c for c in df.columns if c not in ("typ", "subject")]]
+        return df.round({"title": 3, "podium": 3, "mean_points": 1, "mean_position": 1})
+
+    def _subject_names(self, typ: str, ids) -> list[str]:
+        """Display names of the subjects of one standings type."""
+        if typ == "driver":
+            drivers = self.drivers_model.get_registry()
+            return [f"{drivers.value(i, 'forename', '')} {drivers.value(i, 'surname', '')}".strip() for i in ids]
+        if typ == "team":
+            teams = self.teams_model.get_registry()
+            return [teams.value(i, "team_name", "") for i in ids]
+        manufacturers = self.manufacturer_model.get_registry()
+        return [manufacturers.value(i, "name", "") for i in ids]
+
+    def get_standings(self, series_name: str, season_str: str) -> pd.DataFrame:
+        """Standings of a season of a series after its latest round, for every standings type."""
+        models = (self.race_model, self.series_model, self.manufacturer_model, self.drivers_model, self.teams_model)
+        return self._cached_view("standings", (series_name, season_str), models,
+                                 lambda: self._build_standings(series_name, season_str))
+
+    def _build_standings(self, series_name: str, season_str: str) -> pd.DataFrame:
+        sid = self.series_model.get_series_id(series_name)
+        if sid is None or not season_str or not season_str.strip().isdigit():
+            return pd.DataFrame()
+        finals = self.race_model.get_season_finals(sid, year=int(season_str))
+        if finals.empty:
+            return pd.DataFrame()
+        parts = [
+            df.assign(subject=self._subject_names(typ, df["subject_id"]))
+            for typ, df in finals.groupby("typ", sort=False)
+        ]
+        df = pd.concat(parts, ignore_index=True)
+        df = df.sort_values(["typ", "position"], kind="stable").reset_index(drop=True)
+        return df[["typ", "position", "subject", "points", "round"]]
+
     def get_stats(self, subject_name: str, stats_type: str, manufacturer_type: str) -> pd.DataFrame:
+        models = (self.race_model, self.series_model, self.manufacturer_model, self.drivers_model, self.teams_model)
+        return self._cached_view("stats", (subject_name, stats_type, manufacturer_type), models,
+                                 lambda: self._build_stats(subject_name, stats_type, manufacturer_type))
+
+    def _build_stats(self, subject_name: str, stats_type: str, manufacturer_type: str) -> pd.DataFrame:
         if stats_type == "Drivers":
             if not subject_name or not stats_type:
                 return pd.DataFrame()
@@ -935,20 +1468,16 @@ class Controller:
         others = [c for c in df.columns if c not in base_cols]
         df = df[base_cols + others]
 
-        # Format positions in individual rounds
-        def fmt(x):
-            if x in ("Crash", "Death"):
-                return x
-            try:
-                return str(int(float(x)))
-            except Exception:
-                return ""
-
+        # Format positions in individual rounds: whole numbers as text, codes kept, anything else blank
         for col in others:
-            df[col] = df[col].apply(fmt)
+            values = df[col]
+            numeric = pd.to_numeric(values, errors="coerce").dropna()
+            text = numeric.astype("int64").astype(str).reindex(values.index, fill_value="")
+            df[col] = text.where(~values.isin(["Crash", "Death"]), values)
 
         return df
 
+    @recorded
     def terminate_driver_contract(self) -> str:
         team_id = self.get_active_team_id()
         if team_id is None:
@@ -981,6 +1510,7 @@ class Controller:
         merged = drivers.merge(contracts, on="driver_id", how="right")
         return merged
 
+    @recorded
     def terminate_driver_contract_by_id(self, driver_id: int, cost: int, is_current: bool) -> str:
         team_id = self.get_active_team_id()
         if team_id is None:
@@ -1015,7 +1545,8 @@ class Controller:
         parts = self.contracts_model.get_available_series_parts(
             team_id,
             self.current_date.year,
-            car_parts=self.manufacturer_model.car_parts
+            car_parts=self.manufacturer_model.car_parts,
+            catalog=self.manufacturer_model.get_part_catalog(),
         )
 
         manufacturers = self.manufacturer_model.get_manufacturers()
@@ -1027,6 +1558,7 @@ class Controller:
 
         return parts
 
+    @recorded
     def offer_car_part_contract(self, manufacturer_id: int, length: int, price: int, year: int, part_type: str) -> bool:
         try:
             team_id = self.get_active_team_id()
@@ -13,10 +13,13 @@ from historical_racing_manager.consts import (
     DRIVER_ABILITY_DISTRIBUTION_START, DRIVER_ABILITY_DISTRIBUTION_END,
     DRIVERS_FILE
 )
+from historical_racing_manager.registry import Registry
+from historical_racing_manager.versioning import mutates
 
 
 class DriversModel:
     def __init__(self):
+        self.version = 0
         self.drivers = pd.DataFrame()
         self.active_drivers = pd.DataFrame()
         self.retiring_drivers = pd.DataFrame()
@@ -25,9 +28,14 @@ class DriversModel:
         self.ability_min = DRIVER_ABILITY_MIN
         self.ability_max = DRIVER_ABILITY_MAX
         self.ability_change = ABILITY_CHANGE_SEQUENCE
+        # Compiled driver_id -> record and (forename, surname) -> driver_id maps
+        self.registry = Registry("driver_id", ("forename", "surname"))
+        # Random stream; the controller binds the game's (see rng.RandomStreams)
+        self.rng = np.random.default_rng()
 
     # ====== DATA I/O ======
 
+    @mutates
     def load(self, folder: pathlib.Path) -> bool:
         path = folder / DRIVERS_FILE
 
@@ -37,6 +45,7 @@ class DriversModel:
         self.drivers = pd.read_csv(path)
         self.ability_min = min(self.ability_min, self.drivers["ability_original"].min())
         self.active_drivers = pd.DataFrame(columns=self.drivers.columns)
+        self.registry.refresh(self.drivers)
         return True
 
     def save(self, folder: pathlib.Path) -> None:
@@ -51,8 +60,11 @@ class DriversModel:
         self.active_drivers.drop(self.active_drivers.index, inplace=True)
 
     def get_driver_id(self, driver_forename: str, driver_surname: str) -> int | None:
-        result = self.drivers.query("forename == @driver_forename and surname == @driver_surname")
-        return result["driver_id"].iat[0] if not result.empty else None
+        return self.get_registry().id_of(driver_forename, driver_surname)
+
+    def get_registry(self) -> Registry:
+        """Return the driver registry, recompiling it if self.drivers was replaced."""
+        return self.registry.ensure(self.drivers)
 
     def get_raced_drivers(self, driver_ids: Iterable[int]) -> list[str]:
         """
@@ -175,6 +187,7 @@ class DriversModel:
 
     # ====== ACTIVE DRIVER SELECTION ======
 
+    @mutates
     def choose_active_drivers(self, current_date: date) -> pd.Series:
         if self.active_drivers.empty:
             self._initialize_active_drivers(current_date)
@@ -225,6 +238,7 @@ class DriversModel:
     def _update_ages(self, df: pd.DataFrame, year: int) -> None:
         df["age"] = year - df["year"]
 
+    @mutates
     def sort_active_drivers(self) -> None:
         self.active_drivers = self.active_drivers.sort_values(
             by=["reputation_race", "year"], ascending=[False, True]
@@ -239,18 +253,21 @@ class DriversModel:
 
     # ====== DRIVER STATUS UPDATES ======
 
+    @mutates
     def mark_drivers_dead(self, driver_ids: list[int], event_date: int) -> None:
         self.active_drivers.loc[self.active_drivers["driver_id"].isin(driver_ids), "alive"] = False
         self.drivers.loc[self.drivers["driver_id"].isin(driver_ids), "alive"] = False
         self.active_drivers = self.active_drivers[~self.active_drivers["driver_id"].isin(driver_ids)]
         self.dead_drivers.append([event_date, driver_ids])
 
+    @mutates
     def race_reputations(self, reputation: int, results: list[int]) -> None:
         for idx, driver_id in enumerate(results, start=1):
             self.active_drivers.loc[
                 self.active_drivers["driver_id"] == driver_id, "reputation_race"
             ] += (reputation // idx)
 
+    @mutates
     def update_reputations(self) -> None:
         self.sort_active_drivers()
         self.active_drivers["reputation_race"] //= 2
@@ -273,6 +290,7 @@ class DriversModel:
             adjustment if position == "first" else adjustment - ["second", "third"].index(position)
         )
 
+    @mutates
     def update_drivers(self, current_date: date) -> None:
         for offset in range(13):
             filtered = self._filter_adjustable_drivers(current_date.year, offset)
@@ -332,33 +350,32 @@ class DriversModel:
             distribution.extend([ability] * count)
         return distribution
 
-    @classmethod
     def generate_new_drivers(
-            cls, year: int, count: int, df: pd.DataFrame, nationality_weights: pd.Series, id_offset: int
+            self, year: int, count: int, df: pd.DataFrame, nationality_weights: pd.Series, id_offset: int
     ) -> pd.DataFrame:
         """Generate new drivers using weighted ability distribution."""
         new_drivers = []
-        dist = cls.ability_distribution()
+        dist = self.ability_distribution()
 
         for _ in range(count):
-            nationality = np.random.choice(nationality_weights.index, p=nationality_weights.values)
-            forename, surname = cls._sample_name_by_nationality(df, nationality)
-            new_driver_id, id_offset = cls._generate_driver_id(df, id_offset)
+            nationality = self.rng.choice(nationality_weights.index, p=nationality_weights.values)
+            forename, surname = self._sample_name_by_nationality(df, nationality)
+            new_driver_id, id_offset = self._generate_driver_id(df, id_offset)
 
-            ability_value = dist.pop(0) if dist else np.random.randint(36, 70)
+            ability_value = dist.pop(0) if dist else int(self.rng.integers(36, 70))
 
             new_drivers.append(
-                cls._build_driver_dict(
+                self._build_driver_dict(
                     new_driver_id, forename, surname, nationality, year, ability_value
                 )
             )
 
         return pd.DataFrame(new_drivers)
 
-    @staticmethod
-    def _sample_name_by_nationality(df: pd.DataFrame, nationality: str) -> tuple[str, str]:
+    def _sample_name_by_nationality(self, df: pd.DataFrame, nationality: str) -> tuple[str, str]:
         names = df[df["nationality"] == nationality]
-        return (names["forename"].sample(1).iat[0], names["surname"].sample(1).iat[0])
+        return (names["forename"].sample(1, random_state=self.rng).iat[0],
+                names["surname"].sample(1, random_state=self.rng).iat[0])
 
     @staticmethod
     def _generate_driver_id(df: pd.DataFrame, id_offset: int) -> tuple[int, int]:
@@ -366,9 +383,8 @@ class DriversModel:
         new_id = max_id + 1 + id_offset
         return new_id, id_offset + 1
 
-    @staticmethod
     def _build_driver_dict(
-            driver_id: int, forename: str, surname: str, nationality: str, year: int, ability: int
+            self, driver_id: int, forename: str, surname: str, nationality: str, year: int, ability: int
     ) -> dict:
         return {
             "driver_id": driver_id,
@@ -383,6 +399,6 @@ class DriversModel:
             "ability_best": ability,
             "reputation_race": 0,
             "reputation_season": 0,
-            "retire": np.random.randint(DRIVER_RETIRE_MIN_AGE, DRIVER_RETIRE_MAX_AGE),
+            "retire": int(self.rng.integers(DRIVER_RETIRE_MIN_AGE, DRIVER_RETIRE_MAX_AGE)),
 
         }
@@ -0,0 +1,143 @@
+import argparse
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager.consts import EXPERIMENT_RUNS, EXPERIMENT_SEASONS
+from historical_racing_manager.controller import Controller, USER_DIR
+
+RUN_COLUMNS = ["run", "seasons", "f1_races", "crashes", "deaths", "crash_rate", "death_rate", "bankruptcies"]
+CHAMPION_COLUMNS = ["series_id", "typ", "subject_id", "titles", "share"]
+
+# Manifest of the shared snapshot every run starts from; set once per worker process
+_manifest: dict | None = None
+
+
+def simulate_run(manifest: dict, run: int, seed: np.random.SeedSequence, seasons: int) -> tuple[dict, pd.DataFrame]:
+    """
+    Run a copy of the game seasons seasons forward, with its random streams reseeded from seed.
+
+    Returns the run's metrics (RUN_COLUMNS) and its champions: the final
+    standings leaders of every season finished during the run.
+    """
+    controller = Controller(headless=True).import_state(manifest)
+    controller.random_streams.reseed(seed)
+
+    race_model, teams_model = controller.race_model, controller.teams_model
+    before = (race_model.f1_races, race_model.crashes, race_model.deaths, teams_model.bankruptcies)
+    start = controller.current_date
+    target = controller.advance_target("seasons", seasons)
+    controller.current_date = controller.sim_day(start, (target - start).days)
+
+    races, crashes, deaths, bankruptcies = (
+        after - b for after, b in zip(
+            (race_model.f1_races, race_model.crashes, race_model.deaths, teams_model.bankruptcies), before))
+    metrics = {
+        "run": run,
+        "seasons": seasons,
+        "f1_races": races,
+        "crashes": crashes,
+        "deaths": deaths,
+        "crash_rate": crashes / races if races else 0.0,
+        "death_rate": deaths / races if races else 0.0,
+        "bankruptcies": bankruptcies,
+    }
+
+    finals = race_model.get_season_finals()
+    years = pd.to_numeric(finals["year"])
+    champions = finals[(pd.to_numeric(finals["position"]) == 1) & (years >= start.year) & (years < target.year)]
+    champions = champions[["series_id", "year", "typ", "subject_id"]].assign(run=run)
+    controller.close()
+    return metrics, champions.reset_index(drop=True)
+
+
+def _init_worker(manifest: dict) -> None:
+    global _manifest
+    _manifest = manifest
+
+
+def _run_in_worker(job: tuple[int, np.random.SeedSequence, int]) -> tuple[dict, pd.DataFrame]:
+    assert _manifest is not None, "worker started without _init_worker"
+    return simulate_run(_manifest, *job)
+
+
+def run_experiment(controller: Controller, runs: int = EXPERIMENT_RUNS, seasons: int = EXPERIMENT_SEASONS,
+                   seed: int | None = None, workers: int | None = None) -> dict[str, pd.DataFrame]:
+    """
+    Run the loaded game forward runs times for seasons seasons and compare the outcomes.
+
+    The game is exported once to shared memory (see Controller.export_state) and
+    every run attaches to it without copying; each run gets its own random streams
+    spawned from seed, so a report is reproducible for a given seed whatever the
+    number of workers. workers=1 runs everything in this process; None uses one
+    worker per CPU.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        "runs": one row of RUN_COLUMNS per run,
+        "summary": mean/std/min/max of every metric over the runs,
+        "champions": per series, standings type and subject, the titles won over
+        all runs and their share of the seasons decided (CHAMPION_COLUMNS).
+    """
+    root = np.random.SeedSequence(seed)
+    jobs = [(run, child, seasons) for run, child in enumerate(root.spawn(runs))]
+
+    workers = min(workers or os.cpu_count() or 1, max(runs, 1))
+    with controller.export_state() as shared:
+        if workers == 1:
+            outputs = [simulate_run(shared.manifest, *job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(shared.manifest,)) as pool:
+                outputs = list(pool.map(_run_in_worker, jobs))
+
+    report = summarise_runs(outputs)
+    report["runs"].attrs["seed"] = root.entropy
+    return report
+
+
+def summarise_runs(outputs: list[tuple[dict, pd.DataFrame]]) -> dict[str, pd.DataFrame]:
+    """Aggregate the (metrics, champions) of every run into one report (see run_experiment)."""
+    runs = pd.DataFrame([metrics for metrics, _ in outputs], columns=RUN_COLUMNS)
+    summary = runs.drop(columns="run").agg(["mean", "std", "min", "max"]).T
+    summary = summary.rename_axis("metric").reset_index()
+
+    frames = [champions for _, champions in outputs if not champions.empty]
+    if not frames:
+        return {"runs": runs, "summary": summary, "champions": pd.DataFrame(columns=CHAMPION_COLUMNS)}
+    champions = pd.concat(frames, ignore_index=True)
+    titles = champions.groupby(["series_id", "typ", "subject_id"]).size().rename("titles").reset_index()
+    decided = champions.drop_duplicates(["series_id", "typ", "year", "run"]).groupby(["series_id", "typ"]).size()
+    titles["share"] = titles["titles"] / decided.loc[list(zip(titles["series_id"], titles["typ"]))].to_numpy()
+    titles = titles.sort_values(["series_id", "typ", "titles", "subject_id"], ascending=[True, True, False, True],
+                                kind="stable")
+    return {"runs": runs, "summary": summary, "champions": titles[CHAMPION_COLUMNS].reset_index(drop=True)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run a saved game forward many times and compare the outcomes.")
+    parser.add_argument("save", help="name of the saved game folder")
+    parser.add_argument("--folder", type=pathlib.Path, default=USER_DIR, help="folder holding the save")
+    parser.add_argument("--runs", type=int, default=EXPERIMENT_RUNS)
+    parser.add_argument("--seasons", type=int, default=EXPERIMENT_SEASONS)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    controller = Controller(headless=True)
+    if not controller.load_game(args.save, base_folder=args.folder):
+        return 1
+    report = run_experiment(controller, args.runs, args.seasons, args.seed, args.workers)
+    print(f"Seed: {report['runs'].attrs['seed']}")
+    for name, frame in report.items():
+        print(f"\n=== {name} ===")
+        print(frame.to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+import queue
+from datetime import datetime
+from typing import NamedTuple
+
+from historical_racing_manager.consts import CRASH_CODE, DEATH_CODE, FEED_QUEUE_SIZE, FEED_STANDINGS_TOP
+
+
+class RaceFinished(NamedTuple):
+    """One race, reported as soon as it was simulated.
+
+    order lists the finishers' driver ids, winner first; round is 0 for races
+    outside the championship, whose leaders are empty. leaders maps every
+    standings type to the (subject_id, points) of its top FEED_STANDINGS_TOP
+    after this race.
+    """
+    date: datetime
+    race_id: int
+    series_id: int
+    season: int
+    round: int
+    order: list[int]
+    dnfs: list[int]
+    deaths: list[int]
+    leaders: dict[str, list[tuple[int, int]]]
+
+
+def race_finished(race_model, date: datetime, top: int = FEED_STANDINGS_TOP) -> RaceFinished:
+    """The event of the race race_model recorded last (see RaceModel.last_results)."""
+    rows = race_model.last_results
+    first = rows.iloc[0]
+    position = rows["position"]
+    finishers = rows[(position != CRASH_CODE) & (position != DEATH_CODE)].sort_values("position")
+    series_id, season, round_no = int(first["series_id"]), int(first["season"]), int(first["round"])
+
+    leaders: dict[str, list[tuple[int, int]]] = {}
+    if round_no:
+        block = race_model.standings_ledger.block(series_id, season)
+        block = block[block["position"] <= top].sort_values(["typ", "position"], kind="stable")
+        for typ, group in block.groupby("typ", sort=False):
+            leaders[typ] = [(int(s), int(p)) for s, p in zip(group["subject_id"], group["points"])]
+
+    return RaceFinished(
+        date=date,
+        race_id=int(first["race_id"]),
+        series_id=series_id,
+        season=season,
+        round=round_no,
+        order=finishers["driver_id"].astype(int).tolist(),
+        dnfs=rows.loc[position == CRASH_CODE, "driver_id"].astype(int).tolist(),
+        deaths=rows.loc[position == DEATH_CODE, "driver_id"].astype(int).tolist(),
+        leaders=leaders,
+    )
+
+
+class RaceFeed:
+    """Bounded queue of RaceFinished events for a consumer on another thread.
+
+    Register it with Controller.watch_races. With block=True (headless runs) a
+    full feed makes the simulation wait for its consumer, so it never runs more
+    than maxsize races ahead; with block=False (e.g. a GUI that may stop
+    polling) the oldest event is dropped instead and counted in dropped. A
+    producer waiting on a full feed gives up once the feed is closed.
+    """
+
+    def __init__(self, maxsize: int = FEED_QUEUE_SIZE, block: bool = True):
+        self.events: queue.Queue = queue.Queue(maxsize)
+        self.block = block
+        self.dropped = 0
+        self.closed = False
+
+    def __call__(self, event: RaceFinished) -> None:
+        if self.block:
+            while not self.closed:
+                try:
+                    self.events.put(event, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            return
+        self._put_dropping(event)
+
+    def _put_dropping(self, event: RaceFinished | None) -> None:
+        while True:
+            try:
+                self.events.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self.events.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def poll(self) -> list[RaceFinished]:
+        """Return the events reported since the last call (never blocks)."""
+        events: list[RaceFinished] = []
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                return events
+            if event is not None:
+                events.append(event)
+
+    def close(self) -> None:
+        """End iteration once the events still queued are consumed.
+
+        A full feed drops its oldest event (counted in dropped) to make room
+        for the end marker.
+        """
+        self.closed = True
+        self._put_dropping(None)
+
+    def __iter__(self):
+        """Yield events as they arrive until the feed is closed."""
+        while True:
+            try:
+                event = self.events.get(timeout=0.1)
+            except queue.Empty:
+                if self.closed:
+                    return
+                continue
+            if event is None:
+                return
+            yield event
@@ -1,4 +1,4 @@
-from tkinter import ttk, messagebox
+from tkinter import messagebox
 from typing import Optional
 
 import customtkinter as ctk
@@ -8,8 +8,11 @@ from historical_racing_manager.consts import (
     WINDOW_TITLE, WINDOW_SIZE, DEFAULT_THEME, DEFAULT_COLOR_THEME,
     TAB_NAMES, TEAM_SELECTOR_WIDTH, SIMULATION_STEPS, SIMULATION_NEXT_RACE, CONTRACT_MIN_LENGTH,
     CONTRACT_MAX_LENGTH, DEFAULT_SALARY, CONTRACT_YEARS,
-    PART_TYPES, COLUMN_LABELS
+    PART_TYPES, SIMULATION_SEASONS, SIMULATION_CANCEL, SIMULATION_POLL_MS,
+    PREFETCH_IDLE_MS, PREFETCH_NEIGHBOURS, PREFETCH_TOP_SUBJECTS
 )
+from historical_racing_manager.table import VirtualTable
+from historical_racing_manager.worker import SimulationWorker, Prefetcher, neighbours
 
 ctk.set_appearance_mode(DEFAULT_THEME)
 ctk.set_default_color_theme(DEFAULT_COLOR_THEME)
@@ -26,6 +29,13 @@ class Graphics:
         self.var_1 = ctk.StringVar()
         self.var_2 = ctk.StringVar()
         self.selected_team = ctk.StringVar()
+        self.seasons_var = ctk.StringVar(value="1")
+
+        # Simulation runs on a background thread; see sim_step/_poll_simulation
+        # Views next to the shown one are computed while idle; a simulation step cancels that
+        self.prefetcher = Prefetcher(controller)
+        self.worker = SimulationWorker(controller, prefetcher=self.prefetcher)
+        self._prefetch_after = None
 
         # Optional top menu (logo or nothing)
         self._setup_team_selector()
@@ -51,50 +61,52 @@ class Graphics:
 
     def _update_team_selector(self):
         """Refresh values of the team selector combobox."""
-        try:
-            # Example format: ["Ferrari (Owner 1)", "McLaren (Owner 2)"]
-            team_display = self.controller.get_team_selector_values()
-            self.team_selector.configure(values=team_display)
-
-            if team_display:
-                self.team_selector.set(team_display[0])
-            else:
-                self.team_selector.set("")
-        except Exception as e:
-            print(f" Failed to update team selector: {e}")
-            self.team_selector.configure(values=["No teams loaded"])
-            self.team_selector.set("No teams loaded")
+        # Read the world between two simulated days
+        with self.controller.sim_lock:
+            try:
+                # Example format: ["Ferrari (Owner 1)", "McLaren (Owner 2)"]
+                team_display = self.controller.get_team_selector_values()
+                self.team_selector.configure(values=team_display)
+
+                if team_display:
+                    self.team_selector.set(team_display[0])
+                else:
+                    self.team_selector.set("")
+            except Exception as e:
+                print(f" Failed to update team selector: {e}")
+                self.team_selector.configure(values=["No teams loaded"])
+                self.team_selector.set("No teams loaded")
 
     def refresh_myteam_tab(self):
-        """Reload the My Team tab content according to the active team."""
-        try:
-            if not hasattr(self, "tab_myteam"):
-                return  # Tab doesn’t exist yet
-
-            # Clear the tab content (keep the container frame)
-            for widget in self.tab_myteam.winfo_children():
-                widget.destroy()
-
-            # Rebuild GUI for the current team
-            self._create_myteam(self.tab_myteam)
+        """Update the My Team tab for the active team, building it on first use."""
+        with self.controller.sim_lock:
+            try:
+                if not hasattr(self, "tab_myteam"):
+                    return  # Tab doesn’t exist yet
+
+                if getattr(self, "myteam_tables", None):
+                    self._update_myteam(self.controller.get_myteam_tab_data())
+                else:
+                    self._create_myteam(self.tab_myteam)
 
-        except Exception as e:
-            print(f" My Team tab refresh failed: {e}")
+            except Exception as e:
+                print(f" My Team tab refresh failed: {e}")
 
     def on_team_change(self, value):
         """Handle team selection change and refresh the My Team tab."""
-        try:
-            self.controller.set_active_team(value.split(" (")[0])
-            # Controller returns {"name": ..., "budget": ...}
-            team_info = self.controller.get_active_team_info()
+        with self.controller.sim_lock:
+            try:
+                self.controller.set_active_team(value.split(" (")[0])
+                # Controller returns {"name": ..., "budget": ...}
+                team_info = self.controller.get_active_team_info()
 
-            self.myteam_name_label.configure(text=team_info["name"])
-            self.myteam_budget_label.configure(text=f"Total Budget: {team_info['budget']:,} €")
+                self.myteam_name_label.configure(text=team_info["name"])
+                self.myteam_budget_label.configure(text=f"Total Budget: {team_info['budget']:,} €")
 
-            self.refresh_myteam_tab()
+                self.refresh_myteam_tab()
 
-        except Exception as e:
-            print(f" Failed to change team: {e}")
+            except Exception as e:
+                print(f" Failed to change team: {e}")
 
     # Theme
     def change_theme(self, mode: str):
@@ -128,6 +140,9 @@ class Graphics:
         for idx, (label, days) in enumerate(SIMULATION_STEPS.items(), start=3):
             self._create_button(controls, label, lambda d=days: self.sim_step(d, False), idx)
         self._create_button(controls, SIMULATION_NEXT_RACE, lambda: self.sim_step(0, True), 5)
+        ctk.CTkEntry(controls, textvariable=self.seasons_var, width=50).grid(row=0, column=6, padx=5)
+        self._create_button(controls, SIMULATION_SEASONS, self.simulate_seasons, 7)
+        self._create_button(controls, SIMULATION_CANCEL, self.cancel_simulation, 8)
 
         self.date_label = ctk.CTkLabel(controls, text="", font=("Arial", 14))
         self.date_label.grid(row=0, column=9, padx=10, sticky="e")
@@ -160,23 +175,18 @@ class Graphics:
         self.tab_manufacturers = self.trees["Manufacturers"]
         self.tab_series = self.trees["Series"]
         self.tab_results = self.trees["Seasons"]
+        self.tab_projection = self.trees["Projection"]
 
     def _create_myteam(self, parent):
         """Build the My Team tab layout with Drivers, Components, Staff, and Upcoming Races."""
         try:
-            data = self.controller.get_myteam_tab_data()
             # HEADER
             header = ctk.CTkFrame(parent)
             header.pack(fill="x", padx=10, pady=(5, 10))
-            team_name = data["team_name"]
-            series_name = data["series"]
-            team_series_name = f"{team_name} - {series_name}"
-            self.myteam_name_label = ctk.CTkLabel(header, text=team_series_name, font=("Arial", 18, "bold"))
+            self.myteam_name_label = ctk.CTkLabel(header, text="", font=("Arial", 18, "bold"))
             self.myteam_name_label.pack(side="left", padx=10)
 
-            formatted_budget = f"€{data['budget']:,.0f}".replace(",", " ")
-            self.myteam_budget_label = ctk.CTkLabel(header, text=f"Total Budget: {formatted_budget}",
-                                                    font=("Arial", 14))
+            self.myteam_budget_label = ctk.CTkLabel(header, text="", font=("Arial", 14))
             self.myteam_budget_label.pack(side="right", padx=10)
 
             # MAIN SECTION – vertical: Drivers on top, Components below
@@ -184,30 +194,28 @@ class Graphics:
             main_frame.pack(fill="both", expand=False, padx=10, pady=(0, 5))
             main_frame.columnconfigure(0, weight=1)
 
+            self.myteam_tables = {}
+
             # DRIVERS (top)
             drivers_frame = ctk.CTkFrame(main_frame)
             drivers_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
             ctk.CTkLabel(drivers_frame, text="Drivers", font=("Arial", 14, "bold")).pack(anchor="w", padx=5, pady=5)
-            dc = data["driver_contracts"]
-            drivers_info = f"This year: {dc[0]}/{dc[1]}   Next year: {dc[2]}/{dc[3]}"
-            ctk.CTkLabel(drivers_frame, text=drivers_info, font=("Arial", 12)).pack(anchor="w", padx=5, pady=(0, 5))
+            self.myteam_drivers_info = ctk.CTkLabel(drivers_frame, text="", font=("Arial", 12))
+            self.myteam_drivers_info.pack(anchor="w", padx=5, pady=(0, 5))
 
-            tree_drivers = ttk.Treeview(drivers_frame, show="headings", height=6)
-            tree_drivers.pack(fill="x", padx=5, pady=5)
-            self._populate_treeview(tree_drivers, data["drivers"])
+            self.myteam_tables["drivers"] = VirtualTable(drivers_frame, height=6)
+            self.myteam_tables["drivers"].frame.pack(fill="x", padx=5, pady=5)
 
             # COMPONENTS (bottom)
             components_frame = ctk.CTkFrame(main_frame)
             components_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
             ctk.CTkLabel(components_frame, text="Components", font=("Arial", 14, "bold")).pack(anchor="w", padx=5,
                                                                                                pady=5)
-            pc = data["car_part_contracts"]
-            parts_info = f"This year: {pc[0]}/{pc[1]}   Next year: {pc[2]}/{pc[3]}"
-            ctk.CTkLabel(components_frame, text=parts_info, font=("Arial", 12)).pack(anchor="w", padx=5, pady=(0, 5))
+            self.myteam_parts_info = ctk.CTkLabel(components_frame, text="", font=("Arial", 12))
+            self.myteam_parts_info.pack(anchor="w", padx=5, pady=(0, 5))
 
-            tree_parts = ttk.Treeview(components_frame, show="headings", height=6)
-            tree_parts.pack(fill="x", padx=5, pady=5)
-            self._populate_treeview(tree_parts, data["components"])
+            self.myteam_tables["components"] = VirtualTable(components_frame, height=6)
+            self.myteam_tables["components"].frame.pack(fill="x", padx=5, pady=5)
 
             # STAFF + FINANCE + RACES section
             info_frame = ctk.CTkFrame(parent)
@@ -215,32 +223,15 @@ class Graphics:
             info_frame.columnconfigure(0, weight=1)
             info_frame.columnconfigure(1, weight=1)
 
-            # STAFF
-            left_info = ctk.CTkFrame(info_frame)
-            left_info.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-            ctk.CTkLabel(left_info, text="Staff", font=("Arial", 13, "bold")).pack(anchor="w", padx=5, pady=5)
-            tree_staff = ttk.Treeview(left_info, show="headings", height=4)
-            tree_staff.pack(fill="x", padx=5, pady=5)
-            self._populate_treeview(tree_staff, data["staff"])
-
-            # FINANCES
-            right_info = ctk.CTkFrame(info_frame)
-            right_info.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
-            ctk.CTkLabel(right_info, text="Income", font=("Arial", 13, "bold")).pack(anchor="w", padx=5, pady=5)
-            tree_finances = ttk.Treeview(right_info, show="headings", height=4)
-            tree_finances.pack(fill="x", padx=5, pady=5)
-            self._populate_treeview(tree_finances, data["finances"])
-
-            # RACES
-            right_info = ctk.CTkFrame(info_frame)
-            right_info.grid(row=0, column=2, sticky="nsew", padx=5, pady=5)
-            ctk.CTkLabel(right_info, text="Upcoming Races", font=("Arial", 13, "bold")).pack(anchor="w", padx=5, pady=5)
-            tree_races = ttk.Treeview(right_info, show="headings", height=4)
-            tree_races.pack(fill="x", padx=5, pady=5)
-            self._populate_treeview(tree_races, data["races"])
+            for column, (key, title) in enumerate([("staff", "Staff"), ("finances", "Income"),
+                                                   ("races", "Upcoming Races")]):
+                box = ctk.CTkFrame(info_frame)
+                box.grid(row=0, column=column, sticky="nsew", padx=5, pady=5)
+                ctk.CTkLabel(box, text=title, font=("Arial", 13, "bold")).pack(anchor="w", padx=5, pady=5)
+                self.myteam_tables[key] = VirtualTable(box, height=4)
+                self.myteam_tables[key].frame.pack(fill="x", padx=5, pady=5)
 
             # Controls for actions at the bottom of My Team
-            # Attach to the current parent (not a stored tab reference) for clean refreshes
             team_controls = ctk.CTkFrame(parent)
             team_controls.pack(pady=(5, 10), fill="x")
 
@@ -261,9 +252,25 @@ class Graphics:
                 side="left", padx=5, pady=5
             )
 
+            self._update_myteam(self.controller.get_myteam_tab_data())
+
         except Exception as e:
             print(f"️ Failed to build My Team tab: {e}")
 
+    def _update_myteam(self, data: dict):
+        """Write My Team data into the existing widgets of the tab."""
+        self.myteam_name_label.configure(text=f"{data['team_name']} - {data.get('series', '')}")
+        formatted_budget = f"€{data['budget']:,.0f}".replace(",", " ")
+        self.myteam_budget_label.configure(text=f"Total Budget: {formatted_budget}")
+
+        dc = data.get("driver_contracts", [0, 0, 0, 0])
+        self.myteam_drivers_info.configure(text=f"This year: {dc[0]}/{dc[1]}   Next year: {dc[2]}/{dc[3]}")
+        pc = data.get("car_part_contracts", [0, 0, 0, 0])
+        self.myteam_parts_info.configure(text=f"This year: {pc[0]}/{pc[1]}   Next year: {pc[2]}/{pc[3]}")
+
+        for key, table in self.myteam_tables.items():
+            self._populate_treeview(table, data.get(key))
+
     def on_tab_change(self, event=None):
         """Handle tab change: refresh My Team tab and update dropdowns/results."""
         current_tab = self.tabview.get()
@@ -305,6 +312,8 @@ class Graphics:
 
     def open_manage_teams(self):
         """Open a window to manage team ownership (owner_id)."""
+        if self._simulation_running():
+            return
         try:
             teams = self.controller.get_team_owners()  # now uses model getter
             if teams.empty:
@@ -356,17 +365,12 @@ class Graphics:
             messagebox.showerror("Error", f"Failed to open team manager: {e}")
 
     def _create_tree_in_tab(self, tab):
-        """Create a treeview with scrollbars inside a tab."""
-        tree = ttk.Treeview(tab, show="headings")
-        vsb = ttk.Scrollbar(tab, orient="vertical", command=tree.yview)
-        hsb = ttk.Scrollbar(tab, orient="horizontal", command=tree.xview)
-        tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb.grid(row=1, column=0, sticky="ew")
+        """Create a virtualised table with scrollbars filling a tab."""
+        table = VirtualTable(tab)
+        table.frame.grid(row=0, column=0, sticky="nsew")
         tab.rowconfigure(0, weight=1)
         tab.columnconfigure(0, weight=1)
-        return tree
+        return table
 
     def _create_button(self, parent, text, command, column):
         """Helper to create a button in a single row at a given column."""
@@ -379,11 +383,14 @@ class Graphics:
             self.update_dropdown()
         except Exception:
             pass
+        self.root.after(SIMULATION_POLL_MS, self._poll_simulation)
         self.root.mainloop()
 
     # --- Game management ---
     def on_new_game(self):
         """Initialize a new game from default one and refresh UI state."""
+        if self._simulation_running():
+            return
         try:
             ok = self.controller.load_default_game()
             if ok:
@@ -398,6 +405,8 @@ class Graphics:
 
     def on_save_game(self):
         """Save the current game using the provided name."""
+        if self._simulation_running():
+            return
         name = self.name_var.get().strip()
         if not name:
             messagebox.showwarning("Missing Name", "Please enter a name to save the game.")
@@ -414,6 +423,8 @@ class Graphics:
 
     def on_load_game(self):
         """Load a saved game and refresh the UI."""
+        if self._simulation_running():
+            return
         name = self.name_var.get().strip()
         if not name:
             messagebox.showwarning("Missing Name", "Please enter a name to load the game.")
@@ -433,32 +444,33 @@ class Graphics:
     # --- Simulation ---
     def on_dropdown_change(self, event=None):
         """Update season list when the series combobox changes."""
-        try:
+        with self.controller.sim_lock:
+            try:
 
-            current_tab = self.tabview.get()
+                current_tab = self.tabview.get()
 
-            if current_tab == "Manufacturers":
-                manu_dict = self.controller.get_manufacturer_name_mapping()
-                # Combo 2 = parts for the default manufacturer
-                parts = manu_dict[self.var_1.get()]
+                if current_tab == "Manufacturers":
+                    manu_dict = self.controller.get_manufacturer_name_mapping()
+                    # Combo 2 = parts for the default manufacturer
+                    parts = manu_dict[self.var_1.get()]
 
-                self.cmb_2.configure(values=parts)
-                if parts:
-                    self.cmb_2.set(parts[0])
-                    self.show_results()
-            elif current_tab == "Seasons":
-                self.controller.update_seasons(self.var_1.get())
+                    self.cmb_2.configure(values=parts)
+                    if parts:
+                        self.cmb_2.set(parts[0])
+                        self.show_results()
+                elif current_tab == "Seasons":
+                    self.controller.update_seasons(self.var_1.get())
 
-                seasons = self.controller.get_season_list()
+                    seasons = self.controller.get_season_list()
 
-                self.cmb_2.configure(values=seasons)
-                if seasons:
-                    self.cmb_2.set(seasons[0])
+                    self.cmb_2.configure(values=seasons)
+                    if seasons:
+                        self.cmb_2.set(seasons[0])
+                        self.show_results()
+                else:
                     self.show_results()
-            else:
-                self.show_results()
-        except Exception:
-            print("Error in on_dropdown_change:")
+            except Exception:
+                print("Error in on_dropdown_change:")
 
     def on_subject_change(self, list_2: list):
         """Update second-level combobox values for stats views."""
@@ -469,13 +481,50 @@ class Graphics:
             pass
 
     def sim_step(self, days: int, next_race: bool):
-        """Advance the simulation by a given number of days and refresh UI state."""
+        """Queue a simulation step on the worker thread; the UI refreshes when it finishes."""
+        if next_race:
+            self.worker.submit("next_race")
+        else:
+            self.worker.submit("days", days)
+
+    def simulate_seasons(self):
+        """Queue the simulation of the number of seasons typed next to the button."""
+        value = self.seasons_var.get().strip()
+        if not value.isdigit() or int(value) < 1:
+            messagebox.showwarning("Invalid Number", "Please enter a whole number of seasons.")
+            return
+        self.worker.submit("seasons", int(value))
+
+    def cancel_simulation(self):
+        """Stop the running simulation after the day in progress and drop queued steps."""
+        self.worker.cancel()
+
+    def _simulation_running(self) -> bool:
+        """Return True (and tell the user) if the world is currently advancing."""
+        if self.worker.busy:
+            messagebox.showinfo("Simulation Running", "Please wait for the simulation to finish or cancel it.")
+            return True
+        return False
+
+    def _poll_simulation(self):
+        """Apply events from the simulation thread, then poll again."""
         try:
-            if next_race:
-                self.controller.sim_to_next_race()
-            else:
-                self.controller.simulate_days(days)
+            for event in self.worker.poll():
+                if event.kind == "progress":
+                    if event.date is not None:
+                        progress = f"  ({event.done}/{event.total})" if event.total > 1 else ""
+                        self.date_label.configure(text=event.date.strftime("%Y-%m-%d %A") + progress)
+                elif event.kind == "error":
+                    messagebox.showerror("Simulation Error", event.message)
+                    self._refresh_after_simulation()
+                else:
+                    self._refresh_after_simulation()
+        finally:
+            self.root.after(SIMULATION_POLL_MS, self._poll_simulation)
 
+    def _refresh_after_simulation(self):
+        """Refresh UI state after a simulation command finished or was cancelled."""
+        try:
             self.date_label.configure(text=self.controller.get_date())
             self.update_dropdown()
             self.show_results()
@@ -490,81 +539,140 @@ class Graphics:
 
     def update_dropdown(self):
         """Update top comboboxes according to the active tab."""
-        try:
-            current_tab = self.tabview.get()
-
-            # Set the correct combobox values based on the active tab
-            if current_tab == "Seasons":
-                items = self.controller.get_names(current_tab)
-                self.cmb_1.configure(values=items)
-                if items:
-                    self.cmb_1.set(items[0])
-                self.on_dropdown_change()
-
-            elif current_tab == "Drivers":
-                items = self.controller.get_names(current_tab)
-                self.cmb_1.configure(values=items)
-                if items:
-                    self.cmb_1.set(items[0])
-                self.on_subject_change([""])
-
-            elif current_tab == "Teams":
-                items = self.controller.get_names(current_tab)
-                self.cmb_1.configure(values=items)
-                if items:
-                    self.cmb_1.set(items[0])
-                self.on_subject_change([""])
-
-            elif current_tab == "Manufacturers":
-                manu_dict = self.controller.get_manufacturer_name_mapping()  # dict: name -> parts
-
-                # Combo 1 = list manufacturer names
-                names = list(manu_dict.keys())
-                self.cmb_1.configure(values=names)
-
-                if names:
-                    self.cmb_1.set(names[0])
-                self.on_dropdown_change()
-
-            elif current_tab == "Series":
-                items = self.controller.get_names(current_tab)
-                self.cmb_1.configure(values=items)
-                if items:
-                    self.cmb_1.set(items[0])
-                self.on_subject_change([""])
-
-        except Exception as e:
-            print(f"update_dropdown error: {e}")
+        with self.controller.sim_lock:
+            try:
+                current_tab = self.tabview.get()
+
+                # Set the correct combobox values based on the active tab
+                if current_tab == "Seasons":
+                    items = self.controller.get_names(current_tab)
+                    self.cmb_1.configure(values=items)
+                    if items:
+                        self.cmb_1.set(items[0])
+                    self.on_dropdown_change()
+
+                elif current_tab == "Drivers":
+                    items = self.controller.get_names(current_tab)
+                    self.cmb_1.configure(values=items)
+                    if items:
+                        self.cmb_1.set(items[0])
+                    self.on_subject_change([""])
+
+                elif current_tab == "Teams":
+                    items = self.controller.get_names(current_tab)
+                    self.cmb_1.configure(values=items)
+                    if items:
+                        self.cmb_1.set(items[0])
+                    self.on_subject_change([""])
+
+                elif current_tab == "Manufacturers":
+                    manu_dict = self.controller.get_manufacturer_name_mapping()  # dict: name -> parts
+
+                    # Combo 1 = list manufacturer names
+                    names = list(manu_dict.keys())
+                    self.cmb_1.configure(values=names)
+
+                    if names:
+                        self.cmb_1.set(names[0])
+                    self.on_dropdown_change()
+
+                elif current_tab == "Series":
+                    items = self.controller.get_names(current_tab)
+                    self.cmb_1.configure(values=items)
+                    if items:
+                        self.cmb_1.set(items[0])
+                    self.on_subject_change([""])
+
+                elif current_tab == "Projection":
+                    items = self.controller.get_names("Series")
+                    self.cmb_1.configure(values=items)
+                    if items:
+                        self.cmb_1.set(items[0])
+                    self.on_subject_change([""])
+
+            except Exception as e:
+                print(f"update_dropdown error: {e}")
 
     def show_results(self, event=None):
         """Populate the current tab’s treeview with results/statistics."""
+        with self.controller.sim_lock:
+            try:
+                current_tab = self.tabview.get()
+                if current_tab == "Seasons":
+                    df = self.controller.get_results(self.var_1.get(), self.var_2.get())
+                    self._populate_treeview(self.tab_results, df)
+
+                elif current_tab == "Manufacturers":
+                    df = self.controller.get_stats(self.var_1.get(), current_tab, self.var_2.get())
+                    self._populate_treeview(self.tab_manufacturers, df)
+
+                elif current_tab == "Teams":
+                    df = self.controller.get_stats(self.var_1.get(), current_tab, "")
+                    self._populate_treeview(self.tab_teams, df)
+
+                elif current_tab == "Drivers":
+                    df = self.controller.get_stats(self.var_1.get(), current_tab, "")
+                    self._populate_treeview(self.tab_drivers, df)
+
+                elif current_tab == "Series":
+                    df = self.controller.get_stats(self.var_1.get(), current_tab, "")
+                    self._populate_treeview(self.tab_series, df)
+
+                elif current_tab == "Projection":
+                    df = self.controller.get_championship_projection(self.var_1.get())
+                    self._populate_treeview(self.tab_projection, df)
+            except Exception as e:
+                messagebox.showerror("Error", f"Could not get results: {e}")
+        self._schedule_prefetch()
+
+    # --- Prefetch ---
+    def _schedule_prefetch(self):
+        """(Re)start the idle timer after which views near the shown one are prefetched."""
+        if self._prefetch_after is not None:
+            self.root.after_cancel(self._prefetch_after)
+        self._prefetch_after = self.root.after(PREFETCH_IDLE_MS, self._prefetch_nearby)
+
+    def _prefetch_nearby(self):
+        """Queue adjacent seasons / nearby and top dropdown subjects of the current tab."""
+        self._prefetch_after = None
+        if self.worker.busy:
+            return
         try:
-            current_tab = self.tabview.get()
-            if current_tab == "Seasons":
-                df = self.controller.get_results(self.var_1.get(), self.var_2.get())
-                self._populate_treeview(self.tab_results, df)
-
-            elif current_tab == "Manufacturers":
-                df = self.controller.get_stats(self.var_1.get(), current_tab, self.var_2.get())
-                self._populate_treeview(self.tab_manufacturers, df)
-
-            elif current_tab == "Teams":
-                df = self.controller.get_stats(self.var_1.get(), current_tab, "")
-                self._populate_treeview(self.tab_teams, df)
-
-            elif current_tab == "Drivers":
-                df = self.controller.get_stats(self.var_1.get(), current_tab, "")
-                self._populate_treeview(self.tab_drivers, df)
-
-            elif current_tab == "Series":
-                df = self.controller.get_stats(self.var_1.get(), current_tab, "")
-                self._populate_treeview(self.tab_series, df)
+            self.prefetcher.submit(self._prefetch_jobs())
         except Exception as e:
-            messagebox.showerror("Error", f"Could not get results: {e}")
+            print(f"Prefetch error: {e}")
+
+    def _prefetch_jobs(self) -> list[tuple[str, tuple]]:
+        current_tab = self.tabview.get()
+        subject = self.var_1.get()
+
+        if current_tab == "Seasons":
+            seasons = neighbours(self.cmb_2.cget("values"), self.var_2.get(), PREFETCH_NEIGHBOURS)
+            return [("get_results", (subject, season)) for season in seasons]
+
+        if current_tab not in ("Drivers", "Teams", "Manufacturers", "Series"):
+            return []
+
+        items = list(self.cmb_1.cget("values"))
+        subjects = neighbours(items, subject, PREFETCH_NEIGHBOURS) + items[:PREFETCH_TOP_SUBJECTS]
+        subjects = [name for name in dict.fromkeys(subjects) if name != subject]
+
+        if current_tab == "Manufacturers":
+            with self.controller.sim_lock:
+                manu_dict = self.controller.get_manufacturer_name_mapping()
+            # The parts dropdown opens on the first part of a manufacturer
+            jobs = [("get_stats", (subject, current_tab, part))
+                    for part in manu_dict.get(subject, []) if part != self.var_2.get()]
+            return jobs + [("get_stats", (name, current_tab, manu_dict[name][0]))
+                           for name in subjects if manu_dict.get(name)]
+
+        return [("get_stats", (name, current_tab, "")) for name in subjects]
 
     # --- My Team actions ---
     def offer_contract(self, next_year: bool):
         """Open a dialog to offer a driver contract for this or next year."""
+        if self._simulation_running():
+            return
         try:
             team = self.controller.get_active_team()
             if not team:
@@ -652,6 +760,8 @@ class Graphics:
 
     def terminate_contract(self):
         """Open a dialog to terminate a driver contract."""
+        if self._simulation_running():
+            return
         try:
             team = self.controller.get_active_team()
             if not team:
@@ -716,6 +826,8 @@ class Graphics:
 
     def offer_car_part_contract(self):
         """Open a dialog to offer a car part contract."""
+        if self._simulation_running():
+            return
         try:
             team = self.controller.get_active_team()
             if not team:
@@ -810,6 +922,8 @@ class Graphics:
 
     def create_own_part(self):
         """Open a dialog to define and confirm development of an own car part."""
+        if self._simulation_running():
+            return
         try:
             dialog = ctk.CTkToplevel(self.root)
             dialog.title("Create Own Part")
@@ -854,6 +968,8 @@ class Graphics:
 
     def invest_in_marketing(self):
         """Open a dialog to adjust marketing/finance staff with cost preview."""
+        if self._simulation_running():
+            return
         try:
             team = self.controller.get_active_team()
             if not team:
@@ -939,41 +1055,9 @@ class Graphics:
             messagebox.showerror("Error", f"Could not open dialog: {e}")
 
     # --- Utility ---
-    def _populate_treeview(self, tree: ttk.Treeview, dataframe: Optional[pd.DataFrame]):
-        """Populate a ttk.Treeview from a pandas DataFrame, with readable column labels."""
+    def _populate_treeview(self, table: VirtualTable, dataframe: Optional[pd.DataFrame]):
+        """Show a pandas DataFrame in a virtualised table, with readable column labels."""
         try:
-            tree.delete(*tree.get_children())
-
-            if dataframe is None or dataframe.empty:
-                tree["columns"] = ["info"]
-                tree.heading("info", text="Info")
-                tree.column("info", width=600, anchor="center")
-                tree.insert("", "end", values=("No data",))
-                return
-
-            df = dataframe.copy()
-            cols = [str(c) for c in df.columns]
-            tree["columns"] = cols
-
-            # Ensure unique displayed labels (if duplicates occur)
-            display_labels: dict[str, str] = {}
-            used_labels: dict[str, int] = {}
-            for col in cols:
-                label = COLUMN_LABELS.get(col, col.replace("_", " ").title())
-                if label in used_labels:
-                    used_labels[label] += 1
-                    label = f"{label} {used_labels[label]}"
-                else:
-                    used_labels[label] = 1
-                display_labels[col] = label
-
-            for col in cols:
-                tree.heading(col, text=display_labels[col])
-                tree.column(col, width=120, anchor="center")
-
-            for row in df.itertuples(index=False):
-                vals = ["" if pd.isna(v) else v for v in row]
-                tree.insert("", "end", values=vals)
-
+            table.set_data(dataframe)
         except Exception as e:
             messagebox.showerror("Error", f"Could not populate view: {e}")
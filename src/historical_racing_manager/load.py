@@ -6,8 +6,8 @@ class LoadManager:
     """Handle saving and loading of all game data."""
 
     def save(self, folder: pathlib.Path, teams_model, series_model, drivers_model, manufacturer_model, contracts_model,
-             race_model):
-        """Save all game data to the given folder."""
+             race_model, store=None):
+        """Save all game data to the given folder; history goes to store (a HistoryStore) if given."""
         if folder:
             race_model.save(folder)
             contracts_model.save(folder)
@@ -15,6 +15,8 @@ class LoadManager:
             series_model.save(folder)
             drivers_model.save(folder)
             manufacturer_model.save(folder)
+            if store is not None:
+                store.save(race_model)
 
     def load_all(self, folder: pathlib.Path, series_model, teams_model, drivers_model, manufacturer_model,
                  contracts_model, race_model):
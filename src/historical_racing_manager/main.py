@@ -3,7 +3,10 @@ from historical_racing_manager.controller import Controller
 
 def main():
     controller = Controller()
-    controller.run()
+    try:
+        controller.run()
+    finally:
+        controller.close()
 
 
 if __name__ == "__main__":
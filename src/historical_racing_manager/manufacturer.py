@@ -3,6 +3,7 @@ import pathlib
 import numpy as np
 import pandas as pd
 
+from historical_racing_manager.catalog import PartCatalog
 from historical_racing_manager.consts import (
     FILE_CAR_PARTS,
     FILE_CARS,
@@ -19,19 +20,28 @@ from historical_racing_manager.consts import (
     UPGRADE_SAFETY_MIN,
     UPGRADE_SAFETY_MAX,
 )
+from historical_racing_manager.registry import Registry
+from historical_racing_manager.versioning import mutates
 
 
 class ManufacturerModel:
     """Model handling manufacturers, car parts, part models, and related rules."""
 
     def __init__(self):
+        self.version = 0
         self.car_parts = pd.DataFrame()
         self.car_part_models = pd.DataFrame()
         self.cars = pd.DataFrame()
         self.manufacturers = pd.DataFrame()
         self.rules = pd.DataFrame()
+        self.part_catalog = PartCatalog()
+        # Compiled manufacture_id -> record and name -> manufacture_id maps
+        self.registry = Registry("manufacture_id", "name")
+        # Random stream; the controller binds the game's (see rng.RandomStreams)
+        self.rng = np.random.default_rng()
 
     # --- Persistence ---
+    @mutates
     def load(self, folder: pathlib.Path) -> bool:
         """Load manufacturer-related dataframes from CSV files in the given folder."""
         required_files = MANUFACTURER_REQUIRED_FILES
@@ -46,6 +56,8 @@ class ManufacturerModel:
         self.manufacturers = pd.read_csv(folder / FILE_MANUFACTURERS)
         self.car_part_models = pd.read_csv(folder / FILE_CAR_PART_MODELS)
         self.rules = pd.read_csv(folder / FILE_RULES)
+        self.part_catalog.rebuild(self.car_parts)
+        self.registry.refresh(self.manufacturers)
         return True
 
     def save(self, folder: pathlib.Path):
@@ -65,26 +77,18 @@ class ManufacturerModel:
         self.rules = pd.DataFrame()
 
     # --- Business logic ---
+    def get_part_catalog(self) -> PartCatalog:
+        """Return the part catalog, rebuilding it if car_parts was replaced since it was indexed."""
+        if not self.part_catalog.is_built_for(self.car_parts):
+            self.part_catalog.rebuild(self.car_parts)
+        return self.part_catalog
+
+    @mutates
     def develop_part(self, date, contracts: pd.DataFrame):
         """Develop parts for the given year based on active contracts and rules, then append to car_parts."""
         merged = self._merge_contracts_with_rules(contracts, date.year)
 
-        last_year_parts = self.car_parts[self.car_parts["year"] == date.year - 1].copy()
-
-        # Unify key column types before merging
-        merge_keys = MERGE_KEYS
-        for key in merge_keys:
-            if key in merged.columns:
-                merged[key] = merged[key].astype(str)
-            if key in last_year_parts.columns:
-                last_year_parts[key] = last_year_parts[key].astype(str)
-
-        final = pd.merge(
-            merged,
-            last_year_parts,
-            how="left",
-            on=merge_keys,
-        )
+        final = self._join_last_year_parts(merged, date.year - 1)
         final = self._fill_missing_values(final)
         final = self._apply_car_part_improvements(final, date.year)
         final = self._clamp_values(final)
@@ -112,11 +116,67 @@ class ManufacturerModel:
                 "cost",
             ]
         ].copy()
-        new_parts.loc[:, "part_id"] = self._generate_new_part_ids(len(new_parts))
+        new_parts = new_parts.astype({"manufacture_id": "int64", "rules_id": "int64", "series_id": "int64"})
+        new_parts["part_type"] = new_parts["part_type"].astype(str)
+        new_parts["part_id"] = np.asarray(self._generate_new_part_ids(len(new_parts)), dtype="int64")
+
+        catalog = self.get_part_catalog()
         if self.car_parts.empty:
-            self.car_parts = new_parts.copy()
+            self.car_parts = new_parts.reset_index(drop=True)
+            catalog.rebuild(self.car_parts)
         else:
             self.car_parts = pd.concat([self.car_parts, new_parts], ignore_index=True)
+            catalog.extend(self.car_parts)
+
+    @mutates
+    def prune_parts(self, before_year: int) -> int:
+        """Drop car parts of years before before_year (the catalog is rebuilt on next use)."""
+        if self.car_parts.empty or "year" not in self.car_parts.columns:
+            return 0
+        old = pd.to_numeric(self.car_parts["year"], errors="coerce") < before_year
+        if old.any():
+            self.car_parts = self.car_parts[~old].reset_index(drop=True)
+        return int(old.sum())
+
+    def _join_last_year_parts(self, merged: pd.DataFrame, last_year: int) -> pd.DataFrame:
+        """Attach power, reliability and safety of last year's matching part through the part catalog.
+
+        A part matches when series_id, part_type, manufacture_id and rules_id agree; rows without
+        a predecessor keep NaN stats and are filled from the rules in _fill_missing_values.
+        """
+        catalog = self.get_part_catalog()
+        n = len(merged)
+        power = np.full(n, np.nan)
+        reliability = np.full(n, np.nan)
+        safety = np.full(n, np.nan)
+
+        if n and not self.car_parts.empty:
+            power_col = pd.to_numeric(self.car_parts["power"], errors="coerce").to_numpy()
+            reliability_col = pd.to_numeric(self.car_parts["reliability"], errors="coerce").to_numpy()
+            safety_col = pd.to_numeric(self.car_parts["safety"], errors="coerce").to_numpy()
+            rules_col = (
+                pd.to_numeric(self.car_parts["rules_id"], errors="coerce").to_numpy()
+                if "rules_id" in self.car_parts.columns else None
+            )
+
+            keys = zip(*(merged[key] for key in MERGE_KEYS))
+            for i, (rules_id, mid, part_type, sid) in enumerate(keys):
+                if pd.isna(sid) or pd.isna(mid):
+                    continue
+                for pos in catalog.find(int(sid), last_year, str(part_type), int(mid)):
+                    if rules_col is not None and not pd.isna(rules_id) and rules_col[pos] != rules_id:
+                        continue
+                    power[i] = power_col[pos]
+                    reliability[i] = reliability_col[pos]
+                    safety[i] = safety_col[pos]
+                    break
+
+        merged = merged.copy()
+        merged["power"] = power
+        merged["reliability"] = reliability
+        merged["safety"] = safety
+        merged["part_id"] = -1
+        return merged
 
     def get_manufacturers(self) -> pd.DataFrame:
         """Return manufacturer IDs and names, or an empty DataFrame if unavailable."""
@@ -128,8 +188,11 @@ class ManufacturerModel:
 
     def get_manufacturers_id(self, manufacturer_name: str) -> int | None:
         """Return the manufacture_id for a given name, or None if not found."""
-        result = self.manufacturers.query("name == @manufacturer_name")
-        return result["manufacture_id"].iat[0] if not result.empty else None
+        return self.get_registry().id_of(manufacturer_name)
+
+    def get_registry(self) -> Registry:
+        """Return the manufacturer registry, recompiling it if self.manufacturers was replaced."""
+        return self.registry.ensure(self.manufacturers)
 
     def _merge_contracts_with_rules(self, contracts: pd.DataFrame, year: int) -> pd.DataFrame:
         """Merge contracts with rules and filter to those active in the given year."""
@@ -157,9 +220,9 @@ class ManufacturerModel:
 
     def _apply_car_part_improvements(self, df: pd.DataFrame, year: int) -> pd.DataFrame:
         """Apply random improvements to part attributes and set the target year."""
-        rand_power = np.random.randint(UPGRADE_POWER_MIN, UPGRADE_POWER_MAX + 1, size=len(df))
-        rand_reliability = np.random.randint(UPGRADE_RELIABILITY_MIN, UPGRADE_RELIABILITY_MAX + 1, size=len(df))
-        rand_safety = np.random.randint(UPGRADE_SAFETY_MIN, UPGRADE_SAFETY_MAX + 1, size=len(df))
+        rand_power = self.rng.integers(UPGRADE_POWER_MIN, UPGRADE_POWER_MAX + 1, size=len(df))
+        rand_reliability = self.rng.integers(UPGRADE_RELIABILITY_MIN, UPGRADE_RELIABILITY_MAX + 1, size=len(df))
+        rand_safety = self.rng.integers(UPGRADE_SAFETY_MIN, UPGRADE_SAFETY_MAX + 1, size=len(df))
 
         df["power"] += rand_power
         df["reliability"] += rand_power - rand_reliability
@@ -192,22 +255,11 @@ class ManufacturerModel:
         Convert {manufacture_id: [parts]} to {manufacturer_name: [parts]}.
         If manufacture_id does not exist, the key becomes "" (empty string).
         """
-        df = self.manufacturers
-
-        if df is None or df.empty:
-            # Every ID becomes empty string
-            return {"": parts for _, parts in manu_dict.items()}
-
-        # Build lookup: "0" -> "Ferrari"
-        lookup = (
-            df.assign(mid_norm=df["manufacture_id"].astype(str))
-            .set_index("mid_norm")["name"]
-            .to_dict()
-        )
+        registry = self.get_registry()
 
         result = {}
         for mid, parts in manu_dict.items():
-            name = lookup.get(str(mid), "")
+            name = registry.value(mid, "name", "")
             result[name] = parts
 
         return result
@@ -0,0 +1,125 @@
+from bisect import bisect_left
+from collections.abc import Hashable, Iterable
+
+import pandas as pd
+
+# results column -> part type reported for manufacturers
+PART_COLUMNS = {"engine_id": "engine", "chassi_id": "chassi", "pneu_id": "pneu"}
+
+
+class ParticipantLog:
+    """Ordered sets of the series, teams, drivers and manufacturer parts seen in results.
+
+    IDs are kept in order of first appearance and only grow as results are
+    appended, so a consumer that remembers how many IDs it has seen can ask for
+    the new ones only. ``epoch`` changes whenever the log is rebuilt from scratch.
+    """
+
+    ID_COLUMNS = ("series_id", "team_id", "driver_id")
+
+    def __init__(self):
+        self.epoch = 0
+        self._ids: dict[str, list] = {}
+        self._seen: dict[str, set] = {}
+        self._parts: list[tuple[int, str]] = []
+        self._seen_parts: set[tuple[int, str]] = set()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every participant and start a new epoch."""
+        self.epoch += 1
+        self._ids = {col: [] for col in self.ID_COLUMNS}
+        self._seen = {col: set() for col in self.ID_COLUMNS}
+        self._parts = []
+        self._seen_parts = set()
+
+    def add(self, rows: pd.DataFrame) -> None:
+        """Record the participants of newly appended result rows."""
+        if not isinstance(rows, pd.DataFrame) or rows.empty:
+            return
+        for col in self.ID_COLUMNS:
+            if col in rows.columns:
+                self._add_ids(self._ids[col], self._seen[col], self._unique_ids(rows[col]))
+
+        # Manufacturers are only reported when all part columns exist
+        if all(col in rows.columns for col in PART_COLUMNS):
+            pairs = [(mid, part) for col, part in PART_COLUMNS.items() for mid in self._unique_ids(rows[col])]
+            self._add_ids(self._parts, self._seen_parts, pairs)
+
+    @staticmethod
+    def _unique_ids(column: pd.Series) -> list:
+        """Return distinct non-null IDs as ints (or strings if they are not numeric), first seen first."""
+        values = column.dropna()
+        try:
+            values = values.astype(int)
+        except (TypeError, ValueError):
+            values = values.astype(str)
+        return pd.unique(values).tolist()
+
+    @staticmethod
+    def _add_ids(ordered: list, seen: set, values: Iterable) -> None:
+        for value in values:
+            if value not in seen:
+                seen.add(value)
+                ordered.append(value)
+
+    # --- Lookups ---
+    def ids(self, col: str, start: int = 0) -> list:
+        """Return the IDs of a column in order of first appearance, from position start on."""
+        return self._ids.get(col, [])[start:]
+
+    def count(self, col: str) -> int:
+        return len(self._ids.get(col, []))
+
+    def parts(self, start: int = 0) -> list[tuple[int, str]]:
+        """Return (manufacture_id, part type) pairs in order of first appearance, from position start on."""
+        return self._parts[start:]
+
+
+class SortedNames:
+    """Display labels of participants kept sorted as they are added.
+
+    Entries are (sort key, id, label) tuples; labels() returns the labels in
+    sort-key order without re-sorting, so adding k entries costs O(k log n).
+    """
+
+    def __init__(self, token: tuple = ()):
+        self.token = token
+        self._entries: list[tuple] = []
+        self._labels: list[str] = []
+        self._by_id: dict[Hashable, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, id_value) -> bool:
+        return id_value in self._by_id
+
+    def ids(self) -> list:
+        return list(self._by_id)
+
+    def add(self, entries: Iterable[tuple]) -> None:
+        """Insert (sort key, id, label) entries; IDs already present are ignored."""
+        for entry in entries:
+            if entry[1] in self._by_id:
+                continue
+            pos = bisect_left(self._entries, entry)
+            self._entries.insert(pos, entry)
+            self._labels.insert(pos, entry[2])
+            self._by_id[entry[1]] = entry
+
+    def pop(self, ids: Iterable) -> list[tuple]:
+        """Remove the given IDs and return their entries."""
+        removed = []
+        for id_value in ids:
+            entry = self._by_id.pop(id_value, None)
+            if entry is None:
+                continue
+            pos = bisect_left(self._entries, entry)
+            del self._entries[pos]
+            del self._labels[pos]
+            removed.append(entry)
+        return removed
+
+    def labels(self) -> list[str]:
+        return list(self._labels)
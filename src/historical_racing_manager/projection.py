@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager.consts import SPEED_MULTIPLIER, STANDINGS_TYPES
+from historical_racing_manager.season import CRASH, DEATH, GOOD, _rank_finishers, car_stats
+
+PROJECTION_COLUMNS = ["subject_id", "points", "title", "podium", "mean_points", "p10_points", "p90_points",
+                      "mean_position"]
+
+
+def project_championship(grid: dict[str, np.ndarray], rounds: pd.DataFrame, corners: np.ndarray,
+                         cts: dict[str, int], points: np.ndarray,
+                         current: dict[str, tuple[np.ndarray, np.ndarray]], sims: int,
+                         rng: np.random.Generator | None = None, chunk: int = 2000) -> dict[str, pd.DataFrame]:
+    """
+    Simulate the remaining championship rounds sims times and summarise the final standings.
+
+    Uses the outcome, ranking and points logic of simulate_season_batch as one
+    (sims x races x cars) computation, with its own random generator, so nothing
+    of the game (including its random streams) is touched. Simulations
+    run in chunks of ``chunk`` to bound memory.
+
+    Parameters
+    ----------
+    grid : dict[str, np.ndarray]
+        Per-car arrays as for simulate_season_batch.
+    rounds : pd.DataFrame
+        Championship races still to run, in running order.
+    corners : np.ndarray
+        Number of corners of each round's layout.
+    cts : dict[str, int]
+        Number of cars counting for each standings type.
+    points : np.ndarray
+        Points awarded per finishing position (index 0 = winner).
+    current : dict[str, tuple[np.ndarray, np.ndarray]]
+        Per standings type, (subject_ids, points) of the current standings.
+    sims : int
+        Number of simulated season endings.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        Per standings type, one row per subject (PROJECTION_COLUMNS): current points,
+        title and podium probability, final points mean/10th/90th percentile and
+        mean final position; ordered by title chance, then mean points.
+    """
+    rng = rng or np.random.default_rng()
+    n_cars = len(grid["driver_id"])
+    n_rounds = len(rounds) if n_cars else 0
+
+    # Subjects: everyone on the grid plus everyone already in the standings
+    subjects, car_subject, start = {}, {}, {}
+    for typ in STANDINGS_TYPES:
+        ids, pts = current.get(typ, (np.empty(0, dtype="int64"), np.empty(0, dtype="int64")))
+        subjects[typ] = np.union1d(np.asarray(ids, dtype="int64"), grid[f"{typ}_id"].astype("int64"))
+        car_subject[typ] = np.searchsorted(subjects[typ], grid[f"{typ}_id"].astype("int64"))
+        start[typ] = np.zeros(len(subjects[typ]), dtype="int64")
+        start[typ][np.searchsorted(subjects[typ], np.asarray(ids, dtype="int64"))] = np.asarray(pts, dtype="int64")
+
+    if n_rounds:
+        speed, reliability, safety, grid_order = car_stats(grid, rounds, corners)
+        slot = np.arange(n_cars)
+        slot_points = np.zeros(n_cars, dtype="int64")
+        slot_points[:min(len(points), n_cars)] = points[:n_cars]
+
+    finals: dict[str, list[np.ndarray]] = {typ: [] for typ in STANDINGS_TYPES}
+    for done in range(0, sims, chunk):
+        n = min(chunk, sims - done)
+        if not n_rounds:
+            for typ in STANDINGS_TYPES:
+                finals[typ].append(np.broadcast_to(start[typ], (n, len(start[typ]))))
+            continue
+
+        # --- Outcomes of every (sim, race, car) ---
+        shape = (n, n_rounds, n_cars)
+        rnd1 = rng.integers(0, np.maximum(speed * SPEED_MULTIPLIER, 1), size=shape)
+        rnd2 = rng.integers(0, speed + 1, size=shape)
+        failed = (speed <= 0) | (rnd1 < reliability)
+        outcome = np.where(failed, np.where((speed > 0) & (rnd2 < safety), DEATH, CRASH), GOOD)
+
+        # Finishers first in grid order, then ranked; sims and races flattened into rows
+        order = np.broadcast_to(grid_order, shape).reshape(-1, n_cars)
+        outcome = outcome.reshape(-1, n_cars)
+        entries = np.take_along_axis(
+            order, np.argsort(np.take_along_axis(outcome, order, axis=1), axis=1, kind="stable"), axis=1)
+        finishers = (outcome == GOOD).sum(axis=1)
+        entries = _rank_finishers(entries, finishers, rng)
+        entry_points = np.where(slot[None, :] < finishers[:, None], slot_points[None, :], 0)
+
+        sim_of_row = np.repeat(np.arange(n), n_rounds)
+        for typ in STANDINGS_TYPES:
+            k = len(subjects[typ])
+            subject = car_subject[typ][entries]
+            scored = entry_points * (_occurrence(subject) < cts.get(typ, 1))
+            totals = np.bincount((sim_of_row[:, None] * k + subject).ravel(), weights=scored.ravel(),
+                                 minlength=n * k).reshape(n, k).astype("int64")
+            finals[typ].append(start[typ][None, :] + totals)
+
+    return {typ: _summarise(subjects[typ], start[typ], np.concatenate(finals[typ])) for typ in STANDINGS_TYPES}
+
+
+def _occurrence(subject: np.ndarray) -> np.ndarray:
+    """For each entry, how many entries of the same subject finished ahead of it in its row."""
+    n_cars = subject.shape[1]
+    order = np.argsort(subject, axis=1, kind="stable")
+    ordered = np.take_along_axis(subject, order, axis=1)
+    slot = np.broadcast_to(np.arange(n_cars), ordered.shape)
+    first = np.ones(ordered.shape, dtype=bool)
+    first[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    group_start = np.maximum.accumulate(np.where(first, slot, 0), axis=1)
+    occurrence = np.empty_like(subject)
+    np.put_along_axis(occurrence, order, slot - group_start, axis=1)
+    return occurrence
+
+
+def _summarise(subjects: np.ndarray, start: np.ndarray, final: np.ndarray) -> pd.DataFrame:
+    """Title/podium chances and points distribution from (sims x subjects) final points."""
+    if len(subjects) == 0:
+        return pd.DataFrame(columns=PROJECTION_COLUMNS)
+    # Competition ranking, as in the standings: equal points share the position
+    position = 1 + (final[:, None, :] > final[:, :, None]).sum(axis=2)
+    summary = pd.DataFrame({
+        "subject_id": subjects,
+        "points": start,
+        "title": (position == 1).mean(axis=0),
+        "podium": (position <= 3).mean(axis=0),
+        "mean_points": final.mean(axis=0),
+        "p10_points": np.percentile(final, 10, axis=0),
+        "p90_points": np.percentile(final, 90, axis=0),
+        "mean_position": position.mean(axis=0),
+    }, columns=PROJECTION_COLUMNS)
+    return summary.sort_values(["title", "mean_points", "subject_id"], ascending=[False, False, True],
+                               kind="stable").reset_index(drop=True)
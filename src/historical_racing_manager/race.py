@@ -1,10 +1,18 @@
 import pathlib
-import random as rd
-from datetime import datetime, timedelta
+import shutil
+from datetime import datetime
 
 import numpy as np
 import pandas as pd
 
+from historical_racing_manager.archive import ARCHIVE_TABLES, SeasonArchive
+from historical_racing_manager.catalog import PartCatalog
+from historical_racing_manager.participants import ParticipantLog
+from historical_racing_manager.projection import project_championship
+from historical_racing_manager.registry import Registry
+from historical_racing_manager.season import SeasonBatch, simulate_season_batch
+from historical_racing_manager.standings import StandingsLedger
+from historical_racing_manager.storage import HistoryStore
 from historical_racing_manager.consts import (
     FILE_STANDS,
     FILE_RACES,
@@ -12,6 +20,11 @@ from historical_racing_manager.consts import (
     FILE_RESULTS,
     FILE_CIRCUITS,
     FILE_CIRCUIT_LAYOUTS,
+    FILE_FINAL_STANDINGS,
+    FILE_RESULT_SUMMARIES,
+    ARCHIVE_DIR,
+    FINAL_STANDINGS_COLUMNS,
+    RESULT_SUMMARY_COLUMNS,
     RACE_REQUIRED_FILES,
     DAYS_PER_SEASON,
     RACE_WEEKDAY,
@@ -24,141 +37,199 @@ from historical_racing_manager.consts import (
     SPEED_MULTIPLIER,
     CRASH_CODE,
     DEATH_CODE,
+    PART_TYPES,
+    PROJECTION_SIMS,
+    RESULT_COLUMNS,
+    STANDINGS_TYPES,
 )
+from historical_racing_manager.versioning import mutates
 
 
 class RaceModel:
     def __init__(self):
+        self.version = 0
         self.results = pd.DataFrame()
         self.races = pd.DataFrame()
-        self.standings = pd.DataFrame()
+        # Championship standings as per-round point deltas; self.standings is the block view of it
+        self.standings_ledger = StandingsLedger()
         self.point_system = pd.DataFrame()
         self.circuits = pd.DataFrame()
         self.circuit_layouts = pd.DataFrame()
+        # Compiled lookups over the static tables
+        self.layout_registry = Registry("layout_id", group_col="circuit_id")
+        self.series_names = Registry("series_id", "name")
 
         self.crashes = 0
         self.deaths = 0
         self.f1_races = 0
+        # Random stream; the controller binds the game's (see rng.RandomStreams)
+        self.rng = np.random.default_rng()
+
+        # (series_id, year) -> (cache token, assembled cars); see get_season_cars
+        self.season_cars: dict[tuple[int, int], tuple[tuple, dict[str, np.ndarray]]] = {}
+        # One row per (series, season, typ, subject) of every finished season
+        self.final_standings = pd.DataFrame(columns=FINAL_STANDINGS_COLUMNS)
+        # (series_id, year) -> latest standings block of seasons still running
+        self.open_standings: dict[tuple[int, int], pd.DataFrame] = {}
+        self._final_index: tuple[tuple, dict] = ((), {})
+        self._standings_token: tuple = ()
+        self._champ_rounds: tuple[tuple, dict[tuple[int, int], int]] = ((), {})
+        # (typ, subject_id) -> {(season, series_id): [races, wins, podiums, best_result]}
+        self.season_summary: dict[tuple[str, int], dict[tuple[int, int], list[int]]] = {}
+        self._results_token: tuple = ()
+        # (series_id, season) -> number of result rows, and the cached pivot built from them
+        self.season_result_rows: dict[tuple[int, int], int] = {}
+        self.result_pivots: dict[tuple[int, int], tuple[tuple, pd.DataFrame]] = {}
+        # Series, teams, drivers and manufacturer parts that appear in results
+        self.participants = ParticipantLog()
+        # Result rows of the race recorded last; see feed.race_finished
+        self.last_results = pd.DataFrame(columns=RESULT_COLUMNS)
+
+        # series_id -> pre-simulated rounds sharing the current grid; see run_race
+        self.season_batches: dict[int, SeasonBatch] = {}
+
+        # Optional SQLite history; results, standings and finals are written through to it
+        self.store: HistoryStore | None = None
+        # Seasons moved out of results/standings; see archive_seasons
+        self.archive: SeasonArchive | None = None
+        # Season summaries of results dropped by the retention policy; see collapse_results
+        self.result_summaries = pd.DataFrame(columns=RESULT_SUMMARY_COLUMNS)
+        # table -> seasons before this year were pruned from it in this session
+        self.pruned_before: dict[str, int] = {}
 
     # ===== Persistence =====
+    @mutates
     def load(self, folder: pathlib.Path) -> bool:
         """
         Load required race-related CSV files from folder into the model.
+        With a store attached, results and standings are read from it instead.
         Returns True if all required files exist and were loaded, False otherwise.
         """
-        required = RACE_REQUIRED_FILES
+        store = self.store if self.store is not None and self.store.has_table("results") else None
+        required = [f for f in RACE_REQUIRED_FILES if not (store is not None and f in (FILE_RESULTS, FILE_STANDS))]
 
         missing = [f for f in required if not (folder / f).exists()]
         if missing:
             return False
 
-        self.standings = pd.read_csv(folder / FILE_STANDS)
         self.races = pd.read_csv(folder / FILE_RACES)
         if not self.races.empty and "race_date" in self.races.columns:
             # Parse race_date column into pandas datetime
             self.races["race_date"] = pd.to_datetime(self.races["race_date"], errors="coerce")
 
         self.point_system = pd.read_csv(folder / FILE_POINT_SYSTEM)
-        self.results = pd.read_csv(folder / FILE_RESULTS)
         self.circuits = pd.read_csv(folder / FILE_CIRCUITS)
         self.circuit_layouts = pd.read_csv(folder / FILE_CIRCUIT_LAYOUTS)
+        self.layout_registry.refresh(self.circuit_layouts)
+        self.season_batches = {}
+
+        archive_path = folder / ARCHIVE_DIR
+        if self.archive is not None:
+            self.archive.close()
+        self.archive = SeasonArchive.open_copy(archive_path) if archive_path.exists() else None
+        summaries_path = folder / FILE_RESULT_SUMMARIES
+        self.result_summaries = (
+            pd.read_csv(summaries_path) if summaries_path.exists()
+            else pd.DataFrame(columns=RESULT_SUMMARY_COLUMNS)
+        )
+        self.pruned_before = {}
+
+        if store is not None:
+            # Only the seasons that are not archived
+            live = {}
+            for table, season_col in ARCHIVE_TABLES.items():
+                before = self.archive.before.get(table, -1) if self.archive is not None else -1
+                live[table] = store.read(table, f'"{season_col}" >= ?', (before,))
+            self.results = live["results"]
+            self.standing_deltas = live["standings"]
+            final = store.read("final_standings") if store.has_table("final_standings") else None
+        else:
+            self.results = pd.read_csv(folder / FILE_RESULTS)
+            self.standings = pd.read_csv(folder / FILE_STANDS)
+            final_path = folder / FILE_FINAL_STANDINGS
+            final = pd.read_csv(final_path) if final_path.exists() else None
+        self._rebuild_season_finals(final)
         return True
 
     def save(self, folder: pathlib.Path) -> None:
         """
         Save model DataFrames to CSV files under folder.
+        Results and standings are left to the store when one is attached.
         If folder is falsy, do nothing.
         """
         if not folder:
             return
         self.races.to_csv(folder / FILE_RACES, index=False)
-        self.standings.to_csv(folder / FILE_STANDS, index=False)
         self.point_system.to_csv(folder / FILE_POINT_SYSTEM, index=False)
-        self.results.to_csv(folder / FILE_RESULTS, index=False)
         self.circuits.to_csv(folder / FILE_CIRCUITS, index=False)
         self.circuit_layouts.to_csv(folder / FILE_CIRCUIT_LAYOUTS, index=False)
+        self.result_summaries.to_csv(folder / FILE_RESULT_SUMMARIES, index=False)
+        if self.store is None:
+            self.standing_deltas.to_csv(folder / FILE_STANDS, index=False)
+            self.results.to_csv(folder / FILE_RESULTS, index=False)
+            self.final_standings.to_csv(folder / FILE_FINAL_STANDINGS, index=False)
+
+        archive_path = folder / ARCHIVE_DIR
+        if self.archive is not None:
+            self.archive.save_to(archive_path)
+        elif archive_path.exists():
+            shutil.rmtree(archive_path)
+
+    # ===== Standings =====
+    @property
+    def standings(self) -> pd.DataFrame:
+        """Every championship round's full standings block, rebuilt from the ledger."""
+        return self.standings_ledger.blocks()
+
+    @standings.setter
+    def standings(self, df: pd.DataFrame) -> None:
+        # Accepts stored deltas as well as full blocks
+        self.standings_ledger = StandingsLedger.from_frame(df)
+
+    @property
+    def standing_deltas(self) -> pd.DataFrame:
+        """The stored form of the standings: one row per subject and round whose points changed."""
+        return self.standings_ledger.frame()
+
+    @standing_deltas.setter
+    def standing_deltas(self, df: pd.DataFrame) -> None:
+        self.standings_ledger = StandingsLedger.from_frame(df)
+
+    def get_standings(self, year: int | None = None) -> pd.DataFrame:
+        """Full standings blocks of every round (of one year), as stored in standings before."""
+        return self.standings_ledger.blocks(year)
+
+    def _stored(self, table: str, frame: pd.DataFrame) -> bool:
+        """True if the attached store holds exactly the rows of frame and its archived seasons."""
+        archived = self.archive.rows.get(table, 0) if self.archive is not None else 0
+        return self.store is not None and self.store.counts.get(table) == len(frame) + archived > 0
 
     # ===== Queries =====
     def get_raced_series(self) -> list[int]:
         """
         Return unique series_id values from self.results as a list of ints,
         preserving the order of first appearance.
-        Assumption: self.results is a pandas.DataFrame.
         """
-        # type check
-        if not isinstance(self.results, pd.DataFrame):
-            # if it's not a DataFrame, return an empty list
-            return []
-
-        # check if the column exists
-        if "series_id" not in self.results.columns:
-            return []
-
-        # select the column, drop NA values, attempt to convert to int,
-        # preserve first-occurrence order using drop_duplicates
-        series = self.results["series_id"].dropna()
-
-        try:
-            series_int = series.astype(int)
-        except Exception:
-            # if conversion fails (e.g., text IDs), return unique values as strings
-            return series.astype(str).drop_duplicates(keep="first").tolist()
-
-        return series_int.drop_duplicates(keep="first").tolist()
+        return self.get_participants().ids("series_id")
 
     def get_raced_teams(self) -> list[int]:
         """
         Return unique team_id values from self.results as a list of ints,
         preserving the order of first appearance.
-        Assumption: self.results is a pandas.DataFrame.
         """
-        # type check
-        if not isinstance(self.results, pd.DataFrame):
-            # if it's not a DataFrame, return an empty list
-            return []
-
-        # check if the column exists
-        if "team_id" not in self.results.columns:
-            return []
-
-        # select the column, drop NA values, attempt to convert to int,
-        # preserve first-occurrence order using drop_duplicates
-        series = self.results["team_id"].dropna()
-
-        try:
-            series_int = series.astype(int)
-        except Exception:
-            # if conversion fails (e.g., text IDs), return unique values as strings
-            return series.astype(str).drop_duplicates(keep="first").tolist()
-
-        return series_int.drop_duplicates(keep="first").tolist()
+        return self.get_participants().ids("team_id")
 
     def get_raced_drivers(self) -> list[int]:
         """
         Return unique driver_id values from self.results as a list of ints,
         preserving the order of first appearance.
-        Assumption: self.results is a pandas.DataFrame.
         """
-        # type check
-        if not isinstance(self.results, pd.DataFrame):
-            # if it's not a DataFrame, return an empty list
-            return []
-
-        # check if the column exists
-        if "driver_id" not in self.results.columns:
-            return []
-
-        # select the column, drop NA values, attempt to convert to int,
-        # preserve first-occurrence order using drop_duplicates
-        series = self.results["driver_id"].dropna()
+        return self.get_participants().ids("driver_id")
 
-        try:
-            series_int = series.astype(int)
-        except Exception:
-            # if conversion fails (e.g., text IDs), return unique values as strings
-            return series.astype(str).drop_duplicates(keep="first").tolist()
-
-        return series_int.drop_duplicates(keep="first").tolist()
+    def get_participants(self) -> ParticipantLog:
+        """Return the participant log, rebuilding it if self.results was replaced."""
+        self._sync_season_summary()
+        return self.participants
 
     def get_next_race_date(self, date: datetime):
         """
@@ -184,39 +255,12 @@ class RaceModel:
             12: ["chassi"],
         }
         """
-
-        if not isinstance(self.results, pd.DataFrame):
-            return {}
-
-        # required columns
-        columns = {
-            "engine_id": "engine",
-            "chassi_id": "chassi",
-            "pneu_id": "pneu"
-        }
-
-        for col in columns:
-            if col not in self.results.columns:
-                return {}
-
         manufacturer_map: dict[int, set[str]] = {}
-
-        # iterate each part column
-        for col, part_name in columns.items():
-            series = self.results[col].dropna()
-
-            # convert to int safely
-            try:
-                ids = series.astype(int).tolist()
-            except Exception:
-                ids = series.astype(str).tolist()
-
-            # add to dictionary
-            for manufacturer_id in ids:
-                manufacturer_map.setdefault(manufacturer_id, set()).add(part_name)
+        for manufacturer_id, part_name in self.get_participants().parts():
+            manufacturer_map.setdefault(manufacturer_id, set()).add(part_name)
 
         # convert sets to sorted lists
-        return {mid: sorted(list(parts)) for mid, parts in manufacturer_map.items()}
+        return {mid: sorted(parts) for mid, parts in manufacturer_map.items()}
 
     def extract_champions(self, series_id: int, series: pd.DataFrame, manufacturers: pd.DataFrame,
                           teams: pd.DataFrame, drivers: pd.DataFrame) -> pd.DataFrame:
@@ -228,15 +272,8 @@ class RaceModel:
         The function enriches the pivot with human-readable names for drivers, teams,
         and manufacturers when those columns are present.
         """
-        # keep only rows for the requested series
-        s = self.standings[self.standings['series_id'] == series_id].copy()
-
-        # compute max round per year and typ (if you want final per typ separately).
-        # If final should be per year regardless of typ, group only by 'year' instead of ['year','typ'].
-        s['max_round'] = s.groupby(['year', 'typ'])['round'].transform('max')
-
-        # keep only rows that correspond to the final round for that year/typ
-        final_round_rows = s[s['round'] == s['max_round']].copy()
+        # end-of-season (or latest, for a running season) standings of the series
+        final_round_rows = self.get_season_finals(series_id=series_id)
 
         # now pick champions (position == 1) from those final-round rows
         champions = final_round_rows[final_round_rows['position'] == 1].copy()
@@ -253,8 +290,7 @@ class RaceModel:
         pivot.insert(0, 'series_id', series_id)
 
         # Get series name label
-        series_name = series.loc[series["series_id"] == series_id, "name"].values
-        series_label = series_name[0] if len(series_name) > 0 else None
+        series_label = self.series_names.ensure(series).value(series_id, "name")
         pivot.insert(1, 'series', series_label)
 
         # If driver column exists, merge driver names and create a driver_name column
@@ -340,93 +376,72 @@ class RaceModel:
             return pd.DataFrame(columns=["Date", "Race Name", "Series", "Country"])
 
     def get_results_for_series_and_season(self, series_id: int, season: int) -> pd.DataFrame:
+        columns = ["driver_id", "team_id", "engine_id", "chassi_id", "pneu_id", "race_id", "position", "round"]
+        store = self.store
+        if store is not None and self._stored("results", self.results):
+            return store.season_results(series_id, season, columns)
+        if self.archive is not None and self.archive.has_season("results", season):
+            return self.archive.season("results", series_id, season).reindex(columns=columns)
         df = self.results[
             (self.results["series_id"] == series_id) & (self.results["season"] == season)
-            ][
-            ["driver_id", "team_id", "engine_id", "chassi_id", "pneu_id", "race_id", "position", "round"]
-        ].copy()
+            ][columns].copy()
         return df.reset_index(drop=True)
 
     def get_subject_season_stands(self, subject_id: int, subject_type: str, series: pd.DataFrame) -> pd.DataFrame:
         """
-        Return seasonal statistics for a subject (driver/team), using RESULTS as the primary source.
-        If standings exist for that season, attach points and championship position.
-        """
-
-        # --- 1) Primárny zdroj: RESULTS ---
-        subject_results = self.results[
-            (self.results[f"{subject_type}_id"] == subject_id)
-        ].copy()
+        Return seasonal statistics for a subject (driver/team/engine/chassi/pneu).
 
-        if subject_results.empty:
+        Race counts come from the season summary kept in step with RESULTS; points
+        and championship position are attached from the season finals if they exist.
+        """
+        store = self.store
+        if store is not None and self._stored("results", self.results):
+            # Seasons collapsed by the retention policy are no longer in the store
+            seasons = {**self._summarised_seasons(subject_type, subject_id),
+                       **store.subject_seasons(subject_type, subject_id)}
+        else:
+            self._sync_season_summary()
+            seasons = self.season_summary.get((subject_type, int(subject_id)), {})
+        if not seasons:
             return pd.DataFrame()
 
-        # Získame všetky sezóny a series_id, kde subjekt pretekal
-        grouped = subject_results.groupby(["season", "series_id"])
+        # Konečné (alebo priebežné) poradie subjektu v každej sezóne
+        finals = self.get_season_finals(typ=subject_type, subject_id=subject_id)
+        final_by_season = {
+            (int(row.year), int(row.series_id)): row
+            for row in finals.itertuples(index=False)
+        }
+        names = self.series_names.ensure(series)
 
         records = []
-
-        for (year, series_id), group in grouped:
-            group = group.copy()
-
-            # --- 2) Výpočty z RESULTS ---
-            wins = (group["position"] == 1).sum()
-            podiums = (group["position"] <= 3).sum()
-            best_position = group["position"].min()
-            races = group["race_id"].nunique()
-
-            # --- 3) Pokus o načítanie standings pre túto sezónu ---
-            stand_row = self.standings[
-                (self.standings["subject_id"] == subject_id) &
-                (self.standings["typ"] == subject_type) &
-                (self.standings["year"] == year) &
-                (self.standings["series_id"] == series_id)
-                ]
-
-            if not stand_row.empty:
-                # nájdeme posledné kolo (najvyšší round)
-                stand_row = stand_row.copy()
-                stand_row["round"] = pd.to_numeric(stand_row["round"], errors="coerce")
-                last = stand_row.loc[stand_row["round"].idxmax()]
-
-                points = last["points"]
-                championship = last["position"]
-            else:
-                points = None
-                championship = None
-
-            # --- 4) Series name ---
-            series_name = series.loc[series["series_id"] == series_id, "name"].values
-            series_label = series_name[0] if len(series_name) > 0 else None
-
+        for (year, series_id), (races, wins, podiums, best_position) in sorted(seasons.items()):
+            last = final_by_season.get((year, series_id))
             records.append({
                 "season": year,
-                "series": series_label,
+                "series": names.value(series_id, "name"),
                 "races": races,
                 "wins": wins,
                 "podiums": podiums,
                 "best_result": best_position,
-                "points": points,
-                "championship": championship,
+                "points": last.points if last is not None else None,
+                "championship": last.position if last is not None else None,
             })
 
         return pd.DataFrame(records)
 
     def get_seasons_for_series(self, series_id: int) -> list[int]:
-        if self.results.empty:
-            return []
-        seasons = self.results.loc[self.results["series_id"] == series_id, "season"].unique()
-        return sorted(seasons.tolist())
+        store = self.store
+        if store is not None and self._stored("results", self.results):
+            return store.series_seasons(series_id)
+        # Row counts per series-season also cover archived seasons
+        self._sync_season_summary()
+        return sorted(season for sid, season in self.season_result_rows if sid == series_id)
 
     def all_time_best(self, drivers_model, series_id: int) -> pd.DataFrame:
-        filtered = self.standings[
-            (self.standings["series_id"] == series_id) & (self.standings["typ"] == "driver")
-            ]
-        if filtered.empty:
+        result = self.get_season_finals(series_id=series_id, typ="driver")
+        if result.empty:
             return pd.DataFrame()
 
-        max_rounds = filtered.groupby("year")["round"].max().reset_index()
-        result = pd.merge(filtered, max_rounds, on=["year", "round"])
         result = result.rename(columns={"subject_id": "driver_id"})
 
         position_counts = result.pivot_table(
@@ -441,95 +456,758 @@ class RaceModel:
 
     def pivot_results_by_race(self, series_id: int, season: int, manufacturers: pd.DataFrame,
                               fill_value=None) -> pd.DataFrame:
-        df = self.get_results_for_series_and_season(series_id, season)
-        # Create mapping from manufacturer ID to manufacturer name
-        manu_map = manufacturers.set_index("manufacture_id")["name"].to_dict()
+        """
+        Return one row per (driver, team, engine, chassi, pneu) with the position in each race.
 
+        The pivot of a series-season is cached and rebuilt only when results of that
+        season are recorded or the manufacturers table changes, so finished seasons
+        are built once. Final position and points are attached on every call.
+        """
+        self._sync_season_summary()
+        key = (int(series_id), int(season))
+        token = (self.season_result_rows.get(key, 0), id(manufacturers), len(manufacturers), fill_value)
+        cached = self.result_pivots.get(key)
+        if cached is None or cached[0] != token:
+            pivot = self._build_results_pivot(series_id, season, manufacturers, fill_value)
+            self.result_pivots[key] = (token, pivot)
+        else:
+            pivot = cached[1]
+        pivot = pivot.copy()
+
+        # If championship rounds exist, attach final position and points for drivers
+        if "1" in pivot.columns:
+            st2 = self.get_season_finals(series_id=series_id, typ="driver", year=season)
+            if not st2.empty:
+                final = st2.rename(
+                    columns={
+                        "subject_id": "driver_id",
+                        "position": "final_position",
+                        "points": "final_points",
+                    }
+                )[["driver_id", "final_position", "final_points"]]
+                secondary = pivot.pop("secondary_position")
+                pivot = pivot.merge(final, on="driver_id", how="left")
+                pivot["secondary_position"] = secondary.to_numpy()
+        return pivot
+
+    def _build_results_pivot(self, series_id: int, season: int, manufacturers: pd.DataFrame,
+                             fill_value=None) -> pd.DataFrame:
+        """Build the race-by-race pivot of a series-season, sorted by position counts."""
+        df = self.get_results_for_series_and_season(series_id, season)
         if df.empty:
             return pd.DataFrame()
 
-        df["round"] = df["round"].fillna(0).astype(int)
-        df["position"] = df["position"].replace({CRASH_CODE: "Crash", DEATH_CODE: "Death"})
+        # Races in running order; non-championship races (round == 0) are labelled NC1, NC2, ...
+        race_ids = df["race_id"].astype("int64").to_numpy()
+        rounds = df["round"].fillna(0).astype("int64").to_numpy()
+        races, race_idx = np.unique(race_ids, return_inverse=True)
+        race_round = np.zeros(len(races), dtype="int64")
+        race_round[race_idx] = rounds
+        nc_no = np.cumsum(race_round == 0)
+        labels = [str(r) if r else f"NC{n}" for r, n in zip(race_round.tolist(), nc_no.tolist())]
+
+        # Rows: one per (driver, team, engine, chassi, pneu) combination
+        key_cols = ["driver_id", "team_id", "engine_id", "chassi_id", "pneu_id"]
+        keys, row_idx = np.unique(df[key_cols].to_numpy(dtype="int64"), axis=0, return_inverse=True)
+        row_idx = row_idx.reshape(-1)
+        n_rows, n_races = len(keys), len(races)
+
+        # Cells: finishing positions, "Crash"/"Death" codes, fill for races not driven
+        position = df["position"].to_numpy(dtype="int64")
+        codes = {CRASH_CODE: "Crash", DEATH_CODE: "Death"}
+        is_code = np.isin(position, list(codes))
+        filled = np.zeros((n_rows, n_races), dtype=bool)
+        filled[row_idx, race_idx] = True
+        cells = np.empty((n_rows, n_races), dtype=object)
+        cells[row_idx, race_idx] = [codes[p] if c else p for p, c in zip(position.tolist(), is_code.tolist())]
+        # Any code in the season turns every race column into text, as the pivot of the mixed column did
+        as_text = bool(is_code.any())
+
+        fill = "" if fill_value is None else fill_value
+        manu_map = manufacturers.set_index("manufacture_id")["name"].to_dict()
+        pivot = pd.DataFrame({
+            "driver_id": keys[:, 0],
+            "team_id": keys[:, 1],
+            "engine_id": pd.Series(keys[:, 2]).map(manu_map),
+            "chassi_id": pd.Series(keys[:, 3]).map(manu_map),
+            "pneu_id": pd.Series(keys[:, 4]).map(manu_map),
+        })
+        for j, label in enumerate(labels):
+            if as_text:
+                column = np.where(filled[:, j], cells[:, j], fill)
+            elif filled[:, j].all():
+                column = cells[:, j].astype("int64")
+            else:
+                column = np.where(filled[:, j], cells[:, j], np.nan).astype(float)
+            pivot[label] = column
+
+        # Lexicographic sort on how often each position was reached: (count_1, count_2, ...)
+        finished = ~is_code
+        all_positions, pos_idx = np.unique(position[finished], return_inverse=True)
+        counts = np.zeros((n_rows, len(all_positions)), dtype="int64")
+        np.add.at(counts, (row_idx[finished], pos_idx.reshape(-1)), 1)
+        order = np.lexsort(counts.T[::-1]) if len(all_positions) else np.arange(n_rows)
+
+        pivot = pivot.iloc[order].reset_index(drop=True)
+        pivot["secondary_position"] = range(1, len(pivot) + 1)
+        return pivot
+
+    # ===== Season summary =====
+    @mutates
+    def _record_results(self, rows: pd.DataFrame) -> None:
+        """Append the result rows of one race and add them to the season summary."""
+        self._sync_season_summary()
+        if self.results.empty:
+            self.results = rows.reindex(columns=self.results.columns.union(RESULT_COLUMNS, sort=False))
+        else:
+            self.results = pd.concat([self.results, rows], ignore_index=True)
+        self._results_token = (id(self.results), len(self.results))
+        self.last_results = rows
+        self._add_to_season_summary(rows)
+        self.participants.add(rows)
+        if self.store is not None:
+            self.store.append("results", rows)
+
+    def _sync_season_summary(self) -> None:
+        """Rebuild the summary and participants if self.results was replaced outside _record_results."""
+        if self._results_token != (id(self.results), len(self.results)):
+            self.season_summary = {}
+            self.season_result_rows = {}
+            self._results_token = (id(self.results), len(self.results))
+            self.participants.reset()
+            # Archived seasons first, read once per rebuild
+            for part in (self.archive.frames("results") if self.archive is not None else []):
+                self._add_to_season_summary(part)
+                self.participants.add(part)
+            self._add_summary_rows(self.result_summaries)
+            self._add_to_season_summary(self.results)
+            self.participants.add(self.results)
+
+    def _add_to_season_summary(self, rows: pd.DataFrame) -> None:
+        """
+        Fold result rows into season_summary and the per-season row counts.
+
+        Every race's rows must arrive in the same call, so distinct race_ids per
+        (subject, season, series) can simply be added to the stored race count.
+        """
+        required = {"race_id", "position", "season", "series_id"}
+        if rows.empty or not required.issubset(rows.columns):
+            return
+
+        def as_int(col: str) -> np.ndarray:
+            return pd.to_numeric(rows[col], errors="coerce").fillna(-1).astype("int64").to_numpy()
+
+        race_ids, position = as_int("race_id"), as_int("position")
+        season, series_id = as_int("season"), as_int("series_id")
+        season_keys, rows_per_season = np.unique(np.stack([series_id, season], axis=1), axis=0, return_counts=True)
+        for (sid, year), n in zip(season_keys.tolist(), rows_per_season.tolist()):
+            self.season_result_rows[(sid, year)] = self.season_result_rows.get((sid, year), 0) + n
+
+        for typ in STANDINGS_TYPES:
+            col = f"{typ}_id"
+            if col not in rows.columns:
+                continue
+            valid = rows[col].notna().to_numpy()
+            keys = np.stack([as_int(col), season, series_id], axis=1)[valid]
+            if len(keys) == 0:
+                continue
+            groups, inverse = np.unique(keys, axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            n = len(groups)
+
+            pos = position[valid]
+            wins = np.bincount(inverse, weights=pos == 1, minlength=n).astype("int64")
+            podiums = np.bincount(inverse, weights=pos <= 3, minlength=n).astype("int64")
+            best = np.full(n, np.iinfo("int64").max)
+            np.minimum.at(best, inverse, pos)
+            races = np.bincount(np.unique(np.stack([inverse, race_ids[valid]]), axis=1)[0], minlength=n)
+
+            for (subject_id, year, sid), r, w, p, b in zip(groups.tolist(), races.tolist(), wins.tolist(),
+                                                           podiums.tolist(), best.tolist()):
+                seasons = self.season_summary.setdefault((typ, subject_id), {})
+                entry = seasons.get((year, sid))
+                if entry is None:
+                    seasons[(year, sid)] = [r, w, p, b]
+                else:
+                    entry[0] += r
+                    entry[1] += w
+                    entry[2] += p
+                    entry[3] = min(entry[3], b)
+
+    def _add_summary_rows(self, summaries: pd.DataFrame) -> None:
+        """Fold collapsed season summaries (RESULT_SUMMARY_COLUMNS) into season_summary and participants."""
+        if summaries.empty:
+            return
+        values = summaries[["typ", "subject_id", "season", "series_id", "races", "wins", "podiums", "best_result"]]
+        for typ, subject_id, year, sid, *entry in values.itertuples(index=False):
+            self.season_summary.setdefault((typ, int(subject_id)), {})[(int(year), int(sid))] = [int(v) for v in entry]
+
+        # One pseudo result row per summary row, so the participant log sees the same IDs
+        ids = pd.DataFrame({"series_id": summaries["series_id"].astype(int)})
+        for typ in STANDINGS_TYPES:
+            ids[f"{typ}_id"] = summaries["subject_id"].where(summaries["typ"] == typ)
+        self.participants.add(ids)
+
+    def _summarised_seasons(self, subject_type: str, subject_id: int) -> dict[tuple[int, int], list[int]]:
+        rows = self.result_summaries[
+            (self.result_summaries["typ"] == subject_type) & (self.result_summaries["subject_id"] == int(subject_id))
+        ]
+        return {
+            (int(row.season), int(row.series_id)): [int(row.races), int(row.wins), int(row.podiums),
+                                                    int(row.best_result)]
+            for row in rows.itertuples(index=False)
+        }
+
+    # ===== Season finals =====
+    @mutates
+    def _record_standings(self, blocks: pd.DataFrame) -> None:
+        """
+        Record one round given as full standings blocks and keep the season finals in step.
+
+        Only the point deltas are stored (see StandingsLedger).
+        """
+        self._sync_season_finals()
+        deltas = self.standings_ledger.add_block(blocks)
+        first = blocks.iloc[0]
+        self._after_standings_round((int(first["series_id"]), int(first["year"])), deltas)
+
+    @mutates
+    def _record_round_points(self, series_id: int, year: int, race_id: int,
+                             points: dict[str, tuple[np.ndarray, np.ndarray]]) -> None:
+        """Record the points each subject scored in the next championship round of a series-season."""
+        self._sync_season_finals()
+        round_no = self.standings_ledger.last_round(series_id, year) + 1
+        deltas = self.standings_ledger.add_round(series_id, year, round_no, race_id, points)
+        self._after_standings_round((int(series_id), int(year)), deltas)
+
+    def _after_standings_round(self, key: tuple[int, int], deltas: pd.DataFrame) -> None:
+        """
+        The latest block becomes the open standings of its series-season; when it
+        belongs to the season's last championship round it is written to final_standings.
+        """
+        self._standings_token = (id(self.standings_ledger), len(self.standings_ledger))
+        if self.store is not None:
+            self.store.append("standings", deltas)
+
+        block = self.standings_ledger.block(*key)
+        self.open_standings[key] = block.reindex(columns=FINAL_STANDINGS_COLUMNS)
+        if int(block["round"].max()) >= self._championship_rounds(*key) > 0:
+            self._finalize_season(key)
+
+    @mutates
+    def finalize_open_seasons(self, before_year: int) -> None:
+        """Write the finals of every open season that ended before before_year."""
+        self._sync_season_finals()
+        for key in [k for k in self.open_standings if k[1] < before_year]:
+            self._finalize_season(key)
+
+    def _finalize_season(self, key: tuple[int, int]) -> None:
+        block = self.open_standings.pop(key)
+        if self.final_standings.empty:
+            self.final_standings = block.reset_index(drop=True)
+        else:
+            self.final_standings = pd.concat([self.final_standings, block], ignore_index=True)
+        if self.store is not None:
+            self.store.append("final_standings", block)
+
+    # ===== Archive =====
+    @mutates
+    def archive_seasons(self, before_year: int) -> None:
+        """
+        Move results and standings of seasons before before_year to the archive.
+
+        The season summary, participants and finals already cover those seasons,
+        so only the live frames shrink; race-by-race views of an archived season
+        read it back from the archive on demand.
+        """
+        self._sync_season_summary()
+        self._sync_season_finals()
+        for table, season_col in ARCHIVE_TABLES.items():
+            frame = self.results if table == "results" else self.standing_deltas
+            if frame.empty or season_col not in frame.columns:
+                continue
+            old = (frame[season_col] < before_year).to_numpy()
+            if not old.any():
+                continue
+            if self.archive is None:
+                self.archive = SeasonArchive()
+            self.archive.append(table, frame[old], before_year)
+            if table == "results":
+                self.results = frame[~old].reset_index(drop=True)
+            else:
+                self.standings_ledger.drop_seasons([k for k in self.standings_ledger.keys() if k[1] < before_year])
+        self._results_token = (id(self.results), len(self.results))
+        self._standings_token = (id(self.standings_ledger), len(self.standings_ledger))
+
+    # ===== Retention =====
+    @mutates
+    def collapse_results(self, before_year: int) -> int:
+        """
+        Drop result rows of seasons before before_year, keeping their per-subject season summaries.
 
-        # Label non-championship races (round == 0) as NC1, NC2, ...
-        zero_rids = sorted(df.loc[df["round"] == 0, "race_id"].unique())
-        zero_map = {rid: f"NC{i + 1}" for i, rid in enumerate(zero_rids)}
-        df["col_label"] = df.apply(
-            lambda r: zero_map[r["race_id"]] if r["round"] == 0 else str(r["round"]), axis=1
+        Archived seasons are collapsed as well. Season statistics of subjects stay
+        available through result_summaries; race-by-race views of those seasons
+        are gone. Returns the number of rows dropped.
+        """
+        self._sync_season_summary()
+        if "season" in self.results.columns:
+            old = (pd.to_numeric(self.results["season"], errors="coerce") < before_year).to_numpy()
+        else:
+            old = np.zeros(len(self.results), dtype=bool)
+        archived = (self.archive.drop_before("results", before_year) if self.archive is not None
+                    else pd.DataFrame(columns=["series_id", "season"]))
+        if not old.any() and archived.empty:
+            return 0
+
+        live = self.results.loc[old, ["series_id", "season"]] if old.any() else None
+        dropped = pd.concat([archived, live], ignore_index=True)
+        seasons = set(zip(dropped["series_id"].astype(int).tolist(), dropped["season"].astype(int).tolist()))
+        records = [
+            (sid, year, typ, subject_id, *entry)
+            for (typ, subject_id), by_season in self.season_summary.items()
+            for (year, sid), entry in by_season.items()
+            if (sid, year) in seasons
+        ]
+        summaries = pd.DataFrame(records, columns=RESULT_SUMMARY_COLUMNS)
+        self.result_summaries = (
+            summaries if self.result_summaries.empty
+            else pd.concat([self.result_summaries, summaries], ignore_index=True)
         )
 
-        # Replace manufacturer IDs with names for engine, chassi and tyre
-        df["engine_id"] = df["engine_id"].map(manu_map)
-        df["chassi_id"] = df["chassi_id"].map(manu_map)
-        df["pneu_id"] = df["pneu_id"].map(manu_map)
+        self.results = self.results[~old].reset_index(drop=True)
+        self._results_token = (id(self.results), len(self.results))
+        for key in seasons:
+            self.season_result_rows.pop(key, None)
+            self.result_pivots.pop(key, None)
+        self._delete_stored("results", "season", before_year)
+        self.pruned_before["results"] = max(before_year, self.pruned_before.get("results", before_year))
+        return len(dropped)
+
+    @mutates
+    def prune_standings(self, before_year: int) -> int:
+        """
+        Drop the round-by-round standings of seasons before before_year, archived ones included.
 
-        pivot = df.pivot(
-            index=["driver_id", "team_id", "engine_id", "chassi_id", "pneu_id"],
-            columns="col_label",
-            values="position",
+        Their final standings are kept. Returns the number of delta rows dropped.
+        """
+        self._sync_season_finals()
+        ledger = self.standings_ledger
+        rows = len(ledger)
+        ledger.drop_seasons([key for key in ledger.keys() if key[1] < before_year])
+        self._standings_token = (id(ledger), len(ledger))
+        for key in [key for key in self.open_standings if key[1] < before_year]:
+            del self.open_standings[key]
+        archived = len(self.archive.drop_before("standings", before_year)) if self.archive is not None else 0
+        self._delete_stored("standings", "year", before_year)
+        self.pruned_before["standings"] = max(before_year, self.pruned_before.get("standings", before_year))
+        return rows - len(ledger) + archived
+
+    @mutates
+    def prune_races(self, before_year: int) -> int:
+        """Drop scheduled races of seasons before before_year that no result rows refer to any more."""
+        if self.races.empty or "season" not in self.races.columns:
+            return 0
+        self._sync_season_summary()
+        kept_seasons = set(self.season_result_rows)
+        season = pd.to_numeric(self.races["season"], errors="coerce")
+        held = [key in kept_seasons for key in zip(self.races["series_id"].astype(int), season.fillna(-1).astype(int))]
+        old = ((season < before_year) & ~np.array(held, dtype=bool)).to_numpy()
+        if not old.any():
+            return 0
+        self.races = self.races[~old].reset_index(drop=True)
+        return int(old.sum())
+
+    def _delete_stored(self, table: str, season_col: str, before_year: int) -> None:
+        """Delete seasons before before_year from the store, if one is attached (archived seasons included)."""
+        if self.store is not None:
+            self.store.delete(table, f'"{season_col}" < ?', (int(before_year),))
+
+    def _championship_rounds(self, series_id: int, year: int) -> int:
+        """Return how many championship races are scheduled for a series-season."""
+        token = (id(self.races), len(self.races))
+        if self._champ_rounds[0] != token:
+            counts = {}
+            if not self.races.empty and "championship" in self.races.columns:
+                champ = self.races[self.races["championship"].fillna(False).astype(bool)]
+                counts = {
+                    (int(sid), int(season)): int(n)
+                    for (sid, season), n in champ.groupby(["series_id", "season"]).size().items()
+                }
+            self._champ_rounds = (token, counts)
+        return self._champ_rounds[1].get((int(series_id), int(year)), 0)
+
+    def _sync_season_finals(self) -> None:
+        """Rebuild the finals if the standings were replaced outside _record_standings."""
+        if self._standings_token != (id(self.standings_ledger), len(self.standings_ledger)):
+            self._rebuild_season_finals()
+
+    def _rebuild_season_finals(self, final: pd.DataFrame | None = None) -> None:
+        """
+        Derive season finals from the round-by-round standings.
+
+        The last round of each series-season is final if it is the season's last
+        championship round (or if a saved final table already lists it); otherwise
+        it is kept as the season's open standings.
+        """
+        # Finals of archived or pruned seasons cannot be derived again; keep them as they are
+        ledger = self.standings_ledger
+        archived = pd.DataFrame(columns=FINAL_STANDINGS_COLUMNS)
+        if final is not None:
+            if not final.empty:
+                held = set(ledger.keys())
+                gone = [key not in held for key in zip(final["series_id"].astype(int), final["year"].astype(int))]
+                archived = final[gone].reindex(columns=FINAL_STANDINGS_COLUMNS)
+        else:
+            before = max(self.archive.before.get("standings", -1) if self.archive is not None else -1,
+                         self.pruned_before.get("standings", -1))
+            source = self.final_standings
+            if before > 0 and not source.empty:
+                archived = source[source["year"] < before].reindex(columns=FINAL_STANDINGS_COLUMNS)
+
+        self.open_standings = {}
+        self._standings_token = (id(ledger), len(ledger))
+        if not ledger.keys():
+            self.final_standings = archived.reset_index(drop=True)
+            return
+
+        saved = set()
+        if final is not None and not final.empty:
+            saved = set(zip(final["series_id"].astype(int), final["year"].astype(int)))
+
+        finals = []
+        for key in ledger.keys():
+            block = ledger.block(*key).reindex(columns=FINAL_STANDINGS_COLUMNS)
+            if key in saved or int(block["round"].max()) >= self._championship_rounds(*key) > 0:
+                finals.append(block)
+            else:
+                self.open_standings[key] = block
+        if not archived.empty:
+            finals.insert(0, archived)
+        self.final_standings = (
+            pd.concat(finals, ignore_index=True) if finals else pd.DataFrame(columns=FINAL_STANDINGS_COLUMNS)
         )
 
-        order = df[["col_label", "race_id"]].drop_duplicates().sort_values("race_id")
-        labels = order["col_label"].tolist()
-        pivot = pivot[labels]
-        # Fill only object columns → no downcasting warning
-        obj_cols = pivot.select_dtypes(include="object").columns
-        fill = "" if fill_value is None else fill_value
+    def get_season_finals(self, series_id: int | None = None, typ: str | None = None,
+                          subject_id: int | None = None, year: int | None = None) -> pd.DataFrame:
+        """
+        Return end-of-season standings rows, one per (series, season, typ, subject).
+
+        Finished seasons come from final_standings through an index on
+        (series_id, typ) and (typ, subject_id); running seasons contribute their
+        latest round. Any argument left as None is not filtered on.
+        """
+        self._sync_season_finals()
+        final = self.final_standings
+        token = (id(final), len(final))
+        if self._final_index[0] != token:
+            index: dict[tuple, list[int]] = {}
+            if not final.empty:
+                for pos, (sid, t, subj) in enumerate(
+                        zip(final["series_id"].astype(int), final["typ"], final["subject_id"].astype(int))):
+                    index.setdefault(("series", sid, t), []).append(pos)
+                    index.setdefault(("subject", t, subj), []).append(pos)
+            self._final_index = (token, index)
+        index = self._final_index[1]
+
+        if typ is not None and subject_id is not None:
+            positions = index.get(("subject", typ, int(subject_id)), [])
+        elif series_id is not None:
+            types = [typ] if typ is not None else STANDINGS_TYPES
+            positions = sorted(p for t in types for p in index.get(("series", int(series_id), t), []))
+        else:
+            positions = list(range(len(final)))
+
+        frames = [final.iloc[positions]]
+        frames += [
+            block for (sid, yr), block in self.open_standings.items()
+            if (series_id is None or sid == int(series_id)) and (year is None or yr == int(year))
+        ]
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame(columns=FINAL_STANDINGS_COLUMNS)
+        rows = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0].reset_index(drop=True)
+
+        mask = pd.Series(True, index=rows.index)
+        if series_id is not None:
+            mask &= rows["series_id"] == int(series_id)
+        if typ is not None:
+            mask &= rows["typ"] == typ
+        if subject_id is not None:
+            mask &= rows["subject_id"] == int(subject_id)
+        if year is not None:
+            mask &= rows["year"] == int(year)
+        return rows[mask].reset_index(drop=True)
+
+    # ===== Season car cache =====
+    def build_season_cars(self, contracts_model, manufacturer_model, series_ids, year: int) -> None:
+        """Assemble and cache the cars of every team in the given series for a season."""
+        for series_id in series_ids:
+            self.get_season_cars(contracts_model, manufacturer_model, int(series_id), year)
+
+    def get_season_cars(self, contracts_model, manufacturer_model, series_id: int,
+                        year: int) -> dict[str, np.ndarray]:
+        """
+        Return the assembled cars of a series for a season, building them if needed.
+
+        The result maps column names to arrays aligned on a sorted ``team_id`` array:
+        engine/chassi/pneu hold the manufacturer of each part and power/reliability/safety
+        the summed part stats. Only complete cars (all three parts) are included.
+        A cached entry is reused until a part contract is signed or the season's
+        parts change.
+        """
+        catalog = self._part_catalog(manufacturer_model)
+        mt_contract = contracts_model.mt_contract
+        token = (
+            getattr(contracts_model, "part_contracts_version", None),
+            id(mt_contract),
+            len(mt_contract),
+            len(catalog.positions(series_id, year)),
+        )
+        key = (int(series_id), int(year))
+        cached = self.season_cars.get(key)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+
+        cars = self._assemble_season_cars(mt_contract, catalog, series_id, year)
+        self.season_cars[key] = (token, cars)
+        return cars
+
+    @staticmethod
+    def _part_catalog(manufacturer_model) -> PartCatalog:
+        if hasattr(manufacturer_model, "get_part_catalog"):
+            return manufacturer_model.get_part_catalog()
+        return PartCatalog(manufacturer_model.car_parts)
+
+    @staticmethod
+    def _assemble_season_cars(mt_contract: pd.DataFrame, catalog: PartCatalog, series_id: int,
+                              year: int) -> dict[str, np.ndarray]:
+        """Combine a season's active part contracts with the season's parts into per-team cars."""
+        stat_cols = ("power", "reliability", "safety")
+
+        # Summed stats per (manufacture_id, part_type) for this series and season
+        parts = catalog.parts(series_id, year)
+        part_stats: dict[tuple[int, str], np.ndarray] = {}
+        if not parts.empty:
+            stats = parts.reindex(columns=stat_cols).apply(pd.to_numeric, errors="coerce").fillna(0)
+            grouped = stats.groupby(
+                [pd.to_numeric(parts["manufacture_id"]).astype(int).to_numpy(),
+                 parts["part_type"].astype(str).to_numpy()]
+            ).sum()
+            part_stats = {(int(mid), str(pt)): row.to_numpy(dtype="int64")
+                          for (mid, pt), row in grouped.iterrows()}
+
+        # Active manufacturer-team contracts for this series and season
+        teams: dict[int, dict] = {}
+        if not mt_contract.empty:
+            active_mt = mt_contract[
+                (mt_contract["start_year"] <= year)
+                & (mt_contract["end_year"] >= year)
+                & (mt_contract["series_id"].astype(int) == series_id)
+                ]
+            for team_id, mid, part_type in zip(
+                    active_mt["team_id"].astype(int),
+                    active_mt["manufacture_id"].astype(int),
+                    active_mt["part_type"].astype(str),
+            ):
+                car = teams.setdefault(team_id, {"stats": np.full(len(stat_cols), -1, dtype="int64")})
+                car[part_type] = mid
+                car["stats"] = car["stats"] + part_stats.get((mid, part_type), 0)
+
+        team_ids = sorted(t for t, car in teams.items() if all(pt in car for pt in PART_TYPES))
+        cars = {"team_id": np.asarray(team_ids, dtype="int64")}
+        for pt in PART_TYPES:
+            cars[pt] = np.asarray([teams[t][pt] for t in team_ids], dtype="int64")
+        for i, col in enumerate(stat_cols):
+            cars[col] = np.asarray([teams[t]["stats"][i] for t in team_ids], dtype="int64")
+        return cars
+
+    @staticmethod
+    def _car_slots(cars: dict[str, np.ndarray], team_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return (has_car mask, index into the cars arrays) for each team_id."""
+        known = cars["team_id"]
+        if len(known) == 0:
+            return np.zeros(len(team_ids), dtype=bool), np.zeros(len(team_ids), dtype="int64")
+        slot = np.minimum(np.searchsorted(known, team_ids), len(known) - 1)
+        return known[slot] == team_ids, slot
+
+    # ===== Season kernel =====
+    @mutates
+    def run_race(
+            self,
+            drivers_model,
+            teams_model,
+            series_model,
+            manufacturer_model,
+            contracts_model,
+            races_today: pd.DataFrame,
+            idx: int,
+            current_date,
+    ) -> list[int]:
+        """
+        Simulate one scheduled race, reusing a pre-simulated season batch when possible.
 
-        # Replace NaN without using fillna → no FutureWarning
-        for col in obj_cols:
-            pivot[col] = pivot[col].where(pivot[col].notna(), fill)
+        On the first race of a stable-grid stretch, the remaining rounds of the
+        series-season are simulated together by the season kernel and committed one
+        per race day afterwards. The batch is discarded as soon as the grid changes
+        (signed contracts, retirements) or a round in it kills a driver; the next
+        race then starts a new batch. With a single round left, the race goes through
+        prepare_race as before.
 
-        pivot = pivot.infer_objects(copy=False)
+        Returns
+        -------
+        list[int]
+            List of driver IDs who died during the race.
+        """
+        race_row = races_today.iloc[idx]
+        series_id = int(race_row["series_id"])
+        year = current_date.year
+
+        grid = self._select_grid(drivers_model, manufacturer_model, contracts_model, series_id, year)
+        rules, ps = self._race_rules(series_model, series_id, year)
+        signature = self._grid_signature(grid, rules, ps)
+
+        batch = self.season_batches.get(series_id)
+        if batch is None or not batch.matches(int(race_row["race_id"]), signature):
+            self.season_batches.pop(series_id, None)
+            rounds = self._remaining_rounds(race_row)
+            if len(rounds) < 2 or grid.empty:
+                return self.prepare_race(drivers_model, teams_model, series_model, manufacturer_model,
+                                         contracts_model, races_today, idx, current_date)
+            batch = self._simulate_batch(grid, rounds, rules, ps, signature)
+            self.season_batches[series_id] = batch
+
+        died = self._commit_batch_round(batch, drivers_model, teams_model, race_row)
+        if died or batch.exhausted:
+            self.season_batches.pop(series_id, None)
+        return died
 
-        pivot.reset_index(inplace=True)
-        pivot.columns.name = None
+    @staticmethod
+    def _grid_signature(grid: pd.DataFrame, rules: pd.DataFrame, ps: pd.DataFrame) -> tuple:
+        """Return a hashable description of everything a batch depends on besides the races."""
+        cols = ["driver_id", "team_id", "ability", "engine", "chassi", "pneu", "power", "reliability", "safety"]
+        return (
+            tuple(grid.index),
+            tuple(map(tuple, grid[cols].to_numpy().tolist())),
+            tuple(rules.iloc[0].tolist()) if not rules.empty else (),
+            tuple(ps.iloc[0].tolist()) if not ps.empty else (),
+        )
 
-        # If championship rounds exist, attach final position and points for drivers
-        if "1" in labels:
-            st2 = self.standings.loc[
-                (self.standings["series_id"] == series_id)
-                & (self.standings["year"] == season)
-                & (self.standings["typ"] == "driver"),
-                ["subject_id", "round", "points", "position"],
-            ].copy()
-            if not st2.empty:
-                st2["round"] = pd.to_numeric(st2["round"], errors="coerce").dropna().astype(int)
-                last_idx = st2.groupby("subject_id")["round"].idxmax()
-                final = st2.loc[last_idx].rename(
-                    columns={
-                        "subject_id": "driver_id",
-                        "position": "final_position",
-                        "points": "final_points",
-                    }
-                )[["driver_id", "final_position", "final_points"]]
-                pivot = pivot.merge(final, on="driver_id", how="left")
-        # --- CLEAN LEXICOGRAPHIC SORTING WITHOUT EXTRA COLUMNS ---
+    def _remaining_rounds(self, race_row: pd.Series) -> pd.DataFrame:
+        """Return this race and the later races of its series-season, in running order."""
+        races = self.races[
+            (self.races["series_id"] == race_row["series_id"])
+            & (self.races["season"] == race_row["season"])
+            ].sort_values(by=["race_date", "race_id"], kind="stable")
+        later = (races["race_date"] > race_row["race_date"]) | (
+                (races["race_date"] == race_row["race_date"]) & (races["race_id"] >= race_row["race_id"])
+        )
+        return races[later].reset_index(drop=True)
+
+    def _simulate_batch(self, grid: pd.DataFrame, rounds: pd.DataFrame, rules: pd.DataFrame,
+                        ps: pd.DataFrame, signature: tuple) -> SeasonBatch:
+        """Collect the inputs of the season kernel for a grid and run it over rounds."""
+        arrays, corners, cts, points = self._kernel_inputs(grid, rounds, rules, ps)
+
+        first = rounds.iloc[0]
+        pre = self.standings_ledger.block(first["series_id"], first["season"])
+        last_blocks = {}
+        for typ in STANDINGS_TYPES:
+            prev_for_typ = pre[pre["typ"] == typ] if not pre.empty else pre
+            if prev_for_typ.empty:
+                continue
+            this_round = int(prev_for_typ["round"].max())
+            if this_round:
+                last_blocks[typ] = (this_round, prev_for_typ[prev_for_typ["round"] == this_round].copy())
+        base_round = 0 if pre.empty else int(pre["round"].max())
+
+        return simulate_season_batch(arrays, rounds, corners, cts, points, last_blocks, base_round, signature,
+                                     rng=self.rng)
+
+    def _kernel_inputs(self, grid: pd.DataFrame, rounds: pd.DataFrame, rules: pd.DataFrame, ps: pd.DataFrame
+                       ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, int], np.ndarray]:
+        """Per-car arrays, layout corners, counting cars and points per position for the season kernels."""
+        arrays = {
+            "driver_id": grid["driver_id"].astype(int).to_numpy(),
+            "team_id": grid["team_id"].astype(int).to_numpy(),
+            "car_id": grid.index.to_numpy(dtype="int64"),
+            "ability": grid["ability"].fillna(0).astype(int).to_numpy(),
+            "power": grid["power"].astype(int).to_numpy(),
+            "reliability": grid["reliability"].astype(int).to_numpy(),
+            "safety": grid["safety"].astype(int).to_numpy(),
+            "engine_id": grid["engine"].astype(int).to_numpy(),
+            "chassi_id": grid["chassi"].astype(int).to_numpy(),
+            "pneu_id": grid["pneu"].astype(int).to_numpy(),
+        }
 
-        # Identify race result columns
-        race_cols = [c for c in pivot.columns if c not in
-                     ["driver_id", "team_id", "engine_id", "chassi_id", "pneu_id",
-                      "final_position", "final_points"]]
+        layouts = self.get_layout_registry()
+        corners = np.array(
+            [int(layouts.value(layout_id, "corners", 1) or 1) for layout_id in rounds["layout_id"]], dtype="int64"
+        )
 
-        # Convert values to integers where possible (no applymap warning)
-        temp = pivot[race_cols].map(lambda x: pd.to_numeric(x, errors="coerce"))
+        rule_row = rules.iloc[0]
+        cts = {typ: 1 if typ == "driver" else int(rule_row.get(f"{typ}_cts", 1)) for typ in STANDINGS_TYPES}
+        ps_row = ps.iloc[0] if not ps.empty else pd.Series(dtype=float)
+        points = np.array(
+            [int(ps_row.get(str(pos), 0)) for pos in range(1, len(grid) + 1)], dtype="int64"
+        )
+        return arrays, corners, cts, points
 
-        # Build lexicographic sort key: tuple of counts for each position
-        # Example: (count_1, count_2, count_3, ...)
-        all_positions = sorted({v for col in temp.columns for v in temp[col].dropna().unique()})
+    def project_championship(self, drivers_model, series_model, manufacturer_model, contracts_model,
+                             series_id: int, year: int, sims: int = PROJECTION_SIMS,
+                             seed: int | None = None) -> dict[str, pd.DataFrame]:
+        """
+        Project the end of a running championship with the current grid (see projection.py).
 
-        def build_sort_key(row):
-            return tuple((row == pos).sum() for pos in all_positions)
+        The championship rounds of the season that have no results yet are simulated
+        sims times from the current standings; nothing of the game state changes.
+        Returns per standings type the title, podium and points distribution, or {}
+        if the series has no point rules for the season.
+        """
+        races = self.races
+        if races.empty:
+            return {}
+        season_races = races[(races["series_id"] == series_id) & (races["season"] == year)]
+        if not self.results.empty:
+            season_races = season_races[~season_races["race_id"].isin(self.results["race_id"])]
+        rounds = season_races[season_races["championship"].fillna(False).astype(bool)]
+        rounds = rounds.sort_values(by=["race_date", "race_id"], kind="stable").reset_index(drop=True)
+
+        rules, ps = self._race_rules(series_model, series_id, year)
+        if rules.empty:
+            return {}
+        grid = self._select_grid(drivers_model, manufacturer_model, contracts_model, series_id, year)
+        arrays, corners, cts, points = self._kernel_inputs(grid, rounds, rules, ps)
 
-        sort_keys = temp.apply(build_sort_key, axis=1)
+        block = self.standings_ledger.block(series_id, year)
+        if rounds.empty and block.empty:
+            return {}
+        current = {
+            typ: (part["subject_id"].to_numpy(), part["points"].to_numpy())
+            for typ, part in block.groupby("typ", sort=False)
+        }
+        return project_championship(arrays, rounds, corners, cts, points, current, sims,
+                                    rng=np.random.default_rng(seed))
 
-        # Sort pivot by these keys
-        pivot = pivot.assign(_sort_key=sort_keys).sort_values("_sort_key").drop(columns="_sort_key")
+    def _commit_batch_round(self, batch: SeasonBatch, drivers_model, teams_model, race_row: pd.Series) -> list[int]:
+        """Record the next pre-simulated round of a batch and apply its side effects."""
+        r = batch.next_round
+        batch.next_round += 1
 
-        # Add secondary ranking
-        pivot["secondary_position"] = range(1, len(pivot) + 1)
+        if int(race_row["series_id"]) == 1 and int(race_row["season"]) > 1949:
+            self.crashes += batch.crashes[r]
+            self.deaths += batch.deaths[r]
+            self.f1_races += 1
 
-        return pivot
+        reputation = int(race_row.get("reputation", 0) or 0)
+        if hasattr(drivers_model, "race_reputations"):
+            drivers_model.race_reputations(reputation, batch.rep_drivers[r])
+        if hasattr(teams_model, "add_race_reputation"):
+            teams_model.add_race_reputation(reputation, batch.rep_teams[r])
+
+        self._record_results(batch.results[r])
+        if batch.standings[r] is not None:
+            self._record_standings(batch.standings[r])
+        return batch.died[r]
 
     # ===== Simulation =====
     def prepare_race(
@@ -578,82 +1256,10 @@ class RaceModel:
         """
         series_id = int(races_today.iloc[idx]["series_id"])
         layout_id = int(races_today.iloc[idx]["layout_id"])
-        layout_row = self.circuit_layouts[self.circuit_layouts["layout_id"] == layout_id].iloc[0]
-
-        # Select active driver-team contracts valid for the current year
-        active_dt = contracts_model.dt_contract[
-            (contracts_model.dt_contract["active"])
-            & (contracts_model.dt_contract["start_year"] <= current_date.year)
-            & (contracts_model.dt_contract["end_year"] >= current_date.year)
-            ]
-        # Keep only drivers that are currently active in drivers_model
-        active_dt = active_dt[active_dt["driver_id"].isin(drivers_model.active_drivers["driver_id"])]
+        layout_row = self.get_layout_registry().record(layout_id) or {}
 
-        # Teams that participate in this series
-        teams_in_series = contracts_model.st_contract[
-            contracts_model.st_contract["series_id"] == series_id
-            ]["team_id"]
-        # Grid entries limited to teams in the series
-        grid_dt = active_dt[active_dt["team_id"].isin(teams_in_series)]
-
-        # Merge driver ability into the grid
-        selected = pd.merge(
-            grid_dt,
-            drivers_model.active_drivers[["driver_id", "ability"]],
-            on="driver_id",
-            how="left",
-        )
-
-        # Ensure part-related columns exist with default 0
-        for col in ("power", "reliability", "safety", "engine", "chassi", "pneu"):
-            selected[col] = selected.get(col, -1)
-
-        # Active manufacturer-team contracts for this series and year
-        active_mt = contracts_model.mt_contract[
-            (contracts_model.mt_contract["start_year"] <= current_date.year)
-            & (contracts_model.mt_contract["end_year"] >= current_date.year)
-            & (contracts_model.mt_contract["series_id"] == series_id)
-            ].copy()
-
-        # Manufacturer parts available for this series and year
-        parts = manufacturer_model.car_parts[
-            (manufacturer_model.car_parts["series_id"] == series_id)
-            & (manufacturer_model.car_parts["year"] == current_date.year)
-            ].copy()
-
-        # Normalize merge keys to integer type for a reliable merge
-        merge_keys = ["series_id", "manufacture_id"]
-        for key in merge_keys:
-            parts[key] = parts[key].astype(int)
-            active_mt[key] = active_mt[key].astype(int)
-
-        # Ensure part_type is string for merging
-        parts["part_type"] = parts["part_type"].astype(str)
-        active_mt["part_type"] = active_mt["part_type"].astype(str)
-
-        # Merge active manufacturer contracts with available parts
-        merged = pd.merge(
-            active_mt,
-            parts,
-            on=["series_id", "manufacture_id", "part_type"],
-            how="left",
-        )
-
-        # Apply parts to selected grid entries: set part IDs and accumulate stats
-
-        for _, part in merged.iterrows():
-            team_id = part["team_id"]
-            mask = selected["team_id"] == team_id
-            selected.loc[mask, part["part_type"]] = (
-                int(part["manufacture_id"]) if pd.notna(part["manufacture_id"]) else -1
-            )
-            selected.loc[mask, "power"] += int(part.get("power", 0))
-            selected.loc[mask, "reliability"] += int(part.get("reliability", 0))
-            selected.loc[mask, "safety"] += int(part.get("safety", 0))
-
-        # Remove non-complet cars
-        for part in ["engine", "chassi", "pneu"]:
-            selected = selected[(selected[part] != -1)]
+        selected = self._select_grid(drivers_model, manufacturer_model, contracts_model, series_id,
+                                     current_date.year)
 
         # Track characteristics and wetness modifiers
         corners = int(layout_row.get("corners", 1) or 1)
@@ -701,20 +1307,63 @@ class RaceModel:
         # Sort grid by computed total ability (descending)
         race_data = race_data.sort_values(by="totalAbility", ascending=False).reset_index(drop=True)
 
+        rules, ps = self._race_rules(series_model, series_id, current_date.year)
+
+        # Run the race simulation and return list of deceased driver IDs
+        return self.simulate_race(drivers_model, teams_model, races_today.iloc[idx], race_data, rules, ps)
+
+    def _select_grid(self, drivers_model, manufacturer_model, contracts_model, series_id: int,
+                     year: int) -> pd.DataFrame:
+        """Return the drivers on the grid of a series with their ability and assembled car."""
+        # Select active driver-team contracts valid for the current year
+        active_dt = contracts_model.dt_contract[
+            (contracts_model.dt_contract["active"])
+            & (contracts_model.dt_contract["start_year"] <= year)
+            & (contracts_model.dt_contract["end_year"] >= year)
+            ]
+        # Keep only drivers that are currently active in drivers_model
+        active_dt = active_dt[active_dt["driver_id"].isin(drivers_model.active_drivers["driver_id"])]
+
+        # Teams that participate in this series
+        teams_in_series = contracts_model.st_contract[
+            contracts_model.st_contract["series_id"] == series_id
+            ]["team_id"]
+        # Grid entries limited to teams in the series
+        grid_dt = active_dt[active_dt["team_id"].isin(teams_in_series)]
+
+        # Merge driver ability into the grid
+        selected = pd.merge(
+            grid_dt,
+            drivers_model.active_drivers[["driver_id", "ability"]],
+            on="driver_id",
+            how="left",
+        )
+
+        # Attach the team's assembled car; teams without a complete car are dropped
+        cars = self.get_season_cars(contracts_model, manufacturer_model, series_id, year)
+        has_car, slot = self._car_slots(cars, selected["team_id"].astype(int).to_numpy())
+        selected = selected[has_car].copy()
+        slot = slot[has_car]
+        for col in ("engine", "chassi", "pneu", "power", "reliability", "safety"):
+            selected[col] = cars[col][slot]
+        return selected
+
+    def _race_rules(self, series_model, series_id: int, year: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Return the point rules and point system of a series for a season (both empty if it has no rules)."""
         # Lookup point rules for the series and season
         rules = series_model.point_rules[
             (series_model.point_rules["series_id"] == series_id)
-            & (series_model.point_rules["start_season"] <= current_date.year)
-            & (series_model.point_rules["end_season"] >= current_date.year)
+            & (series_model.point_rules["start_season"] <= year)
+            & (series_model.point_rules["end_season"] >= year)
             ].reset_index(drop=True)
+        if rules.empty:
+            return rules, self.point_system.iloc[0:0]
 
         # Resolve point system by ps_id referenced in rules
         ps = self.point_system[self.point_system["ps_id"] == rules.loc[0, "ps_id"]].reset_index(
             drop=True
         )
-
-        # Run the race simulation and return list of deceased driver IDs
-        return self.simulate_race(drivers_model, teams_model, races_today.iloc[idx], race_data, rules, ps)
+        return rules, ps
 
     def simulate_race(
             self,
@@ -791,7 +1440,7 @@ class RaceModel:
             # Continue selecting until a valid index from idx_pool is chosen
             while chosen == dmax:
                 for j in range(len(idx_pool)):
-                    if rd.randint(0, RNG_PICK_MAX) < RNG_PICK_THRESHOLD:
+                    if self.rng.integers(0, RNG_PICK_MAX + 1) < RNG_PICK_THRESHOLD:
                         chosen = idx_pool[j]
                         break
             ranking.append((chosen, True))
@@ -814,15 +1463,12 @@ class RaceModel:
         # Determine championship round number if this race counts toward the championship
         round_no = 0
         if bool(race_row.get("championship", False)):
-            pre = self.standings[
-                (self.standings["series_id"] == race_row["series_id"])
-                & (self.standings["year"] == race_row["season"])
-                ]
-            round_no = 1 if pre.empty else int(pre["round"].max()) + 1
+            round_no = self.standings_ledger.last_round(race_row["series_id"], race_row["season"]) + 1
 
         # Record finishing results with positions
+        rows = []
         for pos, (fin_idx, _) in enumerate(ranking, start=1):
-            self.results.loc[len(self.results)] = [
+            rows.append([
                 int(race_row["race_id"]),
                 int(finish.loc[fin_idx, "driver_id"]),
                 int(finish.loc[fin_idx, "team_id"]),
@@ -834,11 +1480,11 @@ class RaceModel:
                 int(finish.loc[fin_idx, "engine_id"]),
                 int(finish.loc[fin_idx, "chassi_id"]),
                 int(finish.loc[fin_idx, "pneu_id"]),
-            ]
+            ])
 
         # Record crash results using CRASH_CODE
         for _, row in crash.iterrows():
-            self.results.loc[len(self.results)] = [
+            rows.append([
                 int(race_row["race_id"]),
                 int(row["driver_id"]),
                 int(row["team_id"]),
@@ -850,11 +1496,11 @@ class RaceModel:
                 int(row["engine_id"]),
                 int(row["chassi_id"]),
                 int(row["pneu_id"]),
-            ]
+            ])
 
         # Record death results using DEATH_CODE and collect deceased driver IDs
         for _, row in death.iterrows():
-            self.results.loc[len(self.results)] = [
+            rows.append([
                 int(race_row["race_id"]),
                 int(row["driver_id"]),
                 int(row["team_id"]),
@@ -866,8 +1512,9 @@ class RaceModel:
                 int(row["engine_id"]),
                 int(row["chassi_id"]),
                 int(row["pneu_id"]),
-            ]
+            ])
             died.append(int(row["driver_id"]))
+        self._record_results(pd.DataFrame(rows, columns=RESULT_COLUMNS))
 
         # Update championship standings if this race is part of the championship
         if bool(race_row.get("championship", False)):
@@ -911,11 +1558,11 @@ class RaceModel:
             return "Crash"
 
         # Random roll influenced by speed capability and a multiplier constant
-        rnd1 = np.random.randint(0, speed_limit * SPEED_MULTIPLIER)
+        rnd1 = self.rng.integers(0, speed_limit * SPEED_MULTIPLIER)
 
         # If the first roll is below reliability, the car fails; second roll decides severity
         if rnd1 < reliability:
-            rnd2 = np.random.randint(0, speed_limit + 1)
+            rnd2 = self.rng.integers(0, speed_limit + 1)
             # If the second roll is below safety, it's fatal; otherwise it's a crash
             return "Death" if rnd2 < safety else "Crash"
         # Otherwise the car finishes the race in good condition
@@ -935,9 +1582,9 @@ class RaceModel:
         """
         Update championship standings after a race.
 
-        This method computes points for different subject types (driver, team, engine, chassi, pneu)
-        based on the race results and previous standings, then appends the new standings blocks
-        to self.standings.
+        This method computes the points this race gives each subject type (driver, team,
+        engine, chassi, pneu) and records them as the next round of the series-season;
+        only the point deltas are stored (see StandingsLedger).
 
         Parameters
         ----------
@@ -958,17 +1605,12 @@ class RaceModel:
         ps : pd.DataFrame
             DataFrame mapping finishing positions to points (stringified position keys).
         """
-        # Filter previous standings for the same series and year
-        pre = self.standings[
-            (self.standings["series_id"] == race_row["series_id"])
-            & (self.standings["year"] == race_row["season"])
-            ]
-        final_blocks = []
+        points = {}
         # Combine crash and death into a single "not finished" frame
         not_finish = pd.concat([crash, death], ignore_index=True)
 
-        # Iterate over each subject type to compute points and positions
-        for typ in ("driver", "team", "engine", "chassi", "pneu"):
+        # Iterate over each subject type to compute this race's points
+        for typ in STANDINGS_TYPES:
             subj_col = f"{typ}_id"
             # Start with unique subjects present in race_data
             subjects = race_data[[subj_col]].drop_duplicates().copy()
@@ -978,15 +1620,6 @@ class RaceModel:
             )
             subjects["points"] = 0
 
-            # Get previous standings block for this subject type
-            prev_for_typ = pre[pre["typ"] == typ]
-            this_round = prev_for_typ["round"].max() if not prev_for_typ.empty else 0
-            last_round_block = (
-                prev_for_typ[prev_for_typ["round"] == this_round].copy()
-                if this_round
-                else pd.DataFrame(columns=["subject_id", "points"])
-            )
-
             # Award points for finishers according to ranking and points schedule (ps)
             for pos, (fin_idx, _) in enumerate(ranking, start=1):
                 if fin_idx not in finish.index:
@@ -1003,72 +1636,14 @@ class RaceModel:
                 mask = (subjects[subj_col] == current_subject) & (subjects["cars"] > 0)
                 subjects.loc[mask, ["cars", "points"]] += [-1, 0]
 
-            # Add race metadata to the subjects block
-            subjects["race_id"] = int(race_row["race_id"])
-            subjects["year"] = int(race_row["season"])
-            subjects["round"] = 1 if last_round_block.empty else int(this_round) + 1
-            subjects["position"] = 0
-            subjects["series_id"] = int(race_row["series_id"])
-            subjects["typ"] = typ
-
-            # If previous round exists, add previous points to current points
-            if not last_round_block.empty:
-                prev_pts = last_round_block.set_index("subject_id")["points"]
-                prev_mapped = subjects[subj_col].map(prev_pts)
-                prev_mapped = pd.to_numeric(prev_mapped, errors="coerce").fillna(0).astype(int)
-
-                subjects["points"] = prev_mapped + subjects["points"].astype(int)
-
-                # Include any subjects that were present in previous standings but not in this race
-                missing = last_round_block[
-                    ~last_round_block["subject_id"].isin(subjects[subj_col])
-                ].copy()
-                if not missing.empty:
-                    missing["round"] = int(subjects["round"].iloc[0])
-                    missing["race_id"] = int(race_row["race_id"])
-                    missing = missing.rename(columns={"subject_id": subj_col})
-                    subjects = pd.concat(
-                        [
-                            subjects,
-                            missing[
-                                [
-                                    subj_col,
-                                    "points",
-                                    "race_id",
-                                    "year",
-                                    "round",
-                                    "position",
-                                    "series_id",
-                                ]
-                            ].assign(typ=typ),
-                        ],
-                        ignore_index=True,
-                    )
-
-            # Normalize column name to subject_id for the standings table
-            subjects = subjects.rename(columns={subj_col: "subject_id"})
-            subjects["points"] = subjects["points"].astype(int)
-            # Sort by points descending, then by subject_id ascending for deterministic ordering
-            subjects = subjects.sort_values(
-                by=["points", "subject_id"], ascending=[False, True]
-            ).reset_index(drop=True)
-            # Assign competition ranking: equal points → equal position
-            subjects["position"] = (
-                subjects["points"]
-                .rank(method="min", ascending=False)
-                .astype(int)
+            points[typ] = (
+                subjects[subj_col].astype(int).to_numpy(),
+                subjects["points"].astype(int).to_numpy(),
             )
 
-            # Ensure integer types for key columns
-            for col in ["subject_id", "series_id", "year", "round"]:
-                subjects[col] = subjects[col].astype(int)
-
-            final_blocks.append(subjects)
-
-        # Append all computed blocks to the main standings DataFrame
-        if final_blocks:
-            self.standings = pd.concat([self.standings, *final_blocks], ignore_index=True)
+        self._record_round_points(race_row["series_id"], race_row["season"], race_row["race_id"], points)
 
+    @mutates
     def plan_races(self, series_model, current_date, champ_per_series: int, nonchamp_per_series: int) -> None:
         """
         Plan races for a season starting from the given date.
@@ -1079,6 +1654,9 @@ class RaceModel:
         candidate Sundays than required races, the remaining races are assigned
         by round-robin reusing available Sundays so the requested counts always fit.
 
+        The whole calendar is drawn at once: circuits, layouts and weather are sampled
+        as arrays for every planned race and appended to self.races in one concat.
+
         Parameters
         ----------
         series_model : object
@@ -1092,115 +1670,127 @@ class RaceModel:
             Number of races per series per season that should NOT count to the championship.
         """
         date = pd.Timestamp(current_date)
+        total_required = int(champ_per_series) + int(nonchamp_per_series)
 
-        # build list of candidate race dates (all Sundays within DAYS_PER_SEASON)
-        candidate_dates = []
-        d = date
-        for _ in range(DAYS_PER_SEASON):
-            if d.strftime("%a") == RACE_WEEKDAY:
-                candidate_dates.append(pd.Timestamp(d))
-            d += timedelta(days=1)
-
-        # helper: choose k indices from n positions roughly evenly distributed
-        def pick_even_indices(n: int, k: int):
-            if k <= 0:
-                return []
-            if n <= 0:
-                # no candidate dates; return k zeros (will be handled by round-robin later)
-                return [0] * k
-            if k == 1:
-                return [n // 2]
-            # distribute using linear spacing and round to nearest index
-            indices = []
-            for i in range(k):
-                # avoid division by zero when k==1 handled above
-                pos = i * (n - 1) / (k - 1)
-                indices.append(int(round(pos)))
-            return indices
-
-        # iterate active series per year and schedule required number of races
-        active_series_all = series_model.series  # DataFrame
-        # For each day we will still pick a random circuit/layout per race as before.
-        for si, srow in active_series_all.iterrows():
-            # determine seasons where this series is active within the planning window
-            # we will schedule per-season; current_date may span only one season so use candidate_dates' years
-            # collect unique seasons present in candidate_dates
-            seasons = sorted({int(d.year) for d in candidate_dates}) if candidate_dates else [
-                int(pd.Timestamp(current_date).year)]
-            for season in seasons:
-                # skip series not active this season
-                if not (int(srow["start_year"]) <= season <= int(srow["end_year"])):
-                    continue
+        # Skip if no circuits or layouts are available
+        if total_required <= 0 or self.circuits.empty or self.circuit_layouts.empty:
+            return
 
-                total_required = int(champ_per_series) + int(nonchamp_per_series)
-                # pick indices of candidate_dates to use for this series-season
-                n = len(candidate_dates)
-                chosen_indices = pick_even_indices(n, total_required)
-
-                # if there were fewer candidate dates than required, fill remaining by round-robin over available indices
-                if n < total_required and n > 0:
-                    # extend chosen_indices by cycling through 0..n-1 until length == total_required
-                    extra_needed = total_required - n
-                    for i in range(extra_needed):
-                        chosen_indices.append(i % n)
-                elif n == 0:
-                    # no candidate dates at all: fallback to schedule all races on the season start date
-                    chosen_indices = [0] * total_required
-                    candidate_dates = [pd.Timestamp(current_date)]
-
-                # decide which of the chosen slots are championship races
-                champ_indices_in_chosen = set()
-                if champ_per_series > 0:
-                    # choose positions among 0..total_required-1
-                    pos_indices = pick_even_indices(total_required, champ_per_series)
-                    champ_indices_in_chosen = set(pos_indices)
-
-                # now create races for each chosen slot
-                for pos, ci in enumerate(chosen_indices):
-                    race_date = candidate_dates[ci]
-                    is_championship = (pos in champ_indices_in_chosen) and (race_date.year >= 1897)
-
-                    # Skip if no circuits or layouts are available
-                    if self.circuits.empty or self.circuit_layouts.empty:
-                        continue
-
-                    # Choose a random circuit and a matching layout
-                    track_id = int(rd.choice(self.circuits["circuit_id"].tolist()))
-                    matching = self.circuit_layouts[self.circuit_layouts["circuit_id"] == track_id]
-                    if matching.empty:
-                        continue
-                    layout_id = int(rd.choice(matching["layout_id"].tolist()))
-                    # Read layout safety rating
-                    safety = float(
-                        self.circuit_layouts.loc[
-                            self.circuit_layouts["layout_id"] == layout_id, "safety"
-                        ].iloc[0]
-                    )
-
-                    # Determine wetness: a trigger roll and a strength roll if triggered
-                    wet_roll = rd.randint(RAIN_TRIGGER_MIN, RAIN_TRIGGER_MAX)
-                    wet = rd.randint(RAIN_STRENGTH_MIN,
-                                     RAIN_STRENGTH_MAX) / 100 + 1 if wet_roll == RAIN_TRIGGER_MAX else 1
-
-                    # Determine new race ID (incremental)
-                    new_race_id = 0 if self.races.empty else int(self.races["race_id"].max()) + 1
-
-                    # Append the new race entry to the races DataFrame
-                    self.races.loc[len(self.races)] = {
-                        "race_id": new_race_id,
-                        "series_id": int(srow["series_id"]),
-                        "season": int(season),
-                        "track_id": track_id,
-                        "layout_id": layout_id,
-                        "track_safety": safety,
-                        "race_date": race_date,
-                        "name": f"Preteky {srow['name']}",
-                        "championship": bool(is_championship),
-                        "reputation": (
-                            1000 // int(srow["reputation"]) if int(srow["reputation"]) else 0
-                        ),
-                        "reward": (
-                            1000000 // int(srow["reputation"]) if int(srow["reputation"]) else 0
-                        ),
-                        "wet": wet,
-                    }
+        # Candidate race dates: all race weekdays within DAYS_PER_SEASON
+        candidate_dates = self._candidate_race_dates(date)
+        seasons = sorted(set(candidate_dates.year)) if len(candidate_dates) else [int(date.year)]
+
+        # Slots of one series-season: dates and which of them count for the championship
+        n = len(candidate_dates)
+        if n == 0:
+            # no candidate dates at all: fallback to schedule all races on the season start date
+            slot_dates = pd.DatetimeIndex([date] * total_required)
+        else:
+            chosen = self._even_indices(n, total_required)
+            if n < total_required:
+                # fill remaining by round-robin over available indices
+                chosen = np.concatenate([chosen, np.arange(total_required - n) % n])
+            slot_dates = candidate_dates[chosen]
+        slot_champ = np.zeros(len(slot_dates), dtype=bool)
+        slot_champ[self._even_indices(total_required, int(champ_per_series))] = True
+        slot_champ &= slot_dates.year >= 1897
+
+        # Series running in each planned season, in table order
+        series = series_model.series
+        planned = []
+        for season in seasons:
+            active = series[(series["start_year"].astype(int) <= season) & (series["end_year"].astype(int) >= season)]
+            planned.append(active.assign(season=int(season)))
+        if not planned:
+            return
+        planned = pd.concat(planned, ignore_index=True)
+        if planned.empty:
+            return
+
+        n_races = len(planned) * len(slot_dates)
+        per_series = np.repeat(np.arange(len(planned)), len(slot_dates))
+        per_slot = np.tile(np.arange(len(slot_dates)), len(planned))
+
+        # Choose a random circuit and a matching layout for every race
+        circuit_ids, layout_start, layout_count, layouts = self._layouts_by_circuit()
+        if layouts.empty:
+            return
+        circuit_pick = self.rng.integers(0, len(circuit_ids), n_races)
+        has_layout = layout_count[circuit_pick] > 0
+        layout_pick = layout_start[circuit_pick] + (
+                self.rng.random(n_races) * np.maximum(layout_count[circuit_pick], 1)
+        ).astype("int64")
+        layout_pick = np.minimum(layout_pick, max(len(layouts) - 1, 0))
+
+        # Determine wetness: a trigger roll and a strength roll if triggered
+        wet_roll = self.rng.integers(RAIN_TRIGGER_MIN, RAIN_TRIGGER_MAX + 1, n_races)
+        wet_strength = self.rng.integers(RAIN_STRENGTH_MIN, RAIN_STRENGTH_MAX + 1, n_races)
+        wet = np.where(wet_roll == RAIN_TRIGGER_MAX, wet_strength / 100 + 1, 1)
+
+        reputation = planned["reputation"].astype(int).to_numpy()[per_series]
+        safe_reputation = np.where(reputation != 0, reputation, 1)
+        start_id = 0 if self.races.empty else int(self.races["race_id"].max()) + 1
+
+        new_races = pd.DataFrame({
+            "race_id": 0,
+            "series_id": planned["series_id"].astype(int).to_numpy()[per_series],
+            "season": planned["season"].to_numpy()[per_series],
+            "track_id": circuit_ids[circuit_pick],
+            "layout_id": layouts["layout_id"].to_numpy()[layout_pick],
+            "track_safety": layouts["safety"].astype(float).to_numpy()[layout_pick],
+            "race_date": slot_dates[per_slot],
+            "name": ("Preteky " + planned["name"].astype(str)).to_numpy()[per_series],
+            "championship": slot_champ[per_slot],
+            "reputation": np.where(reputation != 0, 1000 // safe_reputation, 0),
+            "reward": np.where(reputation != 0, 1000000 // safe_reputation, 0),
+            "wet": wet,
+        })[has_layout].reset_index(drop=True)
+        new_races["race_id"] = np.arange(start_id, start_id + len(new_races))
+
+        if self.races.empty:
+            self.races = new_races
+        else:
+            self.races = pd.concat([self.races, new_races], ignore_index=True)
+
+    @staticmethod
+    def _candidate_race_dates(date: pd.Timestamp) -> pd.DatetimeIndex:
+        """Return all RACE_WEEKDAY dates within DAYS_PER_SEASON days from date."""
+        days = np.datetime64(date.normalize().date(), "D") + np.arange(DAYS_PER_SEASON)
+        # 1970-01-01 was a Thursday; weekday 0 is Monday
+        weekday = (days.astype("int64") + 3) % 7
+        race_weekday = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"].index(RACE_WEEKDAY)
+        return pd.DatetimeIndex(days[weekday == race_weekday].astype("datetime64[ns]"))
+
+    @staticmethod
+    def _even_indices(n: int, k: int) -> np.ndarray:
+        """Choose k indices from n positions roughly evenly distributed."""
+        if k <= 0:
+            return np.zeros(0, dtype="int64")
+        if n <= 0:
+            return np.zeros(k, dtype="int64")
+        if k == 1:
+            return np.array([n // 2], dtype="int64")
+        # distribute using linear spacing and round to nearest index
+        return np.rint(np.arange(k) * (n - 1) / (k - 1)).astype("int64")
+
+    def get_layout_registry(self) -> Registry:
+        """Return the circuit layout registry, recompiling it if circuit_layouts was replaced."""
+        return self.layout_registry.ensure(self.circuit_layouts)
+
+    def _layouts_by_circuit(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, pd.DataFrame]:
+        """
+        Return circuit_ids with, per circuit, the start offset and count of its layouts
+        in the returned layouts frame (layouts grouped by circuit, table order kept).
+        """
+        registry = self.get_layout_registry()
+        circuit_ids = self.circuits["circuit_id"].astype(int).to_numpy()
+        groups = [registry.ids_in_group(cid) for cid in circuit_ids]
+
+        layout_count = np.array([len(ids) for ids in groups], dtype="int64")
+        layout_start = np.concatenate([[0], np.cumsum(layout_count)[:-1]]).astype("int64")
+        layout_ids = [lid for ids in groups for lid in ids]
+        layouts = pd.DataFrame({
+            "layout_id": np.array(layout_ids, dtype="int64"),
+            "safety": [registry.value(lid, "safety") for lid in layout_ids],
+        })
+        return circuit_ids, layout_start, layout_count, layouts
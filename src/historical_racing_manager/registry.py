@@ -0,0 +1,116 @@
+from collections.abc import Hashable, Mapping
+from types import MappingProxyType
+
+import pandas as pd
+
+
+class Registry:
+    """Compiled id -> record and name -> id maps over one reference table.
+
+    The maps are built once per table and recompiled only when the table object
+    is replaced or its length changes, so lookups are dictionary reads instead of
+    DataFrame scans. Records are read-only snapshots of the row's columns, meant
+    for static reference data (names, layouts), not for values edited in place.
+    """
+
+    def __init__(self, id_col: str, name_cols: str | tuple[str, ...] | None = None,
+                 group_col: str | None = None):
+        self.id_col = id_col
+        self.name_cols = (name_cols,) if isinstance(name_cols, str) else tuple(name_cols or ())
+        self.group_col = group_col
+        self._table: pd.DataFrame | None = None
+        self._length = -1
+        self._records: Mapping[Hashable, Mapping] = MappingProxyType({})
+        self._ids_by_name: Mapping[Hashable, int] = MappingProxyType({})
+        self._ids_by_group: Mapping[Hashable, tuple] = MappingProxyType({})
+
+    def __getstate__(self) -> dict:
+        # The read-only maps cannot be pickled; they are compiled again from the table
+        state = self.__dict__.copy()
+        for attr in ("_records", "_ids_by_name", "_ids_by_group"):
+            state.pop(attr)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.refresh(self._table)
+
+    # --- Building ---
+    def refresh(self, table: pd.DataFrame) -> "Registry":
+        """Compile the maps from table, replacing the previous ones."""
+        records: dict[Hashable, Mapping] = {}
+        ids_by_name: dict[Hashable, int] = {}
+        ids_by_group: dict[Hashable, list] = {}
+
+        if table is not None and not table.empty and self.id_col in table.columns:
+            columns = list(table.columns)
+            for values in table.itertuples(index=False, name=None):
+                row = dict(zip(columns, values))
+                key = self._normalize(row[self.id_col])
+                if key is None or key in records:
+                    # first occurrence wins, like the .iat[0] lookups it replaces
+                    continue
+                records[key] = MappingProxyType(row)
+                # Names resolve to int ids only, the form id_of returns
+                if isinstance(key, int) and self.name_cols and all(col in row for col in self.name_cols):
+                    ids_by_name.setdefault(self._name_key(*(row[col] for col in self.name_cols)), key)
+                if self.group_col and self.group_col in row:
+                    ids_by_group.setdefault(self._normalize(row[self.group_col]), []).append(key)
+
+        self._table = table
+        self._length = len(table) if table is not None else -1
+        self._records = MappingProxyType(records)
+        self._ids_by_name = MappingProxyType(ids_by_name)
+        self._ids_by_group = MappingProxyType({k: tuple(v) for k, v in ids_by_group.items()})
+        return self
+
+    def ensure(self, table: pd.DataFrame) -> "Registry":
+        """Recompile only if table is not the one the maps were built from."""
+        if not self.is_built_for(table):
+            self.refresh(table)
+        return self
+
+    def is_built_for(self, table: pd.DataFrame) -> bool:
+        """Return True if the maps were compiled from exactly this table at its current length."""
+        return self._table is table and self._length == (len(table) if table is not None else -1)
+
+    @staticmethod
+    def _normalize(value) -> Hashable:
+        """Map numeric-looking IDs (1, 1.0, "1", np.int64(1)) to one int key."""
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            return None
+        try:
+            as_float = float(value)
+        except (TypeError, ValueError):
+            return value
+        return int(as_float) if as_float.is_integer() else as_float
+
+    @staticmethod
+    def _name_key(*parts) -> Hashable:
+        return parts[0] if len(parts) == 1 else tuple(parts)
+
+    # --- Lookups ---
+    def __contains__(self, id_value) -> bool:
+        return self._normalize(id_value) in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(self, id_value) -> Mapping | None:
+        """Return the read-only row for an ID, or None if it is unknown."""
+        return self._records.get(self._normalize(id_value))
+
+    def value(self, id_value, column: str, default=None):
+        """Return one column of the row for an ID, or default."""
+        row = self.record(id_value)
+        if row is None:
+            return default
+        return row.get(column, default)
+
+    def id_of(self, *name) -> int | None:
+        """Return the ID registered under a name (or name tuple), or None."""
+        return self._ids_by_name.get(self._name_key(*name))
+
+    def ids_in_group(self, group_value) -> tuple:
+        """Return the IDs whose group column equals group_value, in table order."""
+        return self._ids_by_group.get(self._normalize(group_value), ())
@@ -0,0 +1,118 @@
+import functools
+import json
+import pathlib
+import shutil
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from historical_racing_manager.consts import FILE_REPLAY_LOG, REPLAY_BASE_DIR
+
+# Controller methods that change the game on the player's behalf (see recorded)
+RECORDED_ACTIONS: set[str] = set()
+
+
+def recorded(method: Callable) -> Callable:
+    """Log the call in the controller's replay log (if it keeps one) before running it."""
+    RECORDED_ACTIONS.add(method.__name__)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        log = getattr(self, "replay_log", None)
+        if log is not None:
+            log.record(self, method.__name__, args, kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _encode(value: Any) -> Any:
+    """JSON form of an action argument; dicts become item lists so their int keys survive."""
+    if isinstance(value, dict):
+        return {"items": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {_decode(k): _decode(v) for k, v in value["items"]}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+class ReplayLog:
+    """The save a game was loaded from, its random streams at that point and the player actions since.
+
+    The simulation is deterministic given these, so replaying the actions on their
+    dates rebuilds the game exactly; a replay save stores only this log (and, for a
+    base that is not the packaged data, a copy of the base save).
+    """
+
+    def __init__(self, base: pathlib.Path, rng_state: dict, package: str | None = None):
+        self.base = base
+        self.rng_state = rng_state
+        # Name of the packaged data the base is, written instead of a copy of it
+        self.package = package
+        self.actions: list[dict] = []
+
+    def record(self, controller, action: str, args: tuple, kwargs: dict) -> None:
+        self.actions.append({
+            "date": controller.current_date.strftime("%Y-%m-%d"),
+            "team": controller.get_active_team(),
+            "team_id": _encode(controller.get_active_team_id()),
+            "action": action,
+            "args": _encode(args),
+            "kwargs": {name: _encode(value) for name, value in kwargs.items()},
+        })
+
+    def replay(self, controller, until: datetime) -> None:
+        """Simulate controller (loaded from the base with rng_state) forward, repeating every action on its date."""
+        for entry in self.actions:
+            if entry["action"] not in RECORDED_ACTIONS:
+                print(f"[Replay] Unknown action skipped: {entry['action']}")
+                continue
+            self._sim_to(controller, datetime.strptime(entry["date"], "%Y-%m-%d"))
+            controller.active_team, controller.active_team_id = entry["team"], entry["team_id"]
+            kwargs = {name: _decode(value) for name, value in entry["kwargs"].items()}
+            getattr(controller, entry["action"])(*_decode(entry["args"]), **kwargs)
+        self._sim_to(controller, until)
+
+    @staticmethod
+    def _sim_to(controller, date: datetime) -> None:
+        controller.current_date = controller.sim_day(controller.current_date, (date - controller.current_date).days)
+
+    # --- Persistence ---
+    def save(self, folder: pathlib.Path, date: datetime) -> None:
+        """Write the log to folder, with a copy of the base unless it is packaged data or folder itself."""
+        if self.package is not None:
+            base = {"package": self.package}
+        elif self.base.resolve() == folder.resolve():
+            base = {"folder": "."}
+        else:
+            target = folder / REPLAY_BASE_DIR
+            if self.base.resolve() != target.resolve():
+                shutil.rmtree(target, ignore_errors=True)
+                shutil.copytree(self.base, target, ignore=shutil.ignore_patterns(FILE_REPLAY_LOG, REPLAY_BASE_DIR))
+            base = {"folder": REPLAY_BASE_DIR}
+        log = {"date": date.strftime("%Y-%m-%d"), "base": base, "rng": self.rng_state, "actions": self.actions}
+        (folder / FILE_REPLAY_LOG).write_text(json.dumps(log))
+
+    @classmethod
+    def load(cls, folder: pathlib.Path, package_dir: pathlib.Path) -> tuple["ReplayLog", datetime] | None:
+        """The log saved in folder and the date it was saved at; None if folder is not a replay save."""
+        path = folder / FILE_REPLAY_LOG
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text())
+        package = data["base"].get("package")
+        base = package_dir / package if package is not None else folder / data["base"]["folder"]
+        log = cls(base, data["rng"], package)
+        log.actions = data["actions"]
+        return log, datetime.strptime(data["date"], "%Y-%m-%d")
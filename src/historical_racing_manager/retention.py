@@ -0,0 +1,55 @@
+from collections.abc import Mapping
+
+import pandas as pd
+
+# Retention policy table -> (model, prune method, attributes whose memory it frees)
+RETENTION_TABLES = {
+    "results": ("race_model", "collapse_results", ("results", "result_summaries")),
+    "standings": ("race_model", "prune_standings", ("standings_ledger",)),
+    "races": ("race_model", "prune_races", ("races",)),
+    "team_finances": ("teams_model", "prune_finances", ("team_finances",)),
+    "contracts": ("contracts_model", "prune_contracts",
+                  ("dt_contract", "st_contract", "cs_contract", "ms_contract", "mt_contract")),
+    "car_parts": ("manufacturer_model", "prune_parts", ("car_parts",)),
+}
+
+
+def memory_bytes(model, attrs) -> int:
+    """Memory held by the given DataFrame (or nbytes-reporting) attributes of a model."""
+    total = 0
+    for attr in attrs:
+        value = getattr(model, attr, None)
+        if isinstance(value, pd.DataFrame):
+            total += int(value.memory_usage(index=True, deep=True).sum())
+        elif value is not None and hasattr(value, "nbytes"):
+            total += int(value.nbytes)
+    return total
+
+
+def apply_retention(models: dict, year: int, policy: Mapping[str, int | None]) -> dict[str, tuple[int, int]]:
+    """
+    Prune history older than the policy allows, at the start of season year.
+
+    policy maps a RETENTION_TABLES name to the number of seasons kept (None keeps
+    everything). Returns table -> (rows dropped, bytes reclaimed) for tables that shrank.
+    """
+    report = {}
+    for table, seasons in policy.items():
+        if not seasons or table not in RETENTION_TABLES:
+            continue
+        model_name, method, attrs = RETENTION_TABLES[table]
+        model = models.get(model_name)
+        if model is None or not hasattr(model, method):
+            continue
+        before = memory_bytes(model, attrs)
+        rows = getattr(model, method)(year - seasons)
+        if rows:
+            report[table] = (rows, before - memory_bytes(model, attrs))
+    return report
+
+
+def describe_report(year: int, report: Mapping[str, tuple[int, int]]) -> str:
+    """One-line summary of an apply_retention report."""
+    freed = sum(saved for _, saved in report.values())
+    details = ", ".join(f"{table} -{rows} rows" for table, (rows, _) in report.items())
+    return f"[Retention] {year}: {details}; {freed / 1024:.0f} KB reclaimed"
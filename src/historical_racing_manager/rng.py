@@ -0,0 +1,80 @@
+import json
+import pathlib
+from collections.abc import Sequence
+
+import numpy as np
+
+from historical_racing_manager.consts import FILE_RNG_STATE, RNG_STREAMS
+
+
+class RandomStreams:
+    """One numpy Generator per subsystem, all spawned from one root SeedSequence.
+
+    Each model draws only from its own stream (see RNG_STREAMS), so a change in how
+    often one subsystem draws does not shift the numbers of the others. The states
+    of the streams are saved with the game, so a loaded game continues with
+    exactly the numbers it would have drawn without the save.
+    """
+
+    def __init__(self, seed: int | np.random.SeedSequence | None = None):
+        self.generators: dict[str, np.random.Generator] = {}
+        self.reseed(seed)
+
+    def reseed(self, seed: int | np.random.SeedSequence | None = None) -> None:
+        """Restart every stream from seed, keeping the Generator objects the models hold."""
+        self.root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        names = sorted(set(RNG_STREAMS.values()))
+        for name, child in zip(names, self.root.spawn(len(names))):
+            fresh = np.random.default_rng(child)
+            if name in self.generators:
+                self.generators[name].bit_generator.state = fresh.bit_generator.state
+            else:
+                self.generators[name] = fresh
+
+    @property
+    def seed(self) -> int | Sequence[int]:
+        """Entropy of the root; RandomStreams(seed) starts the same streams again."""
+        entropy = self.root.entropy
+        # SeedSequence draws fresh entropy when it is given none
+        assert entropy is not None
+        return entropy
+
+    def __getitem__(self, name: str) -> np.random.Generator:
+        return self.generators[name]
+
+    def spawn(self, n: int) -> list["RandomStreams"]:
+        """n independent sets of streams, e.g. one per parallel run."""
+        return [RandomStreams(child) for child in self.root.spawn(n)]
+
+    def bind(self, owner) -> None:
+        """Give every model of owner (e.g. the controller, see RNG_STREAMS) the stream it draws from."""
+        for attr, stream in RNG_STREAMS.items():
+            model = getattr(owner, attr, None)
+            if model is not None:
+                model.rng = self.generators[stream]
+
+    # --- Persistence ---
+    def get_state(self) -> dict:
+        return {
+            "seed": self.root.entropy,
+            "spawn_key": list(self.root.spawn_key),
+            "streams": {name: gen.bit_generator.state for name, gen in self.generators.items()},
+        }
+
+    def set_state(self, state: dict) -> None:
+        """Restore the streams of get_state(); streams missing from state start from the seed."""
+        self.reseed(np.random.SeedSequence(state["seed"], spawn_key=tuple(state.get("spawn_key", ()))))
+        for name, saved in state.get("streams", {}).items():
+            if name in self.generators:
+                self.generators[name].bit_generator.state = saved
+
+    def save(self, folder: pathlib.Path) -> None:
+        (folder / FILE_RNG_STATE).write_text(json.dumps(self.get_state()))
+
+    def load(self, folder: pathlib.Path) -> bool:
+        """Restore the streams saved in folder; returns False if the save has none."""
+        path = folder / FILE_RNG_STATE
+        if not path.exists():
+            return False
+        self.set_state(json.loads(path.read_text()))
+        return True
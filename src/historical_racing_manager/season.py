@@ -0,0 +1,266 @@
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager.consts import (
+    RNG_PICK_MAX,
+    RNG_PICK_THRESHOLD,
+    SPEED_MULTIPLIER,
+    CRASH_CODE,
+    DEATH_CODE,
+    RESULT_COLUMNS,
+    STANDINGS_TYPES,
+)
+
+GOOD, CRASH, DEATH = 0, 1, 2
+
+
+class SeasonBatch:
+    """Pre-simulated rounds of one series-season that share the same grid.
+
+    RaceModel commits the rounds one by one on their race days. The batch is only
+    valid while the grid it was simulated for (``signature``) is unchanged and the
+    rounds are consumed in order.
+    """
+
+    def __init__(self, signature: tuple, race_ids: list[int], results: list[pd.DataFrame],
+                 standings: list[pd.DataFrame | None], rep_drivers: list[list[int]],
+                 rep_teams: list[list[int]], died: list[list[int]], crashes: list[int], deaths: list[int]):
+        self.signature = signature
+        self.race_ids = race_ids
+        self.results = results
+        self.standings = standings
+        self.rep_drivers = rep_drivers
+        self.rep_teams = rep_teams
+        self.died = died
+        self.crashes = crashes
+        self.deaths = deaths
+        self.next_round = 0
+
+    def matches(self, race_id: int, signature: tuple) -> bool:
+        """Return True if race_id is the next pending round and the grid is unchanged."""
+        return (
+                self.next_round < len(self.race_ids)
+                and self.race_ids[self.next_round] == int(race_id)
+                and self.signature == signature
+        )
+
+    @property
+    def exhausted(self) -> bool:
+        return self.next_round >= len(self.race_ids)
+
+
+def simulate_season_batch(grid: dict[str, np.ndarray], rounds: pd.DataFrame, corners: np.ndarray,
+                          cts: dict[str, int], points: np.ndarray, last_blocks: dict[str, tuple[int, pd.DataFrame]],
+                          base_round: int, signature: tuple,
+                          rng: np.random.Generator | None = None) -> SeasonBatch:
+    """
+    Simulate every round in ``rounds`` on the same grid as one (races x cars) computation.
+
+    Mirrors RaceModel.prepare_race/simulate_race/_update_standings: per-race car stats,
+    outcomes and finishing orders are drawn for all rounds at once, and cumulative
+    championship points are derived with a running sum over the championship rounds.
+
+    Parameters
+    ----------
+    grid : dict[str, np.ndarray]
+        Per-car arrays: driver_id, team_id, car_id, ability, power, reliability, safety,
+        engine_id, chassi_id, pneu_id.
+    rounds : pd.DataFrame
+        Races to simulate, in running order (race_id, series_id, season, track_safety,
+        wet, championship, reputation).
+    corners : np.ndarray
+        Number of corners of each round's layout.
+    cts : dict[str, int]
+        Number of cars counting for each standings type.
+    points : np.ndarray
+        Points awarded per finishing position (index 0 = winner).
+    last_blocks : dict[str, tuple[int, pd.DataFrame]]
+        Per standings type, the last recorded round and its standings block.
+    base_round : int
+        Last championship round already recorded for the series-season.
+    signature : tuple
+        Grid signature stored on the batch for later validation.
+    rng : np.random.Generator, optional
+        Stream all outcomes and rankings are drawn from (RaceModel passes its own).
+    """
+    rng = rng or np.random.default_rng()
+    n_races, n_cars = len(rounds), len(grid["driver_id"])
+    speed, reliability, safety, grid_order = car_stats(grid, rounds, corners)
+
+    # --- Outcomes (simulate_race/_simulate_outcome) ---
+    rnd1 = rng.integers(0, np.maximum(speed * SPEED_MULTIPLIER, 1))
+    rnd2 = rng.integers(0, speed + 1)
+    failed = (speed <= 0) | (rnd1 < reliability)
+    outcome = np.where(failed, np.where((speed > 0) & (rnd2 < safety), DEATH, CRASH), GOOD)
+
+    # Finishers first, then crashes, then deaths, each group in grid order
+    outcome_in_grid = np.take_along_axis(outcome, grid_order, axis=1)
+    entries = np.take_along_axis(grid_order, np.argsort(outcome_in_grid, axis=1, kind="stable"), axis=1)
+    entry_outcome = np.take_along_axis(outcome, entries, axis=1)
+    finishers = (entry_outcome == GOOD).sum(axis=1)
+
+    # --- Finishing order among finishers ---
+    entries = _rank_finishers(entries, finishers, rng)
+
+    # --- Results, reputations and counters ---
+    race_ids = rounds["race_id"].astype(int).tolist()
+    championship = rounds["championship"].fillna(False).astype(bool).to_numpy()
+    round_no = np.where(championship, base_round + np.cumsum(championship), 0)
+    season = rounds["season"].astype(int).to_numpy()
+    series_id = rounds["series_id"].astype(int).to_numpy()
+
+    position = np.where(
+        np.arange(n_cars)[None, :] < finishers[:, None],
+        np.arange(1, n_cars + 1)[None, :],
+        np.where(entry_outcome == DEATH, DEATH_CODE, CRASH_CODE),
+    )
+    # Ranking only reorders the finisher prefix, so entry_outcome still lines up with entries
+    results = []
+    rep_drivers, rep_teams, died, crashes, deaths = [], [], [], [], []
+    for r in range(n_races):
+        c = entries[r]
+        results.append(pd.DataFrame({
+            "race_id": race_ids[r],
+            "driver_id": grid["driver_id"][c],
+            "team_id": grid["team_id"][c],
+            "car_id": grid["car_id"][c],
+            "position": position[r],
+            "season": season[r],
+            "series_id": series_id[r],
+            "round": round_no[r],
+            "engine_id": grid["engine_id"][c],
+            "chassi_id": grid["chassi_id"][c],
+            "pneu_id": grid["pneu_id"][c],
+        }, columns=RESULT_COLUMNS).astype("int64"))
+        finished = c[:finishers[r]]
+        rep_drivers.append(grid["driver_id"][finished].astype(int).tolist())
+        rep_teams.append(grid["team_id"][finished].astype(int).tolist())
+        died.append(grid["driver_id"][c[entry_outcome[r] == DEATH]].astype(int).tolist())
+        crashes.append(int((entry_outcome[r] == CRASH).sum()))
+        deaths.append(int((entry_outcome[r] == DEATH).sum()))
+
+    standings = _standings_blocks(grid, entries, finishers, championship, race_ids, season, series_id,
+                                  cts, points, last_blocks)
+
+    return SeasonBatch(signature, race_ids, results, standings, rep_drivers, rep_teams, died, crashes, deaths)
+
+
+def car_stats(grid: dict[str, np.ndarray], rounds: pd.DataFrame,
+              corners: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-race (races x cars) speed, reliability and safety as prepare_race and
+    simulate_race derive them, plus each race's grid order (highest total ability first).
+    """
+    n_races, n_cars = len(rounds), len(grid["driver_id"])
+    wet = pd.to_numeric(rounds["wet"], errors="coerce").fillna(1).replace(0, 1).to_numpy(dtype=float)
+    wet_val = np.maximum(wet, 1.0)
+    track_factor = np.maximum((corners / wet_val).astype("int64"), 1)
+    power = grid["power"].astype("int64")
+    reliability = (grid["reliability"][None, :] * wet_val[:, None]).astype("int64")
+    safety = (grid["safety"][None, :] * wet_val[:, None]).astype("int64")
+    total = power[None, :] * track_factor[:, None] + grid["ability"].astype("int64")[None, :] * 100
+    grid_order = np.argsort(-total, axis=1, kind="stable")
+
+    track_safety = pd.to_numeric(rounds["track_safety"], errors="coerce").fillna(1).replace(0, 1).to_numpy(
+        dtype=float)
+    reliability = (reliability * (track_safety * wet)[:, None]).astype("int64")
+    speed = np.broadcast_to(np.maximum(power, 0), (n_races, n_cars))
+    return speed, np.maximum(reliability, 0), np.maximum(safety, 0), grid_order
+
+
+def _rank_finishers(entries: np.ndarray, finishers: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Reorder the finisher prefix of each row the way simulate_race ranks finishers.
+
+    simulate_race scans the remaining pool in grid order and takes each car with
+    probability p, restarting the scan if nobody was taken; the pick is therefore the
+    k-th remaining car with a geometric distribution truncated to the pool size.
+    """
+    n_races, n_cars = entries.shape
+    ranked = entries.copy()
+    if n_cars == 0:
+        return ranked
+
+    q = 1 - RNG_PICK_THRESHOLD / (RNG_PICK_MAX + 1)
+    rows = np.arange(n_races)
+    pool = np.arange(n_cars)[None, :] < finishers[:, None]
+
+    for step in range(int(finishers.max(initial=0))):
+        active = finishers > step
+        remaining = finishers - step
+        u = rng.random(n_races)
+        if q > 0:
+            offset = np.floor(np.log1p(-u * (1 - q ** remaining)) / np.log(q)).astype("int64")
+        else:
+            offset = np.zeros(n_races, dtype="int64")
+        offset = np.clip(offset, 0, np.maximum(remaining - 1, 0))
+
+        # Column of the (offset + 1)-th car still in the pool
+        rank_in_pool = np.cumsum(pool, axis=1)
+        chosen = np.argmax(pool & (rank_in_pool == (offset + 1)[:, None]), axis=1)
+
+        ranked[active, step] = entries[rows[active], chosen[active]]
+        pool[rows[active], chosen[active]] = False
+    return ranked
+
+
+def _standings_blocks(grid: dict[str, np.ndarray], entries: np.ndarray, finishers: np.ndarray,
+                      championship: np.ndarray, race_ids: list[int], season: np.ndarray, series_id: np.ndarray,
+                      cts: dict[str, int], points: np.ndarray,
+                      last_blocks: dict[str, tuple[int, pd.DataFrame]]) -> list[pd.DataFrame | None]:
+    """Build the standings blocks of every championship round (None for other rounds)."""
+    n_races, n_cars = entries.shape
+    blocks: list[list[pd.DataFrame]] = [[] for _ in range(n_races)]
+
+    # Points for each entry slot: finishers by position, non-finishers nothing
+    slot = np.arange(n_cars)
+    slot_points = np.where(slot < len(points), np.pad(points, (0, max(n_cars - len(points), 0)))[:n_cars], 0)
+    entry_points = np.where(slot[None, :] < finishers[:, None], slot_points[None, :], 0)
+
+    champ_rounds = np.flatnonzero(championship)
+    for typ in STANDINGS_TYPES:
+        subjects, subject_idx = np.unique(grid[f"{typ}_id"], return_inverse=True)
+        limit = cts.get(typ, 1)
+
+        # Only the first `limit` entries of each subject score
+        one_hot = subject_idx[entries][:, :, None] == np.arange(len(subjects))[None, None, :]
+        occurrence = np.cumsum(one_hot, axis=1)
+        counted = (one_hot & (occurrence <= limit)).any(axis=2)
+        race_points = np.einsum("rn,rns->rs", entry_points * counted, one_hot.astype("int64"))
+        cars_left = limit - np.minimum(np.bincount(subject_idx, minlength=len(subjects)), limit)
+
+        last_round, last_block = last_blocks.get(typ, (0, pd.DataFrame(columns=["subject_id", "points"])))
+        if last_block.empty:
+            prev_points = np.zeros(len(subjects), dtype="int64")
+            carried = pd.DataFrame()
+        else:
+            prev = pd.to_numeric(last_block.set_index("subject_id")["points"], errors="coerce")
+            prev_points = pd.Series(subjects).map(prev).fillna(0).astype("int64").to_numpy()
+            carried = last_block[~last_block["subject_id"].isin(subjects)]
+
+        cumulative = prev_points[None, :] + np.cumsum(race_points[champ_rounds], axis=0)
+        for i, r in enumerate(champ_rounds):
+            block = pd.DataFrame({
+                "subject_id": subjects,
+                "cars": cars_left,
+                "points": cumulative[i],
+                "race_id": race_ids[r],
+                "year": int(season[r]),
+                "round": int(last_round) + i + 1,
+                "position": 0,
+                "series_id": int(series_id[r]),
+                "typ": typ,
+            })
+            if not carried.empty:
+                extra = carried[["subject_id", "points", "year", "position", "series_id"]].assign(
+                    race_id=race_ids[r], round=int(last_round) + i + 1, typ=typ
+                )
+                block = pd.concat([block, extra[block.columns.drop("cars")]], ignore_index=True)
+            block["points"] = block["points"].astype(int)
+            block = block.sort_values(by=["points", "subject_id"], ascending=[False, True]).reset_index(drop=True)
+            block["position"] = block["points"].rank(method="min", ascending=False).astype(int)
+            for col in ["subject_id", "series_id", "year", "round"]:
+                block[col] = block[col].astype(int)
+            blocks[r].append(block)
+
+    return [pd.concat(b, ignore_index=True) if b else None for b in blocks]
@@ -14,6 +14,8 @@ from historical_racing_manager.consts import (
     COL_RULE_START,
     COL_RULE_END,
 )
+from historical_racing_manager.registry import Registry
+from historical_racing_manager.versioning import mutates
 
 
 class SeriesModel:
@@ -27,10 +29,14 @@ class SeriesModel:
     """
 
     def __init__(self):
+        self.version = 0
         # DataFrames holding series definitions and point rules
         self.series = pd.DataFrame()
         self.point_rules = pd.DataFrame()
+        # Compiled series_id -> record and name -> series_id maps
+        self.registry = Registry(COL_SERIES_ID, COL_SERIES_NAME)
 
+    @mutates
     def load(self, folder: pathlib.Path) -> bool:
         """
         Load series and point rules CSV files from the given folder.
@@ -55,6 +61,7 @@ class SeriesModel:
         # Read CSV files into DataFrames
         self.series = pd.read_csv(series_path)
         self.point_rules = pd.read_csv(points_path)
+        self.registry.refresh(self.series)
         return True
 
     def save(self, folder: pathlib.Path):
@@ -71,24 +78,13 @@ class SeriesModel:
         """
         Return list of series names for the provided series_ids in the same order.
         If an ID is not found, an empty string is returned for that position.
-        Relies on self.get_series() which returns a DataFrame with columns
-        [COL_SERIES_ID, COL_SERIES_NAME].
         """
-        df = self.get_series()
-        if df is None or df.empty:
-            return ["" for _ in series_ids]
+        registry = self.get_registry()
+        return [registry.value(sid, COL_SERIES_NAME, "") for sid in series_ids]
 
-        # Normalize lookup column to string for robust matching
-        lookup = df.copy()
-        lookup["sid_norm"] = lookup[COL_SERIES_ID].astype(str)
-        lookup = lookup.set_index("sid_norm")[COL_SERIES_NAME].to_dict()
-
-        result: list[str] = []
-        for sid in series_ids:
-            key = str(sid)
-            result.append(lookup.get(key, ""))
-
-        return result
+    def get_registry(self) -> Registry:
+        """Return the series registry, recompiling it if self.series was replaced."""
+        return self.registry.ensure(self.series)
 
     def get_series(self) -> pd.DataFrame:
         """
@@ -114,8 +110,7 @@ class SeriesModel:
         Returns:
             int | None: The series ID if found, otherwise None.
         """
-        result = self.series.query(f"{COL_SERIES_NAME} == @series_name")
-        return result[COL_SERIES_ID].iat[0] if not result.empty else None
+        return self.get_registry().id_of(series_name)
 
     def _active_series_mask(self, year: int) -> pd.Series:
         """
@@ -0,0 +1,291 @@
+import argparse
+import json
+import pathlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager.consts import (
+    API_HOST, API_PORT, API_WORKERS, API_RACE_HISTORY, SAVE_MODE,
+)
+from historical_racing_manager.controller import Controller, USER_DIR
+from historical_racing_manager.feed import RaceFinished
+
+# Save names the game ships with
+RESERVED_SAVE_NAMES = ("default_data", "original", "custom_original")
+
+
+def to_json(value):
+    """Plain JSON form of a view: frames become lists of row dicts."""
+    if isinstance(value, pd.DataFrame):
+        return json.loads(value.to_json(orient="records", date_format="iso"))
+    if isinstance(value, dict):
+        return {str(k): to_json(v) for k, v in value.items()}
+    if hasattr(value, "_asdict"):
+        return to_json(value._asdict())
+    if isinstance(value, (list, tuple)):
+        return [to_json(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class GameServer:
+    """Local HTTP/JSON API over a headless game.
+
+    GET endpoints answer from a read snapshot of the game published after every
+    simulation command (see Controller.publish_snapshot), so readers never wait
+    for the simulation and never see a half simulated day. Each of the workers
+    threads reads its own copy of the snapshot, so up to workers reads run at
+    once, each copy with its own view cache. POST endpoints queue commands on
+    one simulation thread.
+
+    GET  /api/state, /api/teams, /api/team?id=, /api/standings?series=&season=,
+         /api/results?series=&season=, /api/stats?subject=&type=&manufacturer_type=,
+         /api/races?after=seq (the races finished since seq, as they are simulated)
+    POST /api/advance {"days": n}, /api/next_race, /api/save {"name": ..., "mode": ...}
+    """
+
+    def __init__(self, controller: Controller, host: str = API_HOST, port: int = API_PORT,
+                 workers: int = API_WORKERS):
+        self.controller = controller
+        controller.publish_snapshot()
+        # The last API_RACE_HISTORY races as (seq, event), reported while commands run
+        self._races: deque[tuple[int, RaceFinished]] = deque(maxlen=API_RACE_HISTORY)
+        self._race_seq = 0
+        self._race_lock = threading.Lock()
+        controller.race_listeners.append(self._on_race)
+        self._simulation = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simulation")
+        self.httpd = _PooledHTTPServer((host, port), _Handler, workers)
+        self.httpd.game = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        host, port = self.httpd.server_address[:2]
+        return str(host), int(port)
+
+    def serve_forever(self) -> None:
+        self.httpd.serve_forever()
+
+    def start(self) -> None:
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="api", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._on_race in self.controller.race_listeners:
+            self.controller.race_listeners.remove(self._on_race)
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread = None
+        self.httpd.server_close()
+        self._simulation.shutdown()
+        self.controller.retire_snapshot()
+
+    # --- Snapshots ---
+    def publish(self) -> None:
+        """Replace the read snapshot with a copy of the game as it is now."""
+        # The previous snapshot is closed once its last reader leaves. The archive of a snapshot is a
+        # read-only view (see SeasonArchive.snapshot), copied only if the game archived seasons since
+        self.controller.publish_snapshot()
+
+    def _on_race(self, event: RaceFinished) -> None:
+        with self._race_lock:
+            self._race_seq += 1
+            self._races.append((self._race_seq, event))
+
+    def read(self, view):
+        """Compute view(snapshot) on this thread's copy of the read snapshot and return its JSON form."""
+        with self.controller.reading_snapshot() as snapshot:
+            return to_json(view(snapshot))
+
+    def command(self, step, publish: bool = True):
+        """Run step(controller) on the simulation thread, then publish a new snapshot."""
+        def run():
+            result = step(self.controller)
+            if publish:
+                self.publish()
+            return result
+
+        return self._simulation.submit(run).result()
+
+    # --- Endpoints ---
+    def state(self, params: dict) -> dict:
+        return self.read(lambda c: {
+            "date": c.get_date(),
+            "year": c.get_year(),
+            "active_team": c.get_active_team(),
+            "series": c.get_series_names(),
+        })
+
+    def teams(self, params: dict) -> list:
+        return self.read(lambda c: c.get_team_owners())
+
+    def team(self, params: dict) -> dict:
+        if "id" not in params:
+            return self.read(lambda c: c.get_active_team_info())
+        team_id = int(params["id"])
+        return self.read(lambda c: {
+            "staff": c.get_team_staff(team_id),
+            "finances": c.get_team_finances(team_id),
+            "upcoming_races": c.get_upcoming_races(team_id),
+        })
+
+    def standings(self, params: dict) -> list:
+        return self.read(lambda c: c.get_standings(params["series"], params.get("season", str(c.get_year()))))
+
+    def results(self, params: dict) -> list:
+        return self.read(lambda c: c.get_results(params["series"], params.get("season", str(c.get_year()))))
+
+    def stats(self, params: dict) -> list:
+        return self.read(lambda c: c.get_stats(params["subject"], params.get("type", "Drivers"),
+                                               params.get("manufacturer_type", "")))
+
+    def races(self, params: dict) -> list:
+        after = int(params.get("after", 0))
+        with self._race_lock:
+            events = [dict(event._asdict(), seq=seq) for seq, event in self._races if seq > after]
+        return to_json(events)
+
+    def advance(self, params: dict) -> dict:
+        days = int(params.get("days", 1))
+        if days < 0:
+            raise ValueError("days must not be negative")
+        return self.command(lambda c: self._advance_to(c, c.advance_target("days", days)))
+
+    def next_race(self, params: dict) -> dict:
+        return self.command(lambda c: self._advance_to(c, c.advance_target("next_race")))
+
+    def save(self, params: dict) -> dict:
+        name = str(params["name"])
+        if not name or name.startswith(".") or pathlib.Path(name).name != name or name in RESERVED_SAVE_NAMES:
+            raise ValueError(f"Invalid save name: {name}")
+        mode = params.get("mode", SAVE_MODE)
+        self.command(lambda c: c.save_game(name, mode), publish=False)
+        return {"saved": name, "mode": mode}
+
+    @staticmethod
+    def _advance_to(controller: Controller, stop: datetime) -> dict:
+        while controller.current_date < stop:
+            controller.advance_day()
+        return {"date": controller.get_date()}
+
+
+READS = {
+    "/api/state": GameServer.state,
+    "/api/teams": GameServer.teams,
+    "/api/team": GameServer.team,
+    "/api/standings": GameServer.standings,
+    "/api/results": GameServer.results,
+    "/api/stats": GameServer.stats,
+    "/api/races": GameServer.races,
+}
+COMMANDS = {
+    "/api/advance": GameServer.advance,
+    "/api/next_race": GameServer.next_race,
+    "/api/save": GameServer.save,
+}
+
+
+class _PooledHTTPServer(HTTPServer):
+    """HTTPServer answering requests on a fixed pool of threads."""
+
+    def __init__(self, address: tuple[str, int], handler, workers: int):
+        super().__init__(address, handler)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api")
+        self.game: GameServer | None = None
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _PooledHTTPServer
+
+    def do_GET(self):
+        self._dispatch(READS)
+
+    def do_POST(self):
+        self._dispatch(COMMANDS)
+
+    def _dispatch(self, routes: dict) -> None:
+        url = urlsplit(self.path)
+        endpoint = routes.get(url.path)
+        if endpoint is None:
+            self._reply(404, {"error": f"Unknown endpoint: {self.command} {url.path}"})
+            return
+        try:
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                params.update(json.loads(self.rfile.read(length)))
+            payload = endpoint(self.server.game, params)
+        except (KeyError, ValueError, TypeError) as e:
+            self._reply(400, {"error": f"Bad request: {e}"})
+            return
+        except Exception as e:
+            print(f"[Server] Error on {self.command} {url.path}: {e}")
+            self._reply(500, {"error": str(e)})
+            return
+        self._reply(200, payload)
+
+    def _reply(self, status: int, payload) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Requests are not logged; errors are printed by _dispatch
+        pass
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve a saved game as a local JSON API.")
+    parser.add_argument("save", help="name of the saved game folder")
+    parser.add_argument("--folder", type=pathlib.Path, default=USER_DIR, help="folder holding the save")
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    args = parser.parse_args(argv)
+
+    controller = Controller(headless=True)
+    if not controller.load_game(args.save, base_folder=args.folder):
+        return 1
+    server = GameServer(controller, args.host, args.port)
+    host, port = server.address
+    print(f"Serving {args.save} on http://{host}:{port}/api/state")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        controller.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+import io
+import mmap
+import pathlib
+import pickle
+from multiprocessing import shared_memory
+from typing import Literal
+
+import numpy as np
+
+from historical_racing_manager.consts import SNAPSHOT_ALIGNMENT, SNAPSHOT_MIN_ARRAY_BYTES
+
+# Where POSIX shared memory blocks can be opened as files
+SHM_DIR = pathlib.Path("/dev/shm")
+
+
+def _shareable(obj) -> bool:
+    """True for plain numeric/bool/datetime arrays big enough to be worth sharing."""
+    return (type(obj) is np.ndarray and obj.dtype.kind in "biufcmM" and obj.nbytes >= SNAPSHOT_MIN_ARRAY_BYTES
+            and (obj.flags.c_contiguous or obj.flags.f_contiguous))
+
+
+class _ExportPickler(pickle.Pickler):
+    """Pickles everything but the shareable arrays, which it lays out for the shared block."""
+
+    def __init__(self, file):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.arrays: list[tuple[int, np.ndarray]] = []
+        self.end = 0
+
+    def persistent_id(self, obj):
+        if not _shareable(obj):
+            return None
+        offset = -(-self.end // SNAPSHOT_ALIGNMENT) * SNAPSHOT_ALIGNMENT
+        self.arrays.append((offset, obj))
+        self.end = offset + obj.nbytes
+        order = "C" if obj.flags.c_contiguous else "F"
+        return offset, obj.dtype.str, obj.shape, order
+
+
+class _AttachUnpickler(pickle.Unpickler):
+    """Rebuilds the state with its arrays viewing a buffer instead of copies."""
+
+    def __init__(self, file, buffer):
+        super().__init__(file)
+        self.buffer = buffer
+
+    def persistent_load(self, pid):
+        offset, dtype, shape, order = pid
+        return np.ndarray(shape, np.dtype(dtype), buffer=self.buffer, offset=offset, order=order)
+
+
+class SharedSnapshot:
+    """A picklable state (e.g. the models of a game) exported into one shared memory block.
+
+    Numeric columns of DataFrames and other large arrays are written into the
+    block once; everything else (strings, dicts, model objects) is pickled into
+    the same block. The manifest (block name and where the pickled part is) is
+    all a worker needs to attach(): it maps the block privately, so the arrays
+    are read in place without copying and a page is only copied when the worker
+    writes to it. The exporting process owns the block and frees it with close().
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, manifest: dict):
+        self.shm = shm
+        self.manifest = manifest
+
+    @classmethod
+    def export(cls, state) -> "SharedSnapshot":
+        """Write state into a new shared memory block."""
+        out = io.BytesIO()
+        pickler = _ExportPickler(out)
+        pickler.dump(state)
+        pickled = out.getbuffer()
+        start = -(-pickler.end // SNAPSHOT_ALIGNMENT) * SNAPSHOT_ALIGNMENT
+        size = start + len(pickled)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        buf = shm.buf
+        assert buf is not None
+        for offset, array in pickler.arrays:
+            order: Literal["C", "F"] = "C" if array.flags.c_contiguous else "F"
+            np.ndarray(array.shape, array.dtype, buffer=buf, offset=offset, order=order)[...] = array
+        buf[start:size] = pickled
+        manifest = {"name": shm.name, "size": size, "state": (start, len(pickled)), "arrays": len(pickler.arrays)}
+        return cls(shm, manifest)
+
+    @property
+    def nbytes(self) -> int:
+        return self.manifest["size"]
+
+    def close(self) -> None:
+        """Free the block; processes still attached keep their mapping."""
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "SharedSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _private_buffer(name: str, size: int):
+    """A copy-on-write mapping of a shared memory block, or a private copy where it cannot be mapped so."""
+    path = SHM_DIR / name.lstrip("/")
+    if path.exists():
+        with open(path, "rb") as file:
+            return mmap.mmap(file.fileno(), size, access=mmap.ACCESS_COPY)
+    # No file to map privately (e.g. Windows): copy the block once
+    shm = shared_memory.SharedMemory(name=name)
+    buf = shm.buf
+    assert buf is not None
+    try:
+        return bytearray(buf[:size])
+    finally:
+        shm.close()
+
+
+def attach(manifest: dict):
+    """
+    Rebuild the state of a SharedSnapshot from its manifest.
+
+    Every call returns an independent copy: its arrays view a private mapping
+    of the block, so writes stay in this copy and never reach the snapshot.
+    """
+    buffer = _private_buffer(manifest["name"], max(manifest["size"], 1))
+    start, length = manifest["state"]
+    return _AttachUnpickler(io.BytesIO(memoryview(buffer)[start:start + length]), buffer).load()
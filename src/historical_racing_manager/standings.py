@@ -0,0 +1,252 @@
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager.consts import STANDINGS_TYPES
+
+# Stored form: one row per subject whose points changed in a round (or who appeared for the first time)
+DELTA_COLUMNS = ["series_id", "year", "round", "race_id", "typ", "subject_id", "delta"]
+# Form of a standings block: every subject of the season with its points after the round
+BLOCK_COLUMNS = ["subject_id", "points", "race_id", "year", "round", "position", "series_id", "typ"]
+TYPE_CODES = {typ: code for code, typ in enumerate(STANDINGS_TYPES)}
+# Type code and subject_id packed into one int64 key (subject ids stay far below 2**40)
+KEY_SHIFT = 40
+
+
+def _pack(typ: np.ndarray, subject: np.ndarray) -> np.ndarray:
+    return (np.asarray(typ, dtype="int64") << KEY_SHIFT) + np.asarray(subject, dtype="int64")
+
+
+class SeasonLedger:
+    """Point deltas of one series-season in round order.
+
+    ``offsets[i]`` is the number of delta rows recorded up to and including the
+    i-th round, so the standings after that round are a group-sum over a prefix
+    of the columns; ``total_keys`` (sorted packed typ/subject keys) and
+    ``total_points`` hold the points after the latest round.
+    """
+
+    def __init__(self):
+        self.rounds: list[int] = []
+        self.race_ids: list[int] = []
+        self.seq: list[int] = []
+        self.offsets: list[int] = []
+        self.total_keys = np.empty(0, dtype="int64")
+        self.total_points = np.empty(0, dtype="int64")
+        # round index -> {(typ code, subject): position} for imported blocks whose positions
+        # do not follow the points (never the case for rounds the game records itself)
+        self.positions: dict[int, dict[tuple[int, int], int]] = {}
+        self._chunks: list[np.ndarray] = []
+        self._columns: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return self.offsets[-1] if self.offsets else 0
+
+    @property
+    def columns(self) -> np.ndarray:
+        """(rows, 3) int64 array of typ code, subject_id and delta."""
+        if self._columns is None:
+            self._columns = (np.concatenate(self._chunks) if self._chunks
+                             else np.empty((0, 3), dtype="int64"))
+        return self._columns
+
+    def add(self, round_no: int, race_id: int, seq: int, typ: np.ndarray, subject: np.ndarray,
+            delta: np.ndarray) -> np.ndarray:
+        """Record one round; rows that change nothing (zero delta of a known subject) are dropped."""
+        keys = _pack(typ, subject)
+        keep = (delta != 0) | ~np.isin(keys, self.total_keys)
+        merged, inverse = np.unique(np.concatenate([self.total_keys, keys]), return_inverse=True)
+        self.total_points = np.bincount(inverse.reshape(-1), weights=np.concatenate([self.total_points, delta]),
+                                        minlength=len(merged)).astype("int64")
+        self.total_keys = merged
+        chunk = np.stack([typ, subject, delta], axis=1).astype("int64")[keep]
+        self.rounds.append(int(round_no))
+        self.race_ids.append(int(race_id))
+        self.seq.append(seq)
+        self.offsets.append(len(self) + len(chunk))
+        self._chunks.append(chunk)
+        self._columns = None
+        return chunk
+
+    def totals(self, typ: np.ndarray, subject: np.ndarray) -> np.ndarray:
+        """Points after the latest round of each typ code/subject pair (0 for subjects not seen yet)."""
+        keys = _pack(typ, subject)
+        if not len(self.total_keys):
+            return np.zeros(len(keys), dtype="int64")
+        pos = np.minimum(np.searchsorted(self.total_keys, keys), len(self.total_keys) - 1)
+        return np.where(self.total_keys[pos] == keys, self.total_points[pos], 0)
+
+    def points_after(self, index: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return (typ/subject keys, points) after the index-th recorded round (prefix sum)."""
+        rows = self.columns[:self.offsets[index]]
+        keys, inverse = np.unique(rows[:, :2], axis=0, return_inverse=True)
+        points = np.bincount(inverse.reshape(-1), weights=rows[:, 2], minlength=len(keys)).astype("int64")
+        return keys, points
+
+    def block(self, index: int, series_id: int, year: int) -> pd.DataFrame:
+        """Standings after the index-th round: ordered by type, points desc, subject_id; min-rank positions."""
+        keys, points = self.points_after(index)
+        order = np.lexsort((keys[:, 1], -points, keys[:, 0]))
+        keys, points = keys[order], points[order]
+        block = pd.DataFrame({
+            "subject_id": keys[:, 1],
+            "points": points,
+            "race_id": self.race_ids[index],
+            "year": int(year),
+            "round": self.rounds[index],
+            "position": 0,
+            "series_id": int(series_id),
+            "typ": np.array(STANDINGS_TYPES, dtype=object)[keys[:, 0]],
+        })
+        if not block.empty:
+            block["position"] = block.groupby("typ", sort=False)["points"].rank(
+                method="min", ascending=False).astype(int)
+        if index in self.positions:
+            overrides = self.positions[index]
+            given = [overrides.get(key) for key in zip(keys[:, 0].tolist(), keys[:, 1].tolist())]
+            block["position"] = [p if p is not None else q for p, q in zip(given, block["position"])]
+        return block
+
+
+class StandingsLedger:
+    """Championship standings of every series-season, kept as per-round point deltas.
+
+    Replaces the full standings block per round: the block after any round is
+    rebuilt by prefix sums (see SeasonLedger), and the latest totals are kept
+    per season for computing the next round's deltas.
+    """
+
+    def __init__(self):
+        self.seasons: dict[tuple[int, int], SeasonLedger] = {}
+        self._seq = 0
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the delta rows."""
+        return sum(chunk.nbytes for season in self.seasons.values() for chunk in season._chunks)
+
+    def keys(self) -> list[tuple[int, int]]:
+        return list(self.seasons)
+
+    def last_round(self, series_id: int, year: int) -> int:
+        season = self.seasons.get((int(series_id), int(year)))
+        return season.rounds[-1] if season is not None and season.rounds else 0
+
+    # --- Writes ---
+    def add_round(self, series_id: int, year: int, round_no: int, race_id: int,
+                  points: dict[str, tuple[np.ndarray, np.ndarray]]) -> pd.DataFrame:
+        """Record the points scored in one round per type: {typ: (subject_ids, points)}; returns the stored rows."""
+        typ = np.concatenate([np.full(len(ids), TYPE_CODES[t], dtype="int64") for t, (ids, _) in points.items()]
+                             + [np.empty(0, dtype="int64")])
+        subject = np.concatenate([np.asarray(ids, dtype="int64") for ids, _ in points.values()]
+                                 + [np.empty(0, dtype="int64")])
+        delta = np.concatenate([np.asarray(pts, dtype="int64") for _, pts in points.values()]
+                               + [np.empty(0, dtype="int64")])
+        key = (int(series_id), int(year))
+        season = self.seasons.setdefault(key, SeasonLedger())
+        self._seq += 1
+        chunk = season.add(round_no, race_id, self._seq, typ, subject, delta)
+        self._rows += len(chunk)
+        return self._delta_frame(key, round_no, race_id, chunk)
+
+    def add_block(self, block: pd.DataFrame) -> pd.DataFrame:
+        """Record one round given as a full standings block (cumulative points); returns the stored rows."""
+        first = block.iloc[0]
+        key = (int(first["series_id"]), int(first["year"]))
+        season = self.seasons.get(key)
+        points = {}
+        for typ, rows in block.groupby("typ", sort=False):
+            ids = rows["subject_id"].astype("int64").to_numpy()
+            cumulative = pd.to_numeric(rows["points"], errors="coerce").fillna(0).astype("int64").to_numpy()
+            before = (season.totals(np.full(len(ids), TYPE_CODES[typ]), ids) if season is not None
+                      else np.zeros(len(ids), dtype="int64"))
+            points[typ] = (ids, cumulative - before)
+        deltas = self.add_round(key[0], key[1], int(first["round"]), int(first["race_id"]), points)
+
+        if "position" in block.columns:
+            ranks = block.groupby("typ", sort=False)["points"].rank(method="min", ascending=False)
+            given = pd.to_numeric(block["position"], errors="coerce")
+            odd = given.notna() & (given != ranks)
+            if odd.any():
+                rows = block[odd]
+                season = self.seasons[key]
+                season.positions[len(season.rounds) - 1] = {
+                    (TYPE_CODES[typ], int(subject)): int(position)
+                    for typ, subject, position in zip(rows["typ"], rows["subject_id"], given[odd])
+                }
+        return deltas
+
+    def drop_seasons(self, keys) -> None:
+        for key in keys:
+            season = self.seasons.pop(key, None)
+            if season is not None:
+                self._rows -= len(season)
+
+    # --- Reads ---
+    def block(self, series_id: int, year: int, round_no: int | None = None) -> pd.DataFrame:
+        """Standings block after round_no (default: the latest round) of a series-season."""
+        season = self.seasons.get((int(series_id), int(year)))
+        if season is None or not season.rounds:
+            return pd.DataFrame(columns=BLOCK_COLUMNS)
+        index = len(season.rounds) - 1 if round_no is None else season.rounds.index(int(round_no))
+        return season.block(index, series_id, year)
+
+    def blocks(self, year: int | None = None) -> pd.DataFrame:
+        """Every round's full block (optionally of one year), in the order the rounds were recorded."""
+        parts = []
+        for (series_id, season_year), season in self.seasons.items():
+            if year is not None and season_year != int(year):
+                continue
+            for index, seq in enumerate(season.seq):
+                parts.append((seq, season.block(index, series_id, season_year)))
+        if not parts:
+            return pd.DataFrame(columns=BLOCK_COLUMNS)
+        parts.sort(key=lambda part: part[0])
+        return pd.concat([block for _, block in parts], ignore_index=True)
+
+    def frame(self) -> pd.DataFrame:
+        """All stored delta rows (DELTA_COLUMNS), in recording order."""
+        parts = []
+        for key, season in self.seasons.items():
+            start = 0
+            for round_no, race_id, seq, end in zip(season.rounds, season.race_ids, season.seq, season.offsets):
+                parts.append((seq, self._delta_frame(key, round_no, race_id, season.columns[start:end])))
+                start = end
+        if not parts:
+            return pd.DataFrame(columns=DELTA_COLUMNS)
+        parts.sort(key=lambda part: part[0])
+        return pd.concat([part for _, part in parts], ignore_index=True)
+
+    @staticmethod
+    def _delta_frame(key: tuple[int, int], round_no: int, race_id: int, chunk: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame({
+            "series_id": key[0],
+            "year": key[1],
+            "round": int(round_no),
+            "race_id": int(race_id),
+            "typ": np.array(STANDINGS_TYPES, dtype=object)[chunk[:, 0]],
+            "subject_id": chunk[:, 1],
+            "delta": chunk[:, 2],
+        }, columns=DELTA_COLUMNS)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame | None) -> "StandingsLedger":
+        """Build a ledger from stored delta rows, or from full standings blocks (the older stands.csv form)."""
+        ledger = cls()
+        if df is None or df.empty or not {"series_id", "year", "round", "typ", "subject_id"}.issubset(df.columns):
+            return ledger
+        group_cols = ["series_id", "year", "round"] + (["race_id"] if "race_id" in df.columns else [])
+        df = df[df["typ"].isin(STANDINGS_TYPES)]
+        for _, rows in df.groupby(group_cols, sort=False, dropna=False):
+            if "delta" in df.columns:
+                first = rows.iloc[0]
+                points = {typ: (part["subject_id"].to_numpy(), part["delta"].to_numpy())
+                          for typ, part in rows.groupby("typ", sort=False)}
+                ledger.add_round(first["series_id"], first["year"], first["round"],
+                                 first.get("race_id", 0), points)
+            else:
+                ledger.add_block(rows if "race_id" in rows.columns else rows.assign(race_id=0))
+        return ledger
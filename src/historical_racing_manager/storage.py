@@ -0,0 +1,220 @@
+import pathlib
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager.archive import ARCHIVE_TABLES
+from historical_racing_manager.consts import STANDINGS_TYPES
+
+# Indexed column groups; each is created on every table that has all of its columns
+INDEXES = [
+    ("series_id", "season"),
+    ("series_id", "year"),
+    ("subject_id",),
+    ("team_id",),
+    ("driver_id",),
+    ("engine_id",),
+    ("chassi_id",),
+    ("pneu_id",),
+]
+
+# Append-only history written through while the game runs: table -> RaceModel attribute
+APPEND_TABLES = {"results": "results", "standings": "standing_deltas", "final_standings": "final_standings"}
+
+
+def _sql_type(dtype) -> str:
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
+
+def _records(df: pd.DataFrame) -> list[tuple]:
+    """Convert rows to plain Python tuples for executemany (NaN -> NULL, dates -> ISO text)."""
+    values = df.copy()
+    for col in values.columns:
+        if pd.api.types.is_datetime64_any_dtype(values[col]):
+            values[col] = values[col].dt.strftime("%Y-%m-%d")
+    values = values.to_numpy(dtype=object)
+    values[pd.isna(values)] = None
+    return [tuple(row) for row in values.tolist()]
+
+
+class HistoryStore:
+    """SQLite copy of the game history (stdlib sqlite3, one file per saved game).
+
+    Results, standings and season finals are appended as they are recorded and
+    committed on save, so saving no longer rewrites them; the smaller tables
+    (races, contracts, finances) stay in the save's CSV files. Reads go through
+    query(); writes are batched with executemany inside the open transaction
+    until commit().
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = pathlib.Path(path)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        # Simulation and GUI threads share the connection
+        self.lock = threading.RLock()
+        # table -> rows written so far, to notice frames replaced outside the write-through
+        self.counts: dict[str, int] = {}
+        for table in self.tables():
+            self.counts[table] = self.conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+
+    # --- Schema ---
+    def tables(self) -> list[str]:
+        rows = self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        return [row[0] for row in rows]
+
+    def columns(self, table: str) -> list[str]:
+        return [row[1] for row in self.conn.execute(f'PRAGMA table_info("{table}")').fetchall()]
+
+    def _ensure_table(self, table: str, df: pd.DataFrame) -> None:
+        """Create the table (and its indexes) or add columns that appear for the first time."""
+        existing = self.columns(table)
+        missing = [col for col in df.columns if col not in existing]
+        if not missing:
+            return
+        # Columns of an empty frame have no real type yet; leave them without affinity,
+        # so numbers written later are not stored (and compared) as text
+        types = {col: _sql_type(df[col].dtype) if not df.empty else "" for col in df.columns}
+        if not existing:
+            cols = ", ".join(f'"{col}" {types[col]}'.rstrip() for col in df.columns)
+            self.conn.execute(f'CREATE TABLE "{table}" ({cols})')
+            self.counts[table] = 0
+        else:
+            for col in missing:
+                self.conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{col}" {types[col]}'.rstrip())
+
+        present = set(self.columns(table))
+        for index in INDEXES:
+            if present.issuperset(index):
+                name = f"ix_{table}_{'_'.join(index)}"
+                cols = ", ".join(f'"{col}"' for col in index)
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" ({cols})')
+
+    def clear(self) -> None:
+        """Drop every table (used before writing a game into a file that held another one)."""
+        with self.lock:
+            for table in self.tables():
+                self.conn.execute(f'DROP TABLE "{table}"')
+            self.counts = {}
+
+    # --- Writes ---
+    def append(self, table: str, df: pd.DataFrame) -> None:
+        """Insert rows in one executemany batch (not committed until commit())."""
+        if df is None or len(df.columns) == 0:
+            return
+        df = df.loc[:, ~df.columns.duplicated()]
+        with self.lock:
+            self._ensure_table(table, df)
+            if df.empty:
+                return
+            cols = ", ".join(f'"{col}"' for col in df.columns)
+            marks = ", ".join("?" * len(df.columns))
+            self.conn.executemany(f'INSERT INTO "{table}" ({cols}) VALUES ({marks})', _records(df))
+            self.counts[table] = self.counts.get(table, 0) + len(df)
+
+    def replace(self, table: str, df: pd.DataFrame) -> None:
+        """Replace the whole content of a table."""
+        with self.lock:
+            if table in self.counts:
+                self.conn.execute(f'DELETE FROM "{table}"')
+                self.counts[table] = 0
+            self.append(table, df)
+
+    def delete(self, table: str, where: str, params: tuple = ()) -> int:
+        """Delete the rows matching an SQL condition; returns how many were deleted."""
+        with self.lock:
+            if not self.has_table(table):
+                return 0
+            deleted = self.conn.execute(f'DELETE FROM "{table}" WHERE {where}', params).rowcount
+            self.counts[table] -= deleted
+            return deleted
+
+    def commit(self) -> None:
+        with self.lock:
+            self.conn.commit()
+
+    def close(self, commit: bool = False) -> None:
+        """Close the file; uncommitted writes are dropped unless commit is True."""
+        with self.lock:
+            if commit:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
+            self.conn.close()
+
+    # --- Reads ---
+    def query(self, sql: str, params: tuple = ()) -> pd.DataFrame:
+        with self.lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def has_table(self, table: str) -> bool:
+        return table in self.counts
+
+    def read(self, table: str, where: str = "", params: tuple = ()) -> pd.DataFrame:
+        """Rows of a table, optionally filtered by an SQL condition."""
+        if not self.has_table(table):
+            return pd.DataFrame()
+        return self.query(f'SELECT * FROM "{table}"' + (f" WHERE {where}" if where else ""), params)
+
+    # --- Game state ---
+    def save(self, race_model) -> None:
+        """
+        Bring the store in line with the race model and commit.
+
+        Write-through tables are only rewritten if their frame was replaced since
+        (row counts differ, archived rows included).
+        """
+        with self.lock:
+            archive = getattr(race_model, "archive", None)
+            for table, attr in APPEND_TABLES.items():
+                frame = getattr(race_model, attr)
+                if not race_model._stored(table, frame):
+                    # Archived seasons belong to the history as well
+                    parts = list(archive.frames(table)) if archive is not None and table in ARCHIVE_TABLES else []
+                    self.replace(table, pd.concat(parts + [frame], ignore_index=True) if parts else frame)
+            self.commit()
+
+    # --- Pushed-down queries ---
+    def season_results(self, series_id: int, season: int, columns: list[str]) -> pd.DataFrame:
+        """Result rows of one series-season through the (series_id, season) index."""
+        if not self.has_table("results"):
+            return pd.DataFrame(columns=columns)
+        cols = ", ".join(f'"{col}"' for col in columns)
+        return self.query(
+            f'SELECT {cols} FROM results WHERE series_id = ? AND season = ? ORDER BY rowid',
+            (int(series_id), int(season)),
+        )
+
+    def series_seasons(self, series_id: int) -> list[int]:
+        if not self.has_table("results"):
+            return []
+        df = self.query("SELECT DISTINCT season FROM results WHERE series_id = ? ORDER BY season",
+                        (int(series_id),))
+        return df["season"].astype(int).tolist()
+
+    def subject_seasons(self, subject_type: str, subject_id: int) -> dict[tuple[int, int], list[int]]:
+        """
+        Per (season, series_id): [races, wins, podiums, best_result] of one subject.
+
+        Same figures as RaceModel.season_summary, aggregated in SQL over the index
+        on the subject's id column.
+        """
+        col = f"{subject_type}_id"
+        if subject_type not in STANDINGS_TYPES or col not in self.columns("results"):
+            return {}
+        df = self.query(
+            f"""
+            SELECT season, series_id, COUNT(DISTINCT race_id) AS races,
+                   SUM(pos = 1) AS wins, SUM(pos <= 3) AS podiums, MIN(pos) AS best
+            FROM (SELECT season, series_id, race_id, CAST(position AS INTEGER) AS pos FROM results WHERE "{col}" = ?)
+            GROUP BY season, series_id
+            """,
+            (int(subject_id),),
+        )
+        values = df.to_numpy(dtype=np.int64).tolist()
+        return {(season, sid): rest for season, sid, *rest in values}
@@ -0,0 +1,134 @@
+from tkinter import ttk
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager.consts import COLUMN_LABELS
+
+# Rows scrolled per mouse wheel notch
+WHEEL_ROWS = 3
+
+
+def format_table(dataframe: Optional[pd.DataFrame]) -> tuple[list[str], list[str], list[tuple]]:
+    """
+    Turn a DataFrame into (column ids, display labels, row tuples) ready for a Treeview.
+
+    Missing values become "" in one vectorised pass; labels come from COLUMN_LABELS
+    and are made unique. An empty or missing frame yields a single "No data" row.
+    """
+    if dataframe is None or dataframe.empty:
+        return ["info"], ["Info"], [("No data",)]
+
+    cols = [str(c) for c in dataframe.columns]
+    values = dataframe.to_numpy(dtype=object, copy=True)
+    values[pd.isna(values)] = ""
+    rows = list(map(tuple, values))
+
+    # Ensure unique displayed labels (if duplicates occur)
+    labels = []
+    used_labels: dict[str, int] = {}
+    for col in cols:
+        label = COLUMN_LABELS.get(col, col.replace("_", " ").title())
+        if label in used_labels:
+            used_labels[label] += 1
+            label = f"{label} {used_labels[label]}"
+        else:
+            used_labels[label] = 1
+        labels.append(label)
+    return cols, labels, rows
+
+
+class VirtualTable:
+    """ttk.Treeview that only holds the rows currently in view.
+
+    The full table is kept as pre-formatted tuples; the tree has one item per
+    visible row, and scrolling rewrites the values of those items instead of
+    inserting or deleting rows. Place it with ``frame`` (grid/pack).
+    """
+
+    def __init__(self, parent, height: int | None = None):
+        self.frame = ttk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, show="headings", height=height or 10)
+        self.vsb = ttk.Scrollbar(self.frame, orient="vertical", command=self._on_scrollbar)
+        self.hsb = ttk.Scrollbar(self.frame, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=self.hsb.set)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.vsb.grid(row=0, column=1, sticky="ns")
+        self.hsb.grid(row=1, column=0, sticky="ew")
+        self.frame.rowconfigure(0, weight=1)
+        self.frame.columnconfigure(0, weight=1)
+
+        self.fixed_height = height
+        self.columns: list[str] = []
+        self.rows: list[tuple] = []
+        self.first = 0
+        self._items: list[str] = []
+
+        self.tree.bind("<Configure>", lambda _e: self._render())
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", self._on_wheel)
+        self.tree.bind("<Button-5>", self._on_wheel)
+
+    # --- Data ---
+    def set_data(self, dataframe: Optional[pd.DataFrame]) -> None:
+        """Show a DataFrame; headings are only rebuilt when the columns changed."""
+        cols, labels, rows = format_table(dataframe)
+        if cols != self.columns:
+            self.tree["columns"] = cols
+            width = 600 if cols == ["info"] else 120
+            for col, label in zip(cols, labels):
+                self.tree.heading(col, text=label)
+                self.tree.column(col, width=width, anchor="center")
+            self.columns = cols
+            self.first = 0
+        self.rows = rows
+        self._render()
+
+    # --- Rendering ---
+    def visible_rows(self) -> int:
+        """Number of rows that fit in the tree."""
+        if self.fixed_height:
+            return self.fixed_height
+        height = self.tree.winfo_height()
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        if height <= 1:
+            return int(self.tree.cget("height"))
+        # One row's worth of space is taken by the headings
+        return max(1, height // row_height - 1)
+
+    def _render(self) -> None:
+        total = len(self.rows)
+        window = self.visible_rows()
+        self.first = int(np.clip(self.first, 0, max(total - window, 0)))
+        shown = self.rows[self.first:self.first + window]
+
+        # Recycle item IDs: only grow or shrink the pool when the window size changes
+        while len(self._items) < len(shown):
+            self._items.append(self.tree.insert("", "end"))
+        while len(self._items) > len(shown):
+            self.tree.delete(self._items.pop())
+        for iid, row in zip(self._items, shown):
+            self.tree.item(iid, values=row)
+
+        if total:
+            self.vsb.set(self.first / total, (self.first + len(shown)) / total)
+        else:
+            self.vsb.set(0, 1)
+
+    def scroll_to(self, first: int) -> None:
+        if first != self.first:
+            self.first = first
+            self._render()
+
+    def _on_scrollbar(self, action: str, *args) -> None:
+        if action == "moveto":
+            self.scroll_to(int(float(args[0]) * len(self.rows)))
+        elif action == "scroll":
+            step = int(args[0]) * (self.visible_rows() if args[1] == "pages" else 1)
+            self.scroll_to(self.first + step)
+
+    def _on_wheel(self, event) -> str:
+        up = getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0
+        self.scroll_to(self.first + (-WHEEL_ROWS if up else WHEEL_ROWS))
+        return "break"
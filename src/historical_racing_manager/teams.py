@@ -10,6 +10,8 @@ from historical_racing_manager.consts import (
     DEFAULT_FOUND_YEAR, DEFAULT_FOLDED_YEAR,
     FINANCE_EARN_COEF,
 )
+from historical_racing_manager.registry import Registry
+from historical_racing_manager.versioning import mutates
 
 
 class TeamsModel:
@@ -19,10 +21,16 @@ class TeamsModel:
     kick_employee_price = KICK_EMPLOYEE_PRICE
 
     def __init__(self):
+        self.version = 0
         self.teams = pd.DataFrame()
         self.team_finances = pd.DataFrame()
+        # Bankruptcy resets applied by check_debt since the model was created
+        self.bankruptcies = 0
+        # Compiled team_id -> record and team_name -> team_id maps
+        self.registry = Registry(COL_TEAM_ID, "team_name")
 
     # --- Persistence ---
+    @mutates
     def load(self, folder: pathlib.Path) -> bool:
         """
         Load teams from a CSV file into a DataFrame.
@@ -59,6 +67,7 @@ class TeamsModel:
                 elif col == COL_FOLDED:
                     self.teams[col] = DEFAULT_FOLDED_YEAR
 
+        self.registry.refresh(self.teams)
         return True
 
     def save(self, folder: pathlib.Path):
@@ -80,6 +89,7 @@ class TeamsModel:
         """Return how many finance employees can be afforded with the given money."""
         return money // TeamsModel.finance_employee_salary
 
+    @mutates
     def mark_all_as_ai(self):
         """Mark all teams as AI-controlled (owner_id = 0)."""
         self.teams["owner_id"] = 0
@@ -134,8 +144,11 @@ class TeamsModel:
 
     def get_teams_id(self, search_team_name: str) -> int | None:
         """Return the team_id for a given team name, or None if not found."""
-        result = self.teams.query("team_name == @search_team_name")
-        return result["team_id"].iat[0] if not result.empty else None
+        return self.get_registry().id_of(search_team_name)
+
+    def get_registry(self) -> Registry:
+        """Return the team registry, recompiling it if self.teams was replaced."""
+        return self.registry.ensure(self.teams)
 
     def get_human_team_mask(self, year: int) -> pd.Series:
         """
@@ -186,6 +199,18 @@ class TeamsModel:
 
         return team_df.reset_index(drop=True)
 
+    @mutates
+    def prune_finances(self, before_year: int) -> int:
+        """Drop finance history of seasons before before_year; returns the number of rows dropped."""
+        df = self.team_finances
+        if df is None or df.empty or "season" not in df.columns:
+            return 0
+        old = pd.to_numeric(df["season"], errors="coerce") < before_year
+        if old.any():
+            # New rows are added at label len(team_finances), so keep a fresh index
+            self.team_finances = df[~old].reset_index(drop=True)
+        return int(old.sum())
+
     def get_team_owners_table(self) -> pd.DataFrame:
         """
         Return a DataFrame with columns: team_id, team_name, owner_id.
@@ -196,6 +221,7 @@ class TeamsModel:
 
         return self.teams[["team_id", "team_name", "owner_id"]].copy().reset_index(drop=True)
 
+    @mutates
     def set_team_owners(self, updates: dict[int, int]):
         """
         updates = {team_id: owner_id}
@@ -219,6 +245,7 @@ class TeamsModel:
             fm = self.team_finances
             self.team_finances = fm[~((fm["team_id"] == team_id) & (fm["finance_employees"] == 1000))]
 
+    @mutates
     def invest_finance(self, year: int, investments: dict):
         """
         Apply finance investments for human teams for a given year.
@@ -255,6 +282,7 @@ class TeamsModel:
         self.teams.update(updated_df)
         self.teams.reset_index(inplace=True)
 
+    @mutates
     def update_money(self, year: int):
         """Apply periodic financial updates to all teams (e.g., revenue from finance employees)."""
         self.teams = self.teams.apply(lambda row: self._calculate_financial_update(row, year), axis=1)
@@ -295,6 +323,7 @@ class TeamsModel:
 
         return row
 
+    @mutates
     def change_finance_employees(self, team_id: int, amount: int) -> None:
         """
         Set the number of finance employees for the given team to `amount`.
@@ -304,6 +333,7 @@ class TeamsModel:
         else:
             print(f"Team {team_id} does not exist — cannot update employees.")
 
+    @mutates
     def deduct_money(self, team_id: int, amount: int) -> None:
         """Deduct money from the team's balance (e.g., for paying contracts)."""
         if team_id in self.teams[COL_TEAM_ID].values:
@@ -333,15 +363,18 @@ class TeamsModel:
             "finance_employees": int(row["finance_employees"]),
         }
 
+    @mutates
     def halve_reputations(self):
         """Halve all teams' reputation values (integer division)."""
         self.teams["reputation"] = self.teams["reputation"] // 2
 
+    @mutates
     def update_reputations_and_money(self, year: int):
         """Update money and then halve reputations as part of end-of-period maintenance."""
         self.update_money(year)
         self.halve_reputations()
 
+    @mutates
     def add_race_reputation(self, base_reputation: int, results: list[int]):
         """
         Increase team reputations based on race results.
@@ -353,6 +386,7 @@ class TeamsModel:
             if team_id in self.teams[COL_TEAM_ID].values:
                 self.teams.loc[self.teams[COL_TEAM_ID] == team_id, "reputation"] += base_reputation // (i + 1)
 
+    @mutates
     def auto_invest_ai_finance(self) -> None:
         """
         For every AI-controlled team (owner_id == 0) choose the number of finance employees
@@ -388,6 +422,7 @@ class TeamsModel:
             self.teams.at[idx, "money"] = money - cost
             self.teams.at[idx, "finance_employees"] = int(chosen_fin)
 
+    @mutates
     def check_debt(self) -> None:
         """
         Check all teams for negative balance. For any team with money < 0:
@@ -413,6 +448,7 @@ class TeamsModel:
             return
 
         # Apply bankruptcy rules: make AI-controlled and give bailout
+        self.bankruptcies += int(debt_mask.sum())
         self.teams.loc[debt_mask, "owner_id"] = 0
         self.teams.loc[debt_mask, "money"] = 10_000_000
 
@@ -0,0 +1,57 @@
+import functools
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+def mutates(method: Callable) -> Callable:
+    """Bump the model's ``version`` after the decorated method ran (even if it raised)."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.version = getattr(self, "version", 0) + 1
+
+    return wrapper
+
+
+class ViewCache:
+    """Least-recently-used store of computed views.
+
+    Each entry is kept with the token it was computed for (typically the versions
+    of the models the view reads); a lookup with a different token recomputes it.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[tuple, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, token: tuple, compute: Callable[[], Any]) -> Any:
+        """Return the cached view for key if its token matches, otherwise compute and store it."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == token:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        value = compute()
+        self._store(key, token, value)
+        return value
+
+    def merge(self, other: "ViewCache") -> None:
+        """Add the views of another cache (e.g. one computed on a snapshot of the same game)."""
+        for key, (token, value) in list(other._entries.items()):
+            self._store(key, token, value)
+
+    def _store(self, key: Hashable, token: tuple, value: Any) -> None:
+        self._entries[key] = (token, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,234 @@
+import queue
+import threading
+from datetime import datetime
+from collections.abc import Sequence
+from typing import NamedTuple
+
+
+class SimEvent(NamedTuple):
+    """Progress report from the simulation thread.
+
+    kind is "progress" after every simulated day, and "done", "cancelled" or
+    "error" once per command.
+    """
+    kind: str
+    date: datetime | None
+    done: int = 0
+    total: int = 0
+    message: str = ""
+
+
+class SimulationWorker:
+    """Runs simulation commands on a background thread, one day at a time.
+
+    Commands are queued with submit() and executed in order through
+    Controller.advance_target/advance_day; every simulated day is reported as a
+    SimEvent that the GUI collects with poll() from its own thread. The worker
+    never touches widgets.
+    """
+
+    def __init__(self, controller, prefetcher: "Prefetcher | None" = None):
+        self.controller = controller
+        self.prefetcher = prefetcher
+        self.commands: queue.Queue = queue.Queue()
+        self.events: queue.Queue = queue.Queue()
+        # Commands submitted and not finished yet, and the cancel generation they belong to;
+        # both change under _lock together with the queue
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._generation = 0
+        self._thread: threading.Thread | None = None
+
+    @property
+    def busy(self) -> bool:
+        """True while a command is running or waiting in the queue."""
+        with self._lock:
+            return self._pending > 0
+
+    def submit(self, mode: str, amount: int = 1) -> None:
+        """Queue a command: ("days", n), ("next_race",) or ("seasons", n)."""
+        # Simulation has priority over views computed ahead of time
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+            self._thread.start()
+        with self._lock:
+            self._pending += 1
+            self.commands.put((self._generation, mode, amount))
+
+    def cancel(self) -> None:
+        """Drop queued commands and stop the running one after the current day."""
+        with self._lock:
+            self._pending -= self._drain_commands()
+            self._generation += 1
+
+    def stop(self) -> None:
+        """Cancel everything and let the thread exit."""
+        self.cancel()
+        if self._thread is not None and self._thread.is_alive():
+            self.commands.put(None)
+
+    def poll(self) -> list[SimEvent]:
+        """Return the events reported since the last call (never blocks)."""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _drain_commands(self) -> int:
+        """Empty the queue; returns how many commands were dropped."""
+        dropped = 0
+        while True:
+            try:
+                command = self.commands.get_nowait()
+            except queue.Empty:
+                return dropped
+            if command is not None:
+                dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            command = self.commands.get()
+            if command is None:
+                return
+            try:
+                self._execute(*command)
+            finally:
+                with self._lock:
+                    self._pending -= 1
+
+    def _cancelled(self, generation: int) -> bool:
+        return generation != self._generation
+
+    def _execute(self, generation: int, mode: str, amount: int) -> None:
+        try:
+            stop = self.controller.advance_target(mode, amount)
+            total = max((stop - self.controller.current_date).days, 0)
+            done = 0
+            while self.controller.current_date < stop:
+                if self._cancelled(generation):
+                    self.events.put(SimEvent("cancelled", self.controller.current_date, done, total))
+                    return
+                date = self.controller.advance_day()
+                done += 1
+                self.events.put(SimEvent("progress", date, done, total))
+            self.events.put(SimEvent("done", self.controller.current_date, done, total))
+        except Exception as e:
+            self.events.put(SimEvent("error", self.controller.current_date, message=str(e)))
+
+
+def neighbours(items: Sequence, current, radius: int) -> list:
+    """Return the items up to radius positions around current, nearest first (current excluded)."""
+    items = list(items)
+    if current not in items:
+        return []
+    pos = items.index(current)
+    nearby = []
+    for step in range(1, radius + 1):
+        nearby += [items[i] for i in (pos - step, pos + step) if 0 <= i < len(items)]
+    return nearby
+
+
+class Prefetcher:
+    """Computes Controller views ahead of time on a low-priority background thread.
+
+    Jobs are (Controller method name, args) pairs such as
+    ("get_results", (series, season)); the results land in the Controller's view
+    cache, so a later call with the same arguments is served from it. Views are
+    computed on the published read snapshot (Controller.publish_snapshot), which
+    a job exports only if the game changed since it was published, e.g. by the
+    API server; sim_lock is held just for that and to merge the result. A job
+    only starts if sim_lock is free, a result the game moved past meanwhile is
+    dropped, and submit()/cancel() drop whatever is still pending.
+    """
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.computed = 0
+        self._jobs: list[tuple[str, tuple]] = []
+        self._generation = 0
+        self._running = False
+        self._stopped = False
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, jobs: list[tuple[str, tuple]]) -> None:
+        """Replace the pending jobs with a new list (first job runs first)."""
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped = False
+                self._thread = threading.Thread(target=self._run, name="prefetch", daemon=True)
+                self._thread.start()
+            self._generation += 1
+            self._jobs = list(reversed(jobs))
+            self._cond.notify_all()
+
+    def cancel(self) -> None:
+        """Drop pending jobs; a view already being computed still finishes."""
+        with self._cond:
+            self._generation += 1
+            self._jobs = []
+            self._cond.notify_all()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._jobs = []
+            self._cond.notify_all()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until no job is pending or running; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._jobs and not self._running, timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._jobs or self._stopped)
+                if self._stopped:
+                    return
+                name, args = self._jobs.pop()
+                generation = self._generation
+                self._running = True
+            try:
+                self._execute(generation, name, args)
+            finally:
+                with self._cond:
+                    self._running = False
+                    self._cond.notify_all()
+
+    def _execute(self, generation: int, name: str, args: tuple) -> None:
+        controller = self.controller
+        lock = controller.sim_lock
+        # Never wait for the simulation: a held lock means a step is running
+        if not lock.acquire(blocking=False):
+            self.cancel()
+            return
+        try:
+            if generation != self._generation:
+                return
+            published = controller.publish_snapshot()
+            # The current snapshot is only retired under sim_lock, so it is still open
+            published.enter()
+        finally:
+            lock.release()
+
+        try:
+            snapshot = published.controller()
+            getattr(snapshot, name)(*args)
+            if not lock.acquire(blocking=False):
+                self.cancel()
+                return
+            try:
+                if controller.snapshot_key() == published.key:
+                    controller.view_cache.merge(snapshot.view_cache)
+                    self.computed += 1
+            finally:
+                lock.release()
+        except Exception as e:
+            print(f"Prefetch of {name}{args} failed: {e}")
+        finally:
+            published.leave()
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from historical_racing_manager.controller import Controller
+
+
+@pytest.fixture
+def small_game():
+    """Factory of small headless games on 1900-06-01: two teams (team 1 owned by the player).
+
+    rounds are (race_id, season, (points of driver 10, points of driver 11)) championship
+    rounds of series 1; named adds the series and driver names views look up;
+    reserved_slots replaces the contracts model's reserved driver slots.
+    """
+    def make(rounds=(), named: bool = False, reserved_slots: dict | None = None) -> Controller:
+        controller = Controller(headless=True)
+        controller.current_date = datetime(1900, 6, 1)
+        controller.teams_model.teams = pd.DataFrame({"team_id": [1, 2], "team_name": ["A", "B"], "owner_id": [1, 0],
+                                                     "money": [100, 200]})
+        controller.teams_model.get_registry()
+        if named:
+            controller.series_model.series = pd.DataFrame({"series_id": [1], "name": ["A"]})
+            controller.drivers_model.drivers = pd.DataFrame({"driver_id": [10, 11], "forename": ["Ann", "Bo"],
+                                                             "surname": ["X", "Y"]})
+        if reserved_slots is not None:
+            controller.contracts_model.reserved_slots = reserved_slots
+        if rounds:
+            race_model = controller.race_model
+            race_model.races = pd.DataFrame({"race_id": [race_id for race_id, _, _ in rounds], "series_id": 1,
+                                             "season": [season for _, season, _ in rounds], "championship": True})
+            for race_id, season, points in rounds:
+                race_model._record_round_points(1, season, race_id, {"driver": (np.array([10, 11]), np.array(points))})
+        return controller
+
+    return make
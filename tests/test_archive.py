@@ -0,0 +1,101 @@
+import pickle
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager.archive import SeasonArchive
+from historical_racing_manager.race import RaceModel
+
+
+def results(race_id, season, drivers, positions):
+    return pd.DataFrame({
+        "race_id": race_id,
+        "series_id": 1,
+        "season": season,
+        "round": 1,
+        "driver_id": drivers,
+        "team_id": 100,
+        "engine_id": 200,
+        "chassi_id": 300,
+        "pneu_id": 400,
+        "position": positions,
+    })
+
+
+# === Tests: SeasonArchive ===
+
+def test_archive_partitions_by_decade_and_reads_memory_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    archive = SeasonArchive(tmp_path / "work")
+    archive.append("results", pd.concat([results(1, 1898, [10], [1]), results(2, 1901, [11], [1])]), 1902)
+    archive.append("results", results(3, 1901, [12], [2]), 1902)
+
+    assert archive.decades("results") == [1890, 1900]
+    assert archive.has_season("results", 1901) and not archive.has_season("results", 1902)
+    assert isinstance(archive._columns("results", 1900)["driver_id"], np.memmap)
+    assert archive.season("results", 1, 1901)["driver_id"].tolist() == [11, 12]
+
+    archive.save_to(tmp_path / "saved")
+    copy = SeasonArchive.open_copy(tmp_path / "saved")
+    assert copy.directory != archive.directory
+    assert copy.rows == {"results": 3}
+    assert copy.season("results", 1, 1898)["race_id"].tolist() == [1]
+
+    # close() removes working copies only, not a directory the archive was opened on
+    copy.close()
+    archive.close()
+    assert not copy.directory.exists() and archive.directory.exists()
+
+
+def test_snapshots_share_a_frozen_copy_until_written(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    archive = SeasonArchive()
+    archive.append("results", results(1, 1898, [10], [1]), 1899)
+
+    first, second = archive.snapshot(), pickle.loads(pickle.dumps(archive))
+    assert first.directory == second.directory != archive.directory
+    archive.append("results", results(2, 1899, [11], [1]), 1900)
+    third = archive.snapshot()
+    assert third.directory != first.directory and third.rows == {"results": 2}
+
+    # A written view moves to its own copy; the frozen one goes with its last view
+    second.append("results", results(3, 1899, [12], [1]), 1900)
+    assert second.directory != first.directory and first.rows == {"results": 1}
+    frozen = first.directory
+    first.close()
+    assert not frozen.exists()
+    for each in (second, third, archive):
+        each.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_archive_keeps_text_columns(tmp_path):
+    archive = SeasonArchive(tmp_path)
+    standings = pd.DataFrame({"series_id": [1, 1], "year": [1900, 1900], "typ": ["driver", "team"],
+                              "subject_id": [10, 100], "points": [9.0, 9.0]})
+    archive.append("standings", standings, 1901)
+    assert archive.season("standings", 1, 1900)["typ"].tolist() == ["driver", "team"]
+
+
+# === Tests: RaceModel.archive_seasons ===
+
+def test_archived_seasons_stay_available_to_views(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    model = RaceModel()
+    model._record_results(results(1, 1900, [10, 11], [1, 2]))
+    model._record_results(results(2, 1901, [10, 11], [2, 1]))
+    model._record_results(results(3, 1902, [11], [1]))
+    series = pd.DataFrame({"series_id": [1], "name": ["F1"]})
+    manufacturers = pd.DataFrame({"manufacture_id": [200, 300, 400], "name": ["E", "C", "P"]})
+    stats = model.get_subject_season_stands(11, "driver", series)
+    pivot = model.pivot_results_by_race(1, 1901, manufacturers)
+    model.result_pivots = {}
+
+    model.archive_seasons(1902)
+
+    assert model.results["season"].tolist() == [1902]
+    assert model.archive.rows["results"] == 4
+    assert model.get_seasons_for_series(1) == [1900, 1901, 1902]
+    assert model.get_subject_season_stands(11, "driver", series).equals(stats)
+    assert model.pivot_results_by_race(1, 1901, manufacturers).equals(pivot)
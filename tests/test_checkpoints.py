@@ -0,0 +1,81 @@
+import tempfile
+from datetime import datetime
+
+from historical_racing_manager.archive import SeasonArchive
+
+
+# === Tests: Controller checkpoints ===
+
+def test_named_branches_restore_their_own_state(small_game):
+    controller = small_game(reserved_slots={1: 1})
+    controller.checkpoint("before")
+
+    controller.teams_model.teams.loc[0, "money"] = -50
+    controller.contracts_model.reserved_slots[2] = 1
+    controller.contracts_model.pending_offers = [{"driver_id": 7, "team_id": 1, "salary": 10}]
+    controller.current_date = datetime(1901, 1, 1)
+    controller.checkpoint("after")
+
+    assert controller.restore_checkpoint("before")
+    assert controller.teams_model.teams["money"].tolist() == [100, 200]
+    assert controller.contracts_model.reserved_slots == {1: 1}
+    assert not hasattr(controller.contracts_model, "pending_offers")
+    assert controller.current_date == datetime(1900, 6, 1)
+
+    assert controller.restore_checkpoint("after")
+    assert controller.teams_model.teams["money"].tolist() == [-50, 200]
+    assert controller.contracts_model.reserved_slots == {1: 1, 2: 1}
+    assert controller.contracts_model.pending_offers[0]["driver_id"] == 7
+    assert [c["name"] for c in controller.get_checkpoints()] == ["before", "after"]
+    controller.drop_checkpoint("before")
+    controller.drop_checkpoint("after")
+
+
+def test_a_checkpoint_can_be_restored_again_after_changes(small_game):
+    controller = small_game(reserved_slots={1: 1})
+    controller.checkpoint("base")
+    controller.restore_checkpoint("base")
+    stream = controller.race_model.rng
+    draws = stream.random(3).tolist()
+
+    controller.teams_model.teams.loc[1, "money"] = 0
+    controller.teams_model.get_registry()
+    controller.view_cache.get(("teams",), (controller.teams_model.version,), lambda: "view")
+    controller.restore_checkpoint("base")
+
+    assert controller.teams_model.teams["money"].tolist() == [100, 200]
+    assert controller.teams_model.get_registry().value(2, "money") == 200
+    assert controller.race_model.rng is controller.random_streams["race"]
+    assert controller.race_model.rng.random(3).tolist() == draws
+    assert len(controller.view_cache) == 0
+    controller.drop_checkpoint("base")
+
+
+def test_dropped_and_unknown_checkpoints(small_game):
+    controller = small_game(reserved_slots={1: 1})
+    controller.checkpoint("a")
+    controller.checkpoint("a")
+    assert len(controller.get_checkpoints()) == 1
+
+    controller.drop_checkpoint("a")
+    controller.drop_checkpoint("missing")
+
+    assert controller.get_checkpoints() == []
+    assert not controller.restore_checkpoint("a")
+
+
+def test_restore_shares_the_checkpoint_archive_and_close_frees_checkpoints(small_game, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    controller = small_game(reserved_slots={1: 1})
+    live = controller.race_model.archive = SeasonArchive()
+    controller.checkpoint("a")
+    controller.restore_checkpoint("a")
+    restored = controller.race_model.archive.directory
+    controller.restore_checkpoint("a")
+
+    assert not live.directory.exists()
+    assert controller.race_model.archive.directory == restored == controller.checkpoints["a"][1].directory
+    assert capsys.readouterr().out == ""  # headless: no view to refresh
+    controller.close()
+    assert controller.get_checkpoints() == []
+    assert list(tmp_path.iterdir()) == []
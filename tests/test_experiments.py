@@ -0,0 +1,79 @@
+import threading
+from datetime import timedelta
+
+import pandas as pd
+
+from historical_racing_manager.controller import Controller
+from historical_racing_manager.experiments import run_experiment, summarise_runs
+
+
+def fake_sim_day(self, date, days):
+    # One random outcome per run, so runs can be told apart
+    self.race_model.f1_races += 10
+    self.race_model.crashes += int(self.race_model.rng.integers(0, 1000))
+    self.teams_model.bankruptcies += 1
+    return date + timedelta(days=days)
+
+
+# === Tests: experiments ===
+
+def test_restored_snapshot_is_an_independent_headless_game(small_game):
+    controller = small_game(rounds=[(1, 1899, (8, 6)), (2, 1900, (6, 8))])
+    store = controller.race_model.store = threading.Lock()  # stands in for the unpicklable HistoryStore
+
+    with controller.export_state() as shared:
+        copy = Controller(headless=True).import_state(shared.manifest)
+
+    assert controller.race_model.store is store
+    assert copy.race_model.store is None and copy.view is None
+    assert copy.current_date == controller.current_date
+    assert copy.teams_model.get_registry().value(2, "team_name") == "B"
+    copy.teams_model.teams.loc[0, "money"] = -1
+    assert controller.teams_model.teams.loc[0, "money"] == 100
+
+
+def test_run_experiment_is_reproducible_per_seed(monkeypatch, small_game):
+    monkeypatch.setattr(Controller, "sim_day", fake_sim_day)
+    controller = small_game(rounds=[(1, 1899, (8, 6)), (2, 1900, (6, 8))])
+
+    report = run_experiment(controller, runs=3, seasons=1, seed=42, workers=1)
+    again = run_experiment(controller, runs=3, seasons=1, seed=42, workers=1)
+
+    runs = report["runs"]
+    assert runs.equals(again["runs"])
+    assert runs.attrs["seed"] == 42
+    assert runs["crashes"].nunique() == 3
+    assert runs["bankruptcies"].tolist() == [1, 1, 1]
+    assert (runs["crash_rate"] == runs["crashes"] / 10).all()
+    # Only the 1900 season finished during the runs
+    assert report["champions"][["subject_id", "titles", "share"]].values.tolist() == [[11, 3, 1.0]]
+    assert controller.race_model.crashes == 0
+
+
+def test_worker_processes_report_the_same_as_one_process(monkeypatch, small_game):
+    monkeypatch.setattr(Controller, "sim_day", fake_sim_day)
+    controller = small_game(rounds=[(1, 1899, (8, 6)), (2, 1900, (6, 8))])
+
+    local = run_experiment(controller, runs=4, seasons=1, seed=7, workers=1)
+    pooled = run_experiment(controller, runs=4, seasons=1, seed=7, workers=2)
+
+    for name in ("runs", "summary", "champions"):
+        pd.testing.assert_frame_equal(pooled[name], local[name])
+
+
+def test_summarise_runs_shares_titles_per_series_and_type():
+    metrics = {"run": 0, "seasons": 2, "f1_races": 10, "crashes": 3, "deaths": 1, "crash_rate": 0.3,
+               "death_rate": 0.1, "bankruptcies": 0}
+    champions = [
+        pd.DataFrame({"series_id": 1, "year": [1950, 1951, 1950], "typ": ["driver", "driver", "team"],
+                      "subject_id": [5, 6, 9], "run": 0}),
+        pd.DataFrame({"series_id": 1, "year": [1950, 1951, 1950], "typ": ["driver", "driver", "team"],
+                      "subject_id": [5, 5, 9], "run": 1}),
+    ]
+
+    report = summarise_runs([(metrics, champions[0]), (dict(metrics, run=1, crashes=5), champions[1])])
+
+    summary = report["summary"].set_index("metric")
+    assert summary.loc["crashes", "mean"] == 4 and summary.loc["crashes", "max"] == 5
+    assert report["champions"].values.tolist() == [[1, "driver", 5, 3, 0.75], [1, "driver", 6, 1, 0.25],
+                                                   [1, "team", 9, 2, 1.0]]
@@ -0,0 +1,94 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager.consts import CRASH_CODE, DEATH_CODE, RESULT_COLUMNS
+from historical_racing_manager.controller import Controller
+from historical_racing_manager.feed import RaceFeed, race_finished
+
+
+def raced(controller, race_id, positions, round_no=1):
+    rows = pd.DataFrame(0, index=range(len(positions)), columns=RESULT_COLUMNS)
+    rows = rows.assign(race_id=race_id, driver_id=range(10, 10 + len(positions)), position=positions,
+                       season=1950, series_id=1, round=round_no)
+    controller.race_model._record_results(rows)
+
+
+# === Tests: race feed ===
+
+def test_event_of_the_race_recorded_last():
+    controller = Controller(headless=True)
+    race_model = controller.race_model
+    race_model._record_round_points(1, 1950, 7, {"driver": (np.array([10, 11, 12, 13]), np.array([1, 6, 8, 4]))})
+    raced(controller, 7, [3, 1, CRASH_CODE, 2, DEATH_CODE])
+
+    event = race_finished(race_model, datetime(1950, 5, 13), top=2)
+    assert (event.race_id, event.series_id, event.season, event.round) == (7, 1, 1950, 1)
+    assert event.order == [11, 13, 10]
+    assert event.dnfs == [12] and event.deaths == [14]
+    assert event.leaders == {"driver": [(12, 8), (11, 6)]}
+
+    # Listeners hear only races that were actually run
+    heard = []
+    controller.race_listeners.append(heard.append)
+    controller._publish_race(pd.Series({"race_id": 8, "race_date": datetime(1950, 5, 20)}))
+    controller._publish_race(pd.Series({"race_id": 7, "race_date": datetime(1950, 5, 13)}))
+    assert [e.race_id for e in heard] == [7]
+
+
+def test_feeds_block_or_drop_when_full():
+    dropping = RaceFeed(maxsize=2, block=False)
+    for n in range(5):
+        dropping(n)
+    assert dropping.poll() == [3, 4] and dropping.dropped == 3
+
+    feed = RaceFeed(maxsize=1)
+    producer = threading.Thread(target=lambda: [feed(n) for n in range(3)])
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()  # waits for the consumer
+
+    consumed = []
+    consumer = threading.Thread(target=lambda: consumed.extend(feed))
+    consumer.start()
+    producer.join(5)
+    while not feed.events.empty():
+        time.sleep(0.01)
+    feed.close()
+    consumer.join(5)
+    assert consumed == [0, 1, 2]
+
+    # Closing releases a producer that no consumer will ever wait for
+    abandoned = RaceFeed(maxsize=1)
+    producer = threading.Thread(target=lambda: [abandoned(n) for n in range(3)])
+    producer.start()
+    producer.join(0.2)
+    abandoned.close()
+    producer.join(5)
+    assert not producer.is_alive()
+    assert list(abandoned) == [] and abandoned.dropped >= 1
+
+
+def test_iter_races_advances_only_as_far_as_consumed(monkeypatch):
+    def one_race_a_day(self, date, days):
+        for listener in list(self.race_listeners):
+            listener(date)
+        return date + timedelta(days=days)
+
+    monkeypatch.setattr(Controller, "sim_day", one_race_a_day)
+    controller = Controller(headless=True)
+    controller.current_date = datetime(1950, 1, 1)
+
+    races = controller.iter_races("days", 5)
+    assert next(races) == datetime(1950, 1, 1)
+    assert controller.current_date == datetime(1950, 1, 2)
+    assert list(races) == [datetime(1950, 1, d) for d in range(2, 6)]
+    assert controller.race_listeners == []
+
+    races = controller.iter_races("days", 5)
+    next(races)
+    races.close()
+    assert controller.race_listeners == [] and controller.current_date == datetime(1950, 1, 7)
@@ -238,3 +238,46 @@ def test_develop_part(model):
         ]
     assert (f1_engine["power"] >= 80).all()
     assert (f1_engine["power"] <= 300).all()
+
+
+# === Tests: part catalog ===
+
+def test_get_part_catalog_lookups(model):
+    catalog = model.get_part_catalog()
+
+    assert catalog.positions(1, 2024, "engine") == [0]
+    assert catalog.positions(1, 2024, "chassi") == []
+    assert catalog.manufacturer_of(0) == 10
+    assert catalog.part_value(0, "power") == 80
+    assert catalog.manufacturer_of(99) == -1
+    assert catalog.parts(1, 2024)["part_id"].tolist() == [0]
+
+
+def test_develop_part_carries_last_year_stats(model):
+    np.random.seed(0)
+    model.car_parts = pd.DataFrame({
+        "part_id": [0],
+        "part_type": ["engine"],
+        "manufacture_id": [0],
+        "rules_id": [0],
+        "series_id": [1],
+        "power": [250],
+        "reliability": [40],
+        "safety": [30],
+        "year": [1894],
+        "cost": [DEFAULT_PART_COST],
+    })
+    contracts = pd.DataFrame({
+        "series_id": [1],
+        "manufacture_id": [0],
+        "part_type": ["engine"],
+        "start_year": [1894],
+        "end_year": [3000],
+    })
+
+    model.develop_part(datetime(year=1895, month=1, day=1), contracts)
+
+    new_part = model.car_parts.iloc[-1]
+    assert new_part["power"] >= 250
+    assert new_part["series_id"] == 1 and new_part["manufacture_id"] == 0
+    assert model.get_part_catalog().positions(1, 1895, "engine") == [1]
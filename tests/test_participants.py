@@ -0,0 +1,54 @@
+import pandas as pd
+
+from historical_racing_manager.participants import ParticipantLog, SortedNames
+
+
+def results(race_id, drivers, teams, engines):
+    return pd.DataFrame({
+        "race_id": race_id,
+        "driver_id": drivers,
+        "team_id": teams,
+        "series_id": 1,
+        "engine_id": engines,
+        "chassi_id": 300,
+        "pneu_id": 400,
+    })
+
+
+# === Tests: ParticipantLog ===
+
+def test_log_keeps_first_appearance_order_and_new_ids():
+    log = ParticipantLog()
+    log.add(results(1, [11, 10], [100, 100], [200, 201]))
+    seen = log.count("driver_id")
+    log.add(results(2, [10, 12], [101, 100], [201, 201]))
+
+    assert log.ids("driver_id") == [11, 10, 12]
+    assert log.ids("driver_id", seen) == [12]
+    assert log.ids("team_id") == [100, 101]
+    assert log.parts() == [(200, "engine"), (201, "engine"), (300, "chassi"), (400, "pneu")]
+
+
+def test_log_reset_starts_new_epoch():
+    log = ParticipantLog()
+    epoch = log.epoch
+    log.add(results(1, [10], [100], [200]))
+    log.reset()
+
+    assert log.epoch == epoch + 1
+    assert log.ids("driver_id") == []
+    assert log.parts() == []
+
+
+# === Tests: SortedNames ===
+
+def test_sorted_names_insert_and_move():
+    names = SortedNames()
+    names.add([(("b",), 2, "b"), (("a",), 1, "a"), (("c",), 3, "c"), (("a",), 1, "a")])
+    assert names.labels() == ["a", "b", "c"]
+    assert len(names) == 3
+
+    moved = names.pop([2, 99])
+    assert moved == [(("b",), 2, "b")]
+    assert names.labels() == ["a", "c"]
+    assert 2 not in names
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from historical_racing_manager.projection import project_championship
+
+
+# === Fixtures ===
+@pytest.fixture
+def grid():
+    return {
+        "driver_id": np.array([10, 11, 12]),
+        "team_id": np.array([100, 100, 101]),
+        "car_id": np.array([0, 1, 2]),
+        "ability": np.array([90, 80, 70]),
+        "power": np.array([5, 5, 0]),  # car 2 has no speed -> always crashes
+        "reliability": np.array([0, 0, 0]),
+        "safety": np.array([0, 0, 0]),
+        "engine_id": np.array([200, 200, 201]),
+        "chassi_id": np.array([300, 300, 300]),
+        "pneu_id": np.array([400, 400, 400]),
+    }
+
+
+def rounds(n):
+    return pd.DataFrame({
+        "race_id": range(1, n + 1),
+        "series_id": 1,
+        "season": 2020,
+        "track_safety": 1,
+        "wet": 1,
+        "championship": True,
+    })
+
+
+def project(grid, n_rounds, current=None, sims=2000, seed=1):
+    cts = {"driver": 1, "team": 1, "engine": 2, "chassi": 2, "pneu": 2}
+    return project_championship(grid, rounds(n_rounds), np.full(n_rounds, 10), cts, np.array([8, 6, 4]),
+                                current or {}, sims, rng=np.random.default_rng(seed), chunk=300)
+
+
+# === Tests: project_championship() ===
+
+def test_projection_counts_only_the_scoring_cars(grid):
+    result = project(grid, 1)
+
+    drivers = result["driver"].set_index("subject_id")
+    assert drivers.loc[10, "mean_points"] + drivers.loc[11, "mean_points"] == pytest.approx(14)
+    assert drivers.loc[12, "title"] == 0
+    teams = result["team"].set_index("subject_id")
+    # Only one car of a team scores
+    assert teams.loc[100, "mean_points"] == 8 and teams.loc[100, "title"] == 1
+    assert teams.loc[101, "mean_points"] == 0
+    engines = result["engine"].set_index("subject_id")
+    assert engines.loc[200, "mean_points"] == 14
+
+
+def test_projection_starts_from_current_standings(grid):
+    current = {"driver": (np.array([12, 13]), np.array([30, 5]))}
+    result = project(grid, 2, current)
+
+    drivers = result["driver"]
+    # 16 points are left; the leader cannot be caught, subject 13 is off the grid
+    assert drivers.iloc[0]["subject_id"] == 12 and drivers.iloc[0]["title"] == 1
+    assert drivers.set_index("subject_id").loc[13, ["points", "p90_points"]].tolist() == [5, 5]
+    assert len(drivers) == 4
+
+
+def test_projection_is_seeded_and_leaves_the_global_stream_alone(grid):
+    np.random.seed(7)
+    expected = np.random.random()
+    np.random.seed(7)
+
+    first = project(grid, 3, seed=3)
+    assert np.random.random() == expected
+    pd.testing.assert_frame_equal(first["driver"], project(grid, 3, seed=3)["driver"])
@@ -1,9 +1,21 @@
+import numpy as np
 import pandas as pd
 import pytest
 
+from historical_racing_manager.consts import RNG_PICK_MAX
 from historical_racing_manager.race import RaceModel
 
 
+class FakeRng:
+    """Generator stand-in whose integers(low, high) returns draw(low, high)."""
+
+    def __init__(self, draw):
+        self.draw = draw
+
+    def integers(self, low, high=None, size=None):
+        return self.draw(low, high)
+
+
 @pytest.fixture
 def teams_model():
     class DummyTeams:
@@ -850,6 +862,93 @@ def test_prepare_race_full(
     assert row10["pneu_id"] == 400
 
 
+def test_get_season_cars_assembles_and_caches(race_model, manufacturer_model, contracts_model):
+    m = race_model
+
+    cars = m.get_season_cars(contracts_model, manufacturer_model, 1, 2020)
+
+    assert cars["team_id"].tolist() == [100]
+    assert cars["engine"].tolist() == [200]
+    assert cars["pneu"].tolist() == [400]
+    # Stats start at -1 and sum over the three parts
+    assert cars["power"].tolist() == [9]
+    assert cars["reliability"].tolist() == [14]
+    assert cars["safety"].tolist() == [8]
+
+    # Same contracts and parts -> cached object is reused
+    assert m.get_season_cars(contracts_model, manufacturer_model, 1, 2020) is cars
+
+
+def test_get_season_cars_invalidated_by_part_contract(race_model, manufacturer_model, contracts_model):
+    m = race_model
+    m.get_season_cars(contracts_model, manufacturer_model, 1, 2020)
+
+    # Team 101 signs only an engine -> incomplete car, not on the grid
+    contracts_model.mt_contract = pd.concat([contracts_model.mt_contract, pd.DataFrame([{
+        "team_id": 101, "series_id": 1, "manufacture_id": 200, "part_type": "engine",
+        "start_year": 2020, "end_year": 2020,
+    }])], ignore_index=True)
+    assert m.get_season_cars(contracts_model, manufacturer_model, 1, 2020)["team_id"].tolist() == [100]
+
+    # Completing the car adds it to the cached season
+    contracts_model.mt_contract = pd.concat([contracts_model.mt_contract, pd.DataFrame([
+        {"team_id": 101, "series_id": 1, "manufacture_id": 300, "part_type": "chassi",
+         "start_year": 2020, "end_year": 2020},
+        {"team_id": 101, "series_id": 1, "manufacture_id": 400, "part_type": "pneu",
+         "start_year": 2020, "end_year": 2020},
+    ])], ignore_index=True)
+    assert m.get_season_cars(contracts_model, manufacturer_model, 1, 2020)["team_id"].tolist() == [100, 101]
+
+
+@pytest.fixture
+def season_races(race_model):
+    race_model.races = pd.DataFrame({
+        "race_id": [1, 2, 3],
+        "series_id": [1, 1, 1],
+        "season": [2020, 2020, 2020],
+        "layout_id": [10, 11, 10],
+        "track_safety": [1, 1, 1],
+        "race_date": pd.to_datetime(["2020-05-01", "2020-06-01", "2020-07-01"]),
+        "championship": [False, False, False],
+        "reputation": [0, 0, 0],
+        "wet": [1, 1, 1],
+    })
+    race_model.results = race_model.results.iloc[0:0]
+    return race_model.races
+
+
+def test_run_race_commits_batched_rounds_in_order(
+        race_model, drivers_model, teams_model, series_model, manufacturer_model, contracts_model, season_races
+):
+    m = race_model
+    np.random.seed(1)
+
+    for i, race_id in enumerate([1, 2, 3]):
+        m.run_race(drivers_model, teams_model, series_model, manufacturer_model, contracts_model,
+                   season_races, i, pd.Timestamp("2020-05-01"))
+        assert m.results["race_id"].tolist() == sorted([1, 2, 3][:i + 1] * 2)
+
+    assert m.season_batches == {}
+
+
+def test_run_race_rebuilds_batch_when_grid_changes(
+        race_model, drivers_model, teams_model, series_model, manufacturer_model, contracts_model, season_races
+):
+    m = race_model
+    np.random.seed(1)
+    m.run_race(drivers_model, teams_model, series_model, manufacturer_model, contracts_model,
+               season_races, 0, pd.Timestamp("2020-05-01"))
+    assert m.season_batches[1].race_ids == [1, 2, 3]
+
+    # Driver 11 leaves the grid before the second round
+    contracts_model.dt_contract = contracts_model.dt_contract.assign(active=[True, False])
+    m.run_race(drivers_model, teams_model, series_model, manufacturer_model, contracts_model,
+               season_races, 1, pd.Timestamp("2020-06-01"))
+
+    assert m.season_batches[1].race_ids == [2, 3]
+    assert m.results.loc[m.results["race_id"] == 2, "driver_id"].tolist() == [10]
+
+
 def test_simulate_race_basic(
         race_model,
         drivers_model,
@@ -858,9 +957,8 @@ def test_simulate_race_basic(
 ):
     m = race_model
 
-    # Deterministic RNG
-    monkeypatch.setattr("historical_racing_manager.race.rd.randint", lambda a, b: 0)
-    monkeypatch.setattr("historical_racing_manager.race.rd.random", lambda: 0.0)
+    # Deterministic RNG: cars never fail and the ranking always picks the first car left
+    m.rng = FakeRng(lambda low, high: low if high == RNG_PICK_MAX + 1 else high - 1)
 
     # Stub reputations
     drivers_model.race_reputations = lambda rep, lst: None
@@ -943,7 +1041,7 @@ def test_simulate_race_crash(
     # Force CRASH (not death)
     # rnd1 = 8 < reliability(14) → crash/death branch
     # rnd2 = 8 >= safety(8) → CRASH
-    monkeypatch.setattr("numpy.random.randint", lambda *args, **kwargs: 8)
+    m.rng = FakeRng(lambda low, high: 8)
 
     # Stub reputations
     drivers_model.race_reputations = lambda rep, lst: None
@@ -1023,7 +1121,7 @@ def test_simulate_race_death(
     # Force DEATH
     # rnd1 = 0 < reliability(14) → crash/death branch
     # rnd2 = 0 < safety(8) → DEATH
-    monkeypatch.setattr("numpy.random.randint", lambda *args, **kwargs: 0)
+    m.rng = FakeRng(lambda low, high: 0)
 
     # Stub reputations
     drivers_model.race_reputations = lambda rep, lst: None
@@ -1093,3 +1191,163 @@ def test_simulate_race_death(
 
     assert stand["points"] == 25
     assert stand["position"] == 1
+
+
+# === Tests: plan_races() ===
+
+def test_plan_races_builds_full_calendar(race_model):
+    m = race_model
+    m.races = m.races.iloc[0:0]
+    m.circuits = pd.DataFrame({"circuit_id": [1, 2, 3]})
+    m.circuit_layouts = pd.DataFrame({
+        "layout_id": [10, 11, 20],
+        "circuit_id": [1, 1, 2],  # circuit 3 has no layout -> its races are skipped
+        "corners": [10, 12, 8],
+        "safety": [50, 60, 70],
+    })
+
+    class DummySeries:
+        series = pd.DataFrame({
+            "series_id": [1, 2, 3],
+            "name": ["F1", "F2", "Old"],
+            "reputation": [1, 2, 0],
+            "start_year": [1900, 1900, 1800],
+            "end_year": [3000, 3000, 1899],
+        })
+
+    np.random.seed(0)
+    m.plan_races(DummySeries(), pd.Timestamp("2021-01-01"), 3, 2)
+
+    races = m.races
+    assert set(races["series_id"]) <= {1, 2}
+    assert races["race_id"].tolist() == list(range(len(races)))
+    assert (races["race_date"].dt.dayofweek == 6).all()
+    assert (races["season"] == 2021).all()
+
+    # Layouts always belong to the drawn circuit and carry its safety
+    layout_circuit = races["layout_id"].map({10: 1, 11: 1, 20: 2})
+    assert (layout_circuit == races["track_id"]).all()
+    assert set(races["track_safety"]) <= {50.0, 60.0, 70.0}
+
+    # Without skipped circuits, every series gets 3 championship and 2 other races
+    complete = m.races.iloc[0:0]
+    m.circuits = pd.DataFrame({"circuit_id": [1, 2]})
+    m.races = complete
+    m.plan_races(DummySeries(), pd.Timestamp("2021-01-01"), 3, 2)
+    per_series = m.races.groupby("series_id")["championship"].agg(["sum", "count"])
+    assert per_series["sum"].tolist() == [3, 3]
+    assert per_series["count"].tolist() == [5, 5]
+    assert m.races.loc[m.races["series_id"] == 1, "reputation"].iloc[0] == 1000
+
+
+# === Tests: season finals ===
+
+def _standings_block(race_id, round_no, points):
+    return pd.DataFrame({
+        "subject_id": [10, 11],
+        "points": points,
+        "race_id": race_id,
+        "year": 2022,
+        "round": round_no,
+        "position": [1, 2] if points[0] >= points[1] else [2, 1],
+        "series_id": 1,
+        "typ": "driver",
+    })
+
+
+def test_record_standings_writes_final_after_last_championship_round(race_model):
+    m = race_model
+    m.races = pd.DataFrame({
+        "race_id": [20, 21],
+        "series_id": [1, 1],
+        "season": [2022, 2022],
+        "championship": [True, True],
+    })
+
+    m._record_standings(_standings_block(20, 1, [8, 6]))
+    assert (1, 2022) in m.open_standings
+    assert m.final_standings[m.final_standings["year"] == 2022].empty
+    # A running season still shows up with its latest round
+    assert m.get_season_finals(series_id=1, year=2022)["points"].tolist() == [8, 6]
+
+    m._record_standings(_standings_block(21, 2, [8, 12]))
+    assert (1, 2022) not in m.open_standings
+    final = m.get_season_finals(series_id=1, typ="driver", year=2022)
+    assert final.set_index("subject_id")["position"].to_dict() == {10: 2, 11: 1}
+    assert m.get_season_finals(typ="driver", subject_id=11, year=2022)["round"].tolist() == [2]
+
+
+def test_season_finals_saved_and_loaded(tmp_path, race_model):
+    m = race_model
+    m.finalize_open_seasons(2100)
+    m.save(tmp_path)
+
+    loaded = RaceModel()
+    assert loaded.load(tmp_path)
+    assert len(loaded.final_standings) == len(m.final_standings) == 4
+    assert loaded.open_standings == {}
+
+
+# === Tests: season summary ===
+
+def test_season_summary_updated_per_recorded_race(race_model):
+    m = race_model
+    m._record_results(pd.DataFrame({
+        "race_id": [5, 5, 5],
+        "driver_id": [10, 11, 12],
+        "team_id": [101, 100, 101],
+        "car_id": [2, 1, 3],
+        "position": [2, 1, 998],
+        "season": [2021, 2021, 2021],
+        "series_id": [1, 1, 1],
+        "round": [3, 3, 3],
+        "engine_id": [200, 201, 200],
+        "chassi_id": [301, 300, 301],
+        "pneu_id": [400, 401, 400],
+    }))
+
+    # Race 2 (P3) from the fixture plus race 5 (P2)
+    assert m.season_summary[("driver", 10)][(2021, 1)] == [2, 0, 2, 2]
+    # Two cars of team 101 in the same race count as one race
+    assert m.season_summary[("team", 101)][(2021, 1)] == [2, 0, 2, 2]
+
+    # Replacing the results table rebuilds the summary from scratch
+    m.results = m.results[m.results["race_id"] != 5].reset_index(drop=True)
+    assert m.get_subject_season_stands(10, "driver", pd.DataFrame())["races"].tolist() == [1, 1]
+    assert m.season_summary[("driver", 10)][(2021, 1)] == [1, 0, 1, 3]
+
+
+# === Tests: results pivot cache ===
+
+def test_pivot_results_cached_until_season_results_change(race_model):
+    m = race_model
+    manufacturers = pd.DataFrame({"manufacture_id": [200, 201], "name": ["EngA", "EngB"]})
+
+    first = m.pivot_results_by_race(1, 2020, manufacturers)
+    cached = m.result_pivots[(1, 2020)]
+    other = m.pivot_results_by_race(1, 2021, manufacturers)
+    assert m.result_pivots[(1, 2020)] is cached
+
+    # A new race in 2021 only rebuilds the 2021 pivot
+    m._record_results(pd.DataFrame({
+        "race_id": [5, 5], "driver_id": [10, 12], "team_id": [101, 102], "car_id": [2, 1],
+        "position": [999, 1], "season": [2021, 2021], "series_id": [1, 1], "round": [3, 3],
+        "engine_id": [200, 201], "chassi_id": [301, 300], "pneu_id": [400, 401],
+    }))
+    assert m.pivot_results_by_race(1, 2020, manufacturers).equals(first)
+    assert m.result_pivots[(1, 2020)] is cached
+
+    rebuilt = m.pivot_results_by_race(1, 2021, manufacturers)
+    assert len(other) == 1 and len(rebuilt) == 2
+    assert rebuilt.set_index("driver_id")["3"].to_dict() == {10: "Crash", 12: 1}
+    # Driver 12 (one win) sorts after driver 10 (no wins)
+    assert rebuilt["driver_id"].tolist() == [10, 12]
+    assert rebuilt["secondary_position"].tolist() == [1, 2]
+
+
+def test_race_rules_are_empty_for_seasons_without_rules(race_model, series_model):
+    rules, ps = race_model._race_rules(series_model, 1, 2020)
+    assert rules["ps_id"].tolist() == [1] and ps["pts"].tolist() == [25]
+
+    rules, ps = race_model._race_rules(series_model, 1, 2030)
+    assert rules.empty and ps.empty
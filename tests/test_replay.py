@@ -0,0 +1,80 @@
+import json
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+import historical_racing_manager.controller as controller_module
+from historical_racing_manager.consts import FILE_REPLAY_LOG
+from historical_racing_manager.controller import Controller, PACKAGE_DIR
+from historical_racing_manager.replay import ReplayLog, _decode
+
+
+def two_teams(controller):
+    controller.teams_model.teams = pd.DataFrame({"team_id": [1, 2], "team_name": ["A", "B"], "owner_id": [0, 0],
+                                                 "money": [100, 200]})
+    controller.teams_model.team_finances = pd.DataFrame({"team_id": [], "finance_employees": []})
+    return controller
+
+
+def new_game():
+    controller = Controller(headless=True)
+    controller.load_game("default_data", base_folder=PACKAGE_DIR)
+    return controller
+
+
+# === Tests: replay-log saves ===
+
+def test_replay_save_rebuilds_the_game(tmp_path, monkeypatch):
+    monkeypatch.setattr(controller_module, "USER_DIR", tmp_path)
+    live = new_game()
+    team = live.teams_model.get_teams().iloc[0]
+    live.update_team_owners({team["team_id"]: 1})
+    live.set_active_team(team["team_name"])
+    live.simulate_days(20)
+    live.apply_investments(live.get_year(), {int(team["team_id"]): 1})
+    live.simulate_days(20)
+    live.save_game("replayed", mode="replay")
+
+    assert [path.name for path in (tmp_path / "replayed").iterdir()] == [FILE_REPLAY_LOG]
+    assert (tmp_path / "replayed" / FILE_REPLAY_LOG).stat().st_size < 10_000
+
+    loaded = Controller(headless=True)
+    assert loaded.load_game("replayed", base_folder=tmp_path)
+    assert loaded.current_date == live.current_date
+    assert loaded.teams_model.teams.equals(live.teams_model.teams)
+    assert loaded.drivers_model.drivers.equals(live.drivers_model.drivers)
+    assert loaded.replay_log.actions == live.replay_log.actions
+
+
+def test_loading_does_not_carry_over_the_previous_game():
+    def play(controller):
+        controller.load_game("default_data", base_folder=PACKAGE_DIR)
+        controller.random_streams.reseed(5)
+        controller.current_date = controller.sim_day(controller.current_date, 2)
+        return controller.drivers_model.drivers
+
+    reused = Controller(headless=True)
+    play(reused)
+    assert play(reused).equals(play(Controller(headless=True)))
+
+
+def test_logged_arguments_survive_the_save(tmp_path, monkeypatch):
+    controller = two_teams(Controller(headless=True))
+    controller.replay_log = ReplayLog(tmp_path, {"seed": 1})
+    controller.update_team_owners({np.int64(2): np.int64(1)})
+    controller.replay_log.save(tmp_path, controller.current_date)
+
+    log, date = ReplayLog.load(tmp_path, PACKAGE_DIR)
+    assert date == controller.current_date
+    assert _decode(log.actions[0]["args"]) == [{2: 1}]
+
+    # Unknown actions are skipped; known ones are repeated on their date
+    monkeypatch.setattr(Controller, "sim_day", lambda self, date, days: date + timedelta(days=days))
+    log.actions.insert(0, dict(log.actions[0], action="load_game"))
+    log.actions[1]["date"] = "1900-02-01"
+    replayed = two_teams(Controller(headless=True))
+    log.replay(replayed, datetime(1900, 3, 1))
+    assert replayed.teams_model.teams["owner_id"].tolist() == [0, 1]
+    assert replayed.current_date == datetime(1900, 3, 1)
+    assert json.loads((tmp_path / FILE_REPLAY_LOG).read_text())["base"] == {"folder": "."}
@@ -0,0 +1,120 @@
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager.consts import RESULT_COLUMNS
+from historical_racing_manager.race import RaceModel
+from historical_racing_manager.retention import apply_retention, describe_report
+from historical_racing_manager.teams import TeamsModel
+
+
+def results(race_id, season, drivers, positions):
+    return pd.DataFrame({
+        "race_id": race_id,
+        "series_id": 1,
+        "season": season,
+        "round": 1,
+        "driver_id": drivers,
+        "team_id": 100,
+        "engine_id": 200,
+        "chassi_id": 300,
+        "pneu_id": 400,
+        "position": positions,
+    })
+
+
+def saveable(model):
+    # Static tables a saved game always has
+    model.point_system = pd.DataFrame({"ps_id": [0], "1": [8]})
+    model.circuits = pd.DataFrame({"circuit_id": [0]})
+    model.circuit_layouts = pd.DataFrame({"layout_id": [0], "circuit_id": [0]})
+    if model.results.empty:
+        model.results = pd.DataFrame(columns=RESULT_COLUMNS)
+    if model.races.empty:
+        model.races = pd.DataFrame({"race_id": [1], "series_id": 1, "season": 1900, "championship": False})
+    return model
+
+
+def race_model_with_results():
+    model = RaceModel()
+    model._record_results(results(1, 1900, [10, 11], [1, 2]))
+    model._record_results(results(2, 1900, [10, 11], [3, 1]))
+    model._record_results(results(3, 1901, [11, 12], [1, 2]))
+    return model
+
+
+# === Tests: RaceModel retention ===
+
+def test_collapsed_results_keep_season_stats_after_reload(tmp_path):
+    model = race_model_with_results()
+    series = pd.DataFrame({"series_id": [1], "name": ["F1"]})
+    stats = model.get_subject_season_stands(10, "driver", series)
+
+    assert model.collapse_results(1901) == 4
+
+    assert model.results["season"].tolist() == [1901, 1901]
+    assert model.get_seasons_for_series(1) == [1901]
+    assert model.get_subject_season_stands(10, "driver", series).equals(stats)
+    assert 10 in model.get_participants().ids("driver_id")
+
+    saveable(model).save(tmp_path)
+    reloaded = RaceModel()
+    assert reloaded.load(tmp_path)
+    assert reloaded.get_subject_season_stands(10, "driver", series).equals(stats)
+    assert list(reloaded.get_participants().parts()) == list(model.get_participants().parts())
+
+
+def test_pruned_standings_keep_their_finals(tmp_path):
+    model = RaceModel()
+    model.races = pd.DataFrame({"race_id": [1, 2], "series_id": 1, "season": [1900, 1901], "championship": True})
+    for race_id, year in ((1, 1900), (2, 1901)):
+        model._record_round_points(1, year, race_id, {"driver": (np.array([10, 11]), np.array([8, 6]))})
+    finals = model.get_season_finals()
+
+    assert model.prune_standings(1901) == 2
+    assert model.standings_ledger.keys() == [(1, 1901)]
+    assert model.get_season_finals().equals(finals)
+
+    saveable(model).save(tmp_path)
+    reloaded = RaceModel()
+    assert reloaded.load(tmp_path)
+    pd.testing.assert_frame_equal(reloaded.get_season_finals(), finals, check_dtype=False)
+
+
+def test_retention_reaches_archived_seasons(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    model = race_model_with_results()
+    model.races = pd.DataFrame({"race_id": [1, 3], "series_id": 1, "season": [1900, 1901], "championship": True})
+    for race_id, year in ((1, 1900), (3, 1901)):
+        model._record_round_points(1, year, race_id, {"driver": (np.array([10, 11]), np.array([8, 6]))})
+    series = pd.DataFrame({"series_id": [1], "name": ["F1"]})
+    stats = model.get_subject_season_stands(10, "driver", series)
+    finals = model.get_season_finals()
+    model.archive_seasons(1902)
+
+    assert model.collapse_results(1901) == 4
+    assert model.prune_standings(1901) == 2
+    assert model.archive.rows == {"results": 2, "standings": 2}
+    assert model.archive.decades("results") == [1900]
+    assert model.get_seasons_for_series(1) == [1901]
+    assert model.get_subject_season_stands(10, "driver", series).equals(stats)
+    assert model.get_season_finals().equals(finals)
+
+
+def test_apply_retention_reports_rows_and_memory():
+    race_model = race_model_with_results()
+    teams_model = TeamsModel()
+    teams_model.team_finances = pd.DataFrame({"team_id": [1, 1, 1], "season": [1899, 1900, 1901],
+                                              "finance_employees": 5, "income": 1000})
+    models = {"race_model": race_model, "teams_model": teams_model}
+
+    report = apply_retention(models, 1902, {"results": 1, "team_finances": 2, "standings": None})
+
+    assert set(report) == {"results", "team_finances"}
+    assert report["results"][0] == 4
+    assert report["team_finances"][0] == 1
+    assert teams_model.team_finances["season"].tolist() == [1900, 1901]
+    assert teams_model.team_finances.index.tolist() == [0, 1]
+    assert report["team_finances"][1] > 0
+    assert describe_report(1902, {"results": (4, 2048)}) == "[Retention] 1902: results -4 rows; 2 KB reclaimed"
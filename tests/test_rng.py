@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+from historical_racing_manager.consts import FILE_RNG_STATE
+from historical_racing_manager.contracts import ContractsModel
+from historical_racing_manager.race import RaceModel
+from historical_racing_manager.rng import RandomStreams
+
+
+def draws(streams, n=5):
+    return {name: gen.integers(0, 1_000_000, n).tolist() for name, gen in streams.generators.items()}
+
+
+# === Tests: RandomStreams ===
+
+def test_streams_are_seeded_and_independent():
+    first, again = draws(RandomStreams(42)), draws(RandomStreams(42))
+
+    assert first == again
+    assert len({tuple(values) for values in first.values()}) == len(first)
+    assert draws(RandomStreams(43)) != first
+    children = RandomStreams(42).spawn(2)
+    assert draws(children[0]) != draws(children[1])
+    assert draws(RandomStreams(42).spawn(2)[1]) == draws(RandomStreams(42).spawn(2)[1])
+
+
+def test_bind_and_reseed_keep_the_models_streams():
+    streams = RandomStreams(1)
+    owner = SimpleNamespace(race_model=RaceModel(), contracts_model=ContractsModel())
+    streams.bind(owner)
+    assert owner.race_model.rng is streams["race"]
+    assert owner.contracts_model.rng is streams["contracts"]
+
+    expected = RandomStreams(7)["race"].random(3).tolist()
+    owner.race_model.rng.random(10)
+    streams.reseed(7)
+    assert owner.race_model.rng is streams["race"]
+    assert owner.race_model.rng.random(3).tolist() == expected
+
+
+def test_saved_streams_continue_where_they_stopped(tmp_path):
+    streams = RandomStreams()
+    streams["parts"].random(4)
+    streams.save(tmp_path)
+    expected = draws(streams)
+
+    loaded = RandomStreams(0)
+    model = RaceModel()
+    loaded.bind(SimpleNamespace(race_model=model))
+    assert loaded.load(tmp_path)
+    assert loaded.seed == streams.seed
+    assert model.rng is loaded["race"]
+    assert draws(loaded) == expected
+
+    (tmp_path / FILE_RNG_STATE).unlink()
+    assert not RandomStreams().load(tmp_path)
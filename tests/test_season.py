@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from historical_racing_manager.consts import CRASH_CODE
+from historical_racing_manager.season import simulate_season_batch
+
+
+# === Fixtures ===
+@pytest.fixture
+def grid():
+    return {
+        "driver_id": np.array([10, 11, 12]),
+        "team_id": np.array([100, 100, 101]),
+        "car_id": np.array([0, 1, 2]),
+        "ability": np.array([90, 80, 70]),
+        "power": np.array([5, 5, 0]),  # car 2 has no speed -> always crashes
+        "reliability": np.array([0, 0, 0]),
+        "safety": np.array([0, 0, 0]),
+        "engine_id": np.array([200, 200, 201]),
+        "chassi_id": np.array([300, 300, 300]),
+        "pneu_id": np.array([400, 400, 400]),
+    }
+
+
+@pytest.fixture
+def rounds():
+    return pd.DataFrame({
+        "race_id": [1, 2, 3],
+        "series_id": [1, 1, 1],
+        "season": [2020, 2020, 2020],
+        "track_safety": [1, 1, 1],
+        "wet": [1, 1, 1],
+        "championship": [True, False, True],
+        "reputation": [0, 0, 0],
+    })
+
+
+class NoRandomness:
+    # Outcomes never fail and the ranking always picks the first car left in the pool
+    def integers(self, low, high):
+        return np.zeros(np.shape(high), dtype=int)
+
+    def random(self, size):
+        return np.zeros(size)
+
+
+@pytest.fixture
+def no_randomness():
+    return NoRandomness()
+
+
+def run(grid, rounds, last_blocks=None, base_round=0, rng=None):
+    cts = {"driver": 1, "team": 1, "engine": 2, "chassi": 2, "pneu": 2}
+    return simulate_season_batch(grid, rounds, np.array([10, 10, 10]), cts, np.array([8, 6, 4]),
+                                 last_blocks or {}, base_round, ("sig",), rng=rng)
+
+
+# === Tests: simulate_season_batch() ===
+
+def test_batch_results_and_rounds(grid, rounds, no_randomness):
+    batch = run(grid, rounds, rng=no_randomness)
+
+    assert batch.race_ids == [1, 2, 3]
+    first = batch.results[0]
+    assert first["driver_id"].tolist() == [10, 11, 12]
+    assert first["position"].tolist() == [1, 2, CRASH_CODE]
+    # Championship rounds are numbered, the non-championship race gets round 0
+    assert [int(r["round"].iloc[0]) for r in batch.results] == [1, 0, 2]
+    assert batch.rep_drivers[0] == [10, 11]
+    assert batch.crashes == [1, 1, 1]
+    assert batch.died == [[], [], []]
+
+
+def test_batch_standings_accumulate_championship_rounds(grid, rounds, no_randomness):
+    batch = run(grid, rounds, rng=no_randomness)
+
+    assert batch.standings[1] is None
+    final = batch.standings[2]
+    drivers = final[final["typ"] == "driver"].set_index("subject_id")
+    assert drivers["points"].to_dict() == {10: 16, 11: 12, 12: 0}
+    assert drivers["round"].unique().tolist() == [2]
+
+    # Only one car per team counts
+    teams = final[final["typ"] == "team"].set_index("subject_id")
+    assert teams["points"].to_dict() == {100: 16, 101: 0}
+
+    # Two cars per engine count
+    engines = final[final["typ"] == "engine"].set_index("subject_id")
+    assert engines["points"].to_dict() == {200: 28, 201: 0}
+
+
+def test_batch_standings_continue_previous_round(grid, rounds, no_randomness):
+    last_blocks = {
+        "driver": (3, pd.DataFrame({
+            "subject_id": [12, 99], "points": [20, 5], "year": [2020, 2020],
+            "position": [1, 2], "series_id": [1, 1],
+        })),
+    }
+    batch = run(grid, rounds, last_blocks=last_blocks, base_round=3, rng=no_randomness)
+
+    drivers = batch.standings[0][batch.standings[0]["typ"] == "driver"]
+    assert drivers["subject_id"].tolist() == [12, 10, 11, 99]
+    assert drivers["points"].tolist() == [20, 8, 6, 5]
+    assert drivers["position"].tolist() == [1, 2, 3, 4]
+    assert (drivers["round"] == 4).all()
+    assert int(batch.results[0]["round"].iloc[0]) == 4
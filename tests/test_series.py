@@ -117,6 +117,21 @@ def test_get_series_id(model):
     assert model.get_series_id("Unknown") is None
 
 
+def test_get_series_id_after_series_replaced(model):
+    assert model.get_series_id("F2") == 2
+    assert model.get_registry() is model.get_registry()
+
+    model.series = pd.DataFrame({
+        COL_SERIES_ID: [7],
+        COL_SERIES_NAME: ["GT"],
+        COL_SERIES_START: [1950],
+        COL_SERIES_END: [2100],
+    })
+    assert model.get_series_id("F2") is None
+    assert model.get_series_id("GT") == 7
+    assert model.get_series_by_id(["7", 7.0]) == ["GT", "GT"]
+
+
 # === Tests: _active_series_mask() ===
 
 def test_active_series_mask(model):
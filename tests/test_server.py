@@ -0,0 +1,125 @@
+import json
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from historical_racing_manager.controller import Controller
+from historical_racing_manager.feed import RaceFinished
+from historical_racing_manager.server import GameServer, to_json
+
+
+@pytest.fixture
+def server(monkeypatch, small_game):
+    monkeypatch.setattr(Controller, "sim_day", lambda self, date, days: date + timedelta(days=days))
+    game = GameServer(small_game(rounds=[(1, 1900, (6, 8))], named=True), port=0)
+    game.start()
+    yield game
+    game.close()
+
+
+def request(server, path, data=None):
+    host, port = server.address
+    body = json.dumps(data).encode() if data is not None else None
+    try:
+        with urllib.request.urlopen(urllib.request.Request(f"http://{host}:{port}{path}", data=body)) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+# === Tests: GameServer ===
+
+def test_reads_come_from_the_snapshot_published_after_each_command(server):
+    status, standings = request(server, "/api/standings?series=A&season=1900")
+    assert status == 200
+    assert [(row["position"], row["subject"], row["points"]) for row in standings] == [(1, "Bo Y", 8), (2, "Ann X", 6)]
+
+    server.controller.teams_model.teams.loc[0, "team_name"] = "Renamed"
+    assert request(server, "/api/teams")[1][0]["team_name"] == "A"
+
+    assert request(server, "/api/advance", {"days": 3}) == (200, {"date": "1900-06-04 Monday"})
+    assert request(server, "/api/state")[1]["date"] == "1900-06-04 Monday"
+    assert request(server, "/api/teams")[1][0]["team_name"] == "Renamed"
+
+
+def test_finished_races_are_kept_for_clients_to_catch_up(server):
+    for race_id in (7, 8):
+        server._on_race(RaceFinished(datetime(1900, 6, 3), race_id, 1, 1900, 0, [10, 11], [], [], {}))
+
+    status, races = request(server, "/api/races?after=1")
+    assert status == 200
+    assert [(race["seq"], race["race_id"], race["order"]) for race in races] == [(2, 8, [10, 11])]
+    assert len(request(server, "/api/races")[1]) == 2
+
+
+def test_readers_do_not_wait_for_the_simulation(server, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_day(self, date, days):
+        started.set()
+        release.wait(5)
+        return date + timedelta(days=days)
+
+    monkeypatch.setattr(Controller, "sim_day", slow_day)
+    command = threading.Thread(target=request, args=(server, "/api/advance", {"days": 1}))
+    command.start()
+    assert started.wait(5)
+
+    reads = [request(server, "/api/state")[1]["date"] for _ in range(5)]
+    release.set()
+    command.join(5)
+    assert reads == ["1900-06-01 Friday"] * 5
+    assert request(server, "/api/state")[1]["date"] == "1900-06-02 Saturday"
+
+
+def test_snapshots_share_the_archive_until_seasons_are_archived(tmp_path, monkeypatch, small_game):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    controller = small_game(rounds=[(1, 1899, (6, 8)), (2, 1900, (6, 8))], named=True)
+    game = GameServer(controller, port=0)
+    first = controller.published
+    assert first.enter()  # a reader still working on the first snapshot
+    game.publish()
+    assert controller.published is first  # nothing changed, nothing exported
+
+    controller.race_model.archive_seasons(1900)
+    game.publish()
+    archive = controller.published.primary.race_model.archive
+    assert archive.rows == {"standings": 2}
+    assert first.controller().race_model.archive is None and not first.closed
+
+    # The old snapshot is closed as its last reader leaves
+    first.leave()
+    assert first.closed
+    game.close()
+    controller.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_readers_run_at_once(server):
+    inside = threading.Barrier(2, timeout=5)
+    reads = []
+    readers = [threading.Thread(target=lambda: reads.append(server.read(lambda c: inside.wait() >= 0)))
+               for _ in range(2)]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join(5)
+    assert reads == [True, True]
+
+
+def test_bad_requests_and_json_forms(server):
+    assert request(server, "/api/nope")[0] == 404
+    assert request(server, "/api/standings")[0] == 400
+    assert request(server, "/api/advance", {"days": -1})[0] == 400
+    for name in ("../elsewhere", "", "..", ".hidden"):
+        assert request(server, "/api/save", {"name": name})[0] == 400
+
+    frame = pd.DataFrame({"date": [pd.Timestamp(1950, 5, 13)], "points": [np.int64(9)]})
+    assert to_json({1: frame, "n": np.int64(2), "when": datetime(1950, 1, 1)}) == {
+        "1": [{"date": "1950-05-13T00:00:00.000", "points": 9}], "n": 2, "when": "1950-01-01T00:00:00"}
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager import sharedmem
+from historical_racing_manager.sharedmem import SharedSnapshot, attach
+
+
+def world():
+    results = pd.DataFrame({"race_id": np.arange(500), "position": np.arange(500) % 20 + 1,
+                            "finished": ["Finished"] * 500})
+    return {"results": results, "points": np.linspace(0, 1, 300), "tiny": np.arange(3), "year": 1950}
+
+
+# === Tests: SharedSnapshot ===
+
+def test_attach_rebuilds_the_exported_state():
+    state = world()
+    with SharedSnapshot.export(state) as shared:
+        copy = attach(shared.manifest)
+
+        assert set(shared.manifest) == {"name", "size", "state", "arrays"}
+        assert shared.manifest["arrays"] >= 2  # results' int block and points; tiny stays pickled
+        assert copy["results"].equals(state["results"])
+        assert np.array_equal(copy["points"], state["points"])
+        assert copy["tiny"].tolist() == [0, 1, 2] and copy["year"] == 1950
+
+
+def test_attached_copies_write_privately():
+    state = world()
+    with SharedSnapshot.export(state) as shared:
+        first = attach(shared.manifest)
+        first["results"].loc[0, "position"] = 99
+        first["points"][:] = -1
+
+        second = attach(shared.manifest)
+        assert second["results"].equals(state["results"])
+        assert np.array_equal(second["points"], state["points"])
+    assert first["results"].loc[0, "position"] == 99
+    assert state["results"].loc[0, "position"] == 1
+
+
+def test_attach_copies_the_block_where_it_cannot_be_mapped(monkeypatch, tmp_path):
+    monkeypatch.setattr(sharedmem, "SHM_DIR", tmp_path / "missing")
+    state = world()
+    with SharedSnapshot.export(state) as shared:
+        copy = attach(shared.manifest)
+        copy["points"][:] = -1
+
+        assert attach(shared.manifest)["results"].equals(state["results"])
+        assert np.array_equal(attach(shared.manifest)["points"], state["points"])
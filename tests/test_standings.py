@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from historical_racing_manager.race import RaceModel
+from historical_racing_manager.standings import StandingsLedger
+
+
+def driver_points(ids, pts):
+    return {"driver": (np.array(ids), np.array(pts))}
+
+
+# === Tests: StandingsLedger ===
+
+def test_ledger_stores_only_changed_points():
+    ledger = StandingsLedger()
+    first = ledger.add_round(1, 1950, 1, 10, driver_points([1, 2, 3], [10, 6, 0]))
+    second = ledger.add_round(1, 1950, 2, 11, driver_points([1, 2, 3], [0, 10, 0]))
+
+    # Every subject appears once; afterwards only rounds that change points are stored
+    assert first["subject_id"].tolist() == [1, 2, 3]
+    assert second["subject_id"].tolist() == [2]
+    assert len(ledger) == 4
+    assert ledger.last_round(1, 1950) == 2
+    season = ledger.seasons[(1, 1950)]
+    assert season.totals(np.zeros(4, dtype="int64"), np.array([3, 2, 1, 9])).tolist() == [0, 16, 10, 0]
+
+
+def test_ledger_rebuilds_the_block_after_any_round():
+    ledger = StandingsLedger()
+    ledger.add_round(1, 1950, 1, 10, driver_points([1, 2, 3], [10, 6, 0]))
+    ledger.add_round(1, 1950, 2, 11, driver_points([1, 2, 3], [0, 10, 6]))
+
+    after_one = ledger.block(1, 1950, round_no=1)
+    latest = ledger.block(1, 1950)
+
+    assert after_one[["subject_id", "points", "position"]].values.tolist() == [[1, 10, 1], [2, 6, 2], [3, 0, 3]]
+    assert latest[["subject_id", "points", "position"]].values.tolist() == [[2, 16, 1], [1, 10, 2], [3, 6, 3]]
+    assert latest["race_id"].unique().tolist() == [11]
+
+
+def test_legacy_blocks_load_and_round_trip_through_deltas():
+    m = RaceModel()
+    m.standings = pd.DataFrame({
+        "race_id": [1, 1, 1, 2, 2, 2],
+        "subject_id": [1, 2, 100, 2, 1, 100],
+        "year": 1950,
+        "round": [1, 1, 1, 2, 2, 2],
+        "points": [8, 6, 14, 14, 8, 22],
+        "position": [1, 2, 1, 1, 2, 1],
+        "series_id": 1,
+        "typ": ["driver", "driver", "team", "driver", "driver", "team"],
+    })
+    blocks = m.standings
+
+    assert len(m.standing_deltas) == 5
+    assert blocks[blocks["round"] == 2][["subject_id", "points"]].values.tolist() == [[2, 14], [1, 8], [100, 22]]
+
+    reloaded = RaceModel()
+    reloaded.standing_deltas = m.standing_deltas
+    pd.testing.assert_frame_equal(reloaded.standings, blocks)
+    assert reloaded.get_standings(1951).empty
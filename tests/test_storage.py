@@ -0,0 +1,81 @@
+import pandas as pd
+
+from historical_racing_manager.race import RaceModel
+from historical_racing_manager.storage import HistoryStore
+
+
+def results(race_id, season, drivers, positions):
+    return pd.DataFrame({
+        "race_id": race_id,
+        "series_id": 1,
+        "season": season,
+        "round": 1,
+        "driver_id": drivers,
+        "team_id": 100,
+        "engine_id": 200,
+        "chassi_id": 300,
+        "pneu_id": 400,
+        "position": positions,
+    })
+
+
+# === Tests: HistoryStore ===
+
+def test_append_creates_indexes_and_commit_is_the_save(tmp_path):
+    path = tmp_path / "history.sqlite"
+    store = HistoryStore(path)
+    store.append("results", results(1, 1900, [10, 11], [1, 2]))
+    indexes = set(store.query("SELECT name FROM sqlite_master WHERE type = 'index'")["name"])
+    assert {"ix_results_series_id_season", "ix_results_driver_id", "ix_results_team_id"} <= indexes
+    store.commit()
+    store.append("results", results(2, 1900, [10, 11], [2, 1]))
+    store.close()  # second race was never committed
+
+    reopened = HistoryStore(path)
+    assert reopened.counts["results"] == 2
+    assert reopened.read("results")["race_id"].tolist() == [1, 1]
+    reopened.close()
+
+
+def test_replace_handles_missing_values_and_dates(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite")
+    races = pd.DataFrame({"race_id": [1, 2], "race_date": pd.to_datetime(["1900-05-06", None]),
+                          "championship": [True, False], "rain": [0.5, float("nan")]})
+    store.replace("races", races)
+    store.replace("races", races.iloc[:1])
+
+    out = store.read("races")
+    assert out["race_date"].tolist() == ["1900-05-06"]
+    assert store.counts["races"] == 1
+    store.close()
+
+
+def test_positions_compare_as_numbers_in_a_store_created_empty(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite")
+    store.append("results", results(1, 1900, [], []).astype(object))
+    store.append("results", results(1, 1900, [10, 11, 12], [10, 2, 3]))
+    store.append("results", results(2, 1900, [10, 11, 12], [3, 10, 1]))
+
+    assert store.subject_seasons("driver", 10) == {(1900, 1): [2, 0, 1, 3]}
+    assert store.subject_seasons("driver", 11) == {(1900, 1): [2, 0, 1, 2]}
+    store.close()
+
+
+# === Tests: RaceModel with a store ===
+
+def test_race_model_pushes_queries_down_when_store_holds_results(tmp_path):
+    model = RaceModel()
+    model.store = HistoryStore(tmp_path / "history.sqlite")
+    model._record_results(results(1, 1900, [10, 11, 12], [1, 2, 3]))
+    model._record_results(results(2, 1900, [10, 11, 12], [3, 1, 999]))
+    model._record_results(results(3, 1901, [11], [1]))
+    assert model._stored("results", model.results)
+
+    series = pd.DataFrame({"series_id": [1], "name": ["F1"]})
+    stored = model.get_subject_season_stands(11, "driver", series)
+    assert model.get_seasons_for_series(1) == [1900, 1901]
+    assert model.get_results_for_series_and_season(1, 1900)["position"].tolist() == [1, 2, 3, 3, 1, 999]
+
+    store, model.store = model.store, None
+    assert stored.equals(model.get_subject_season_stands(11, "driver", series))
+    store.close()
@@ -0,0 +1,81 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+import historical_racing_manager.table as table_module
+from historical_racing_manager.table import VirtualTable, format_table
+
+
+class FakeWidget:
+    """Stands in for the ttk widgets, so VirtualTable runs without a display."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class FakeTree(FakeWidget):
+    ids = itertools.count()
+
+    def __init__(self, *args, **kwargs):
+        self.items: dict[str, tuple] = {}
+        self.created = 0
+
+    def __setitem__(self, key, value):
+        pass
+
+    def insert(self, parent, index):
+        iid = f"I{next(self.ids)}"
+        self.items[iid] = ()
+        self.created += 1
+        return iid
+
+    def delete(self, iid):
+        del self.items[iid]
+
+    def item(self, iid, values):
+        self.items[iid] = values
+
+
+class FakeTtk:
+    Frame = Scrollbar = FakeWidget
+    Treeview = FakeTree
+
+
+def test_format_table_blanks_missing_values_and_labels_columns():
+    df = pd.DataFrame({"driver_id": [1, 2], "points": [10.0, np.nan], "team": ["A", None]})
+    cols, labels, rows = format_table(df)
+
+    assert cols == ["driver_id", "points", "team"]
+    assert len(labels) == len(set(labels)) == 3
+    assert rows == [(1, 10.0, "A"), (2, "", "")]
+
+
+def test_format_table_makes_duplicate_labels_unique():
+    df = pd.DataFrame([[1, 2]], columns=["some_col", "Some Col"])
+    _, labels, _ = format_table(df)
+    assert labels == ["Some Col", "Some Col 2"]
+
+
+def test_format_table_empty_frame_shows_placeholder():
+    assert format_table(pd.DataFrame()) == (["info"], ["Info"], [("No data",)])
+    assert format_table(None) == (["info"], ["Info"], [("No data",)])
+
+
+def test_virtual_table_holds_only_the_visible_rows_and_recycles_them(monkeypatch):
+    monkeypatch.setattr(table_module, "ttk", FakeTtk)
+    table = VirtualTable(None, height=3)
+    table.set_data(pd.DataFrame({"n": range(10)}))
+    tree = table.tree
+    assert list(tree.items.values()) == [(0,), (1,), (2,)]
+
+    items = list(tree.items)
+    table.scroll_to(8)  # clipped to the last full window
+    assert table.first == 7
+    assert list(tree.items) == items and list(tree.items.values()) == [(7,), (8,), (9,)]
+
+    table.set_data(pd.DataFrame({"n": [5]}))
+    assert list(tree.items.values()) == [(5,)] and tree.created == 3
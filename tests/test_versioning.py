@@ -0,0 +1,60 @@
+import pandas as pd
+
+from historical_racing_manager.teams import TeamsModel
+from historical_racing_manager.versioning import ViewCache, mutates
+
+
+# === Tests: mutates ===
+
+def test_mutating_method_bumps_version_even_on_error():
+    class Model:
+        def __init__(self):
+            self.version = 0
+
+        @mutates
+        def fail(self):
+            raise ValueError("boom")
+
+    m = Model()
+    try:
+        m.fail()
+    except ValueError:
+        pass
+    assert m.version == 1
+
+
+def test_model_mutation_bumps_version():
+    m = TeamsModel()
+    m.teams = pd.DataFrame({"team_id": [1], "money": [100]})
+    before = m.version
+    m.deduct_money(1, 40)
+    assert m.version > before
+    assert int(m.teams["money"].iloc[0]) == 60
+
+
+# === Tests: ViewCache ===
+
+def test_view_cache_reuses_until_token_changes():
+    cache = ViewCache(maxsize=4)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get("a", (1,), compute) == 1
+    assert cache.get("a", (1,), compute) == 1
+    assert cache.get("a", (2,), compute) == 2
+    assert len(calls) == 2
+
+
+def test_view_cache_evicts_least_recently_used():
+    cache = ViewCache(maxsize=2)
+    cache.get("a", (), lambda: "a")
+    cache.get("b", (), lambda: "b")
+    cache.get("a", (), lambda: "a2")  # refreshes "a"
+    cache.get("c", (), lambda: "c")
+
+    assert len(cache) == 2
+    assert cache.get("b", (), lambda: "b2") == "b2"
+    assert cache.get("c", (), lambda: "c2") == "c"
@@ -0,0 +1,215 @@
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+
+from historical_racing_manager.versioning import ViewCache
+from historical_racing_manager.worker import SimulationWorker, Prefetcher, neighbours
+
+
+class DummyController:
+    def __init__(self, day_delay=0.0):
+        self.current_date = datetime(1900, 12, 30)
+        self.sim_lock = threading.RLock()
+        self.day_delay = day_delay
+
+    def advance_target(self, mode, amount=1):
+        if mode == "days":
+            return self.current_date + timedelta(days=amount)
+        if mode == "seasons":
+            return datetime(self.current_date.year + amount, 1, 1)
+        raise ValueError(f"Unknown simulation mode: {mode}")
+
+    def advance_day(self):
+        time.sleep(self.day_delay)
+        with self.sim_lock:
+            self.current_date += timedelta(days=1)
+            return self.current_date
+
+
+def wait_for(worker, kinds=("done", "cancelled", "error"), timeout=5.0):
+    events, end = [], time.time() + timeout
+    while time.time() < end:
+        events += worker.poll()
+        if events and events[-1].kind in kinds:
+            return events
+        time.sleep(0.01)
+    raise AssertionError(f"worker did not finish: {events}")
+
+
+# === Tests: SimulationWorker ===
+
+def test_worker_reports_progress_and_done():
+    controller = DummyController()
+    worker = SimulationWorker(controller)
+    worker.submit("days", 3)
+    events = wait_for(worker)
+
+    assert [e.kind for e in events] == ["progress", "progress", "progress", "done"]
+    assert [e.done for e in events[:3]] == [1, 2, 3]
+    assert events[-1].date == datetime(1901, 1, 2)
+    worker.stop()
+
+
+def test_worker_cancel_stops_after_current_day():
+    controller = DummyController(day_delay=0.02)
+    worker = SimulationWorker(controller)
+    worker.submit("seasons", 3)
+    worker.submit("days", 5)
+    time.sleep(0.1)
+    worker.cancel()
+    events = wait_for(worker)
+
+    assert events[-1].kind == "cancelled"
+    assert controller.current_date < datetime(1903, 1, 1)
+    # The queued command was dropped as well
+    time.sleep(0.1)
+    assert worker.poll() == []
+    assert not worker.busy
+    worker.stop()
+
+
+def test_worker_stays_busy_and_cancellable_while_taking_a_command():
+    class SlowHandOff(queue.Queue):
+        def get(self, *args, **kwargs):
+            command = super().get(*args, **kwargs)
+            time.sleep(0.1)
+            return command
+
+    controller = DummyController()
+    worker = SimulationWorker(controller)
+    worker.commands = SlowHandOff()
+    worker.submit("days", 3)
+    time.sleep(0.05)  # taken off the queue, not started yet
+
+    assert worker.busy
+    worker.cancel()
+    events = wait_for(worker)
+    assert [e.kind for e in events] == ["cancelled"]
+    assert controller.current_date == datetime(1900, 12, 30)
+    worker.stop()
+
+
+def test_worker_reports_errors():
+    worker = SimulationWorker(DummyController())
+    worker.submit("weeks", 1)
+    events = wait_for(worker)
+
+    assert events[-1].kind == "error"
+    assert "Unknown simulation mode" in events[-1].message
+    worker.stop()
+
+
+# === Tests: Prefetcher ===
+
+class ViewSnapshot:
+    def __init__(self, game):
+        self.game = game
+        self.key = game.snapshot_key()
+        self.view_cache = ViewCache(16)
+        self.readers = 0
+
+    def enter(self):
+        self.readers += 1
+        return True
+
+    def leave(self):
+        self.readers -= 1
+
+    def controller(self):
+        return self
+
+    def get_results(self, series, season):
+        self.game.calls.append((series, season))
+        self.game.computing(self.game)
+        self.view_cache.get(("results", series, season), self.key, lambda: f"{series} {season}")
+
+
+class ViewController(DummyController):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+        self.snapshots = 0
+        self.version = 0
+        self.view_cache = ViewCache(16)
+        self.computing = lambda controller: None
+        self.published = None
+
+    def snapshot_key(self):
+        return (self.version,)
+
+    def publish_snapshot(self):
+        if self.published is None or self.published.key != self.snapshot_key():
+            self.snapshots += 1
+            self.published = ViewSnapshot(self)
+        return self.published
+
+
+def test_neighbours_nearest_first():
+    assert neighbours(["1950", "1951", "1952", "1953"], "1951", 2) == ["1950", "1952", "1953"]
+    assert neighbours(["a", "b"], "x", 2) == []
+
+
+def test_prefetcher_runs_jobs_in_order():
+    controller = ViewController()
+    prefetcher = Prefetcher(controller)
+    prefetcher.submit([("get_results", ("F1", "1951")), ("get_results", ("F1", "1949"))])
+
+    assert prefetcher.wait(timeout=5.0)
+    assert controller.calls == [("F1", "1951"), ("F1", "1949")]
+    assert prefetcher.computed == 2 and controller.snapshots == 1 and controller.published.readers == 0
+    assert controller.view_cache.get(("results", "F1", "1949"), (0,), lambda: None) == "F1 1949"
+    prefetcher.stop()
+
+
+def test_prefetch_computes_on_a_snapshot_without_the_lock():
+    controller = ViewController()
+    held = []
+
+    def simulate_meanwhile(controller):
+        # A simulation day runs while the view is computed and changes the models
+        held.append(controller.sim_lock.acquire(blocking=False))
+        controller.version += 1
+        controller.sim_lock.release()
+
+    controller.computing = simulate_meanwhile
+    prefetcher = Prefetcher(controller)
+    prefetcher.submit([("get_results", ("F1", "1951"))])
+
+    assert prefetcher.wait(timeout=5.0)
+    assert held == [True]
+    # The view is of a state the game has moved past, so it is dropped
+    assert prefetcher.computed == 0 and len(controller.view_cache) == 0
+    prefetcher.stop()
+
+
+def test_simulation_submit_cancels_prefetch():
+    controller = ViewController()
+    prefetcher = Prefetcher(controller)
+    worker = SimulationWorker(controller, prefetcher=prefetcher)
+
+    # Hold the lock like a running simulation day: pending jobs must not run
+    with controller.sim_lock:
+        prefetcher.submit([("get_results", ("F1", str(year))) for year in range(1950, 1960)])
+        worker.submit("days", 1)
+        assert prefetcher.wait(timeout=5.0)
+    wait_for(worker)
+
+    assert controller.calls == []
+    worker.stop()
+    prefetcher.stop()
+
+
+def test_prefetch_reuses_the_published_snapshot(small_game):
+    controller = small_game(rounds=[(1, 1900, (6, 8))], named=True)
+    published = controller.publish_snapshot()  # e.g. by the API server
+    prefetcher = Prefetcher(controller)
+    prefetcher.submit([("get_standings", ("A", "1900"))])
+
+    assert prefetcher.wait(timeout=5.0)
+    assert prefetcher.computed == 1 and controller.published is published
+    # The game's own call is served by the view computed on the snapshot
+    prefetched = controller.view_cache._entries[("standings", "A", "1900")][1]
+    assert controller.get_standings("A", "1900") is prefetched
+    prefetcher.stop()
+    controller.close()